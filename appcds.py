@@ -0,0 +1,144 @@
+"""
+Archives AppCDS (Class Data Sharing) pour l'instance Forge d'Illama Launcher
+Une archive dynamique par (JVM, version Forge, empreinte du dossier mods)
+"""
+
+import os
+import hashlib
+from pathlib import Path
+from typing import Optional
+
+from java_registry import DATA_DIR, get_jvm_registry
+
+CDS_DIR = DATA_DIR / 'cds'
+
+# Les archives dynamiques (-XX:ArchiveClassesAtExit) existent depuis Java 13,
+# AutoCreateSharedArchive (régénération automatique) depuis Java 19
+MIN_DYNAMIC_CDS_VERSION = 13
+AUTO_CREATE_CDS_VERSION = 19
+
+
+def compute_mod_set_hash(mods_dir: Path) -> str:
+    """
+    Empreinte du dossier mods (noms, tailles et mtimes des .jar, sans lecture du contenu)
+
+    Args:
+        mods_dir: Dossier mods de l'instance
+
+    Returns:
+        Empreinte SHA-1 hexadécimale
+    """
+    digest = hashlib.sha1()
+    try:
+        entries = sorted(
+            (entry.name, entry.stat().st_size, entry.stat().st_mtime_ns)
+            for entry in os.scandir(mods_dir)
+            if entry.is_file() and entry.name.lower().endswith('.jar')
+        )
+    except OSError:
+        entries = []
+    for name, size, mtime_ns in entries:
+        digest.update(f"{name}\0{size}\0{mtime_ns}\n".encode('utf-8'))
+    return digest.hexdigest()
+
+
+def _quote(path: Path) -> str:
+    """Entoure le chemin de guillemets s'il contient des espaces (JvmArgs est découpé par Prism)"""
+    text = str(path)
+    return f'"{text}"' if ' ' in text else text
+
+
+class AppCdsManager:
+    """Choisit entre run d'entraînement et réutilisation de l'archive CDS"""
+
+    def __init__(self, cds_dir: Path = CDS_DIR):
+        self.cds_dir = cds_dir
+
+    def archive_path(self, java_path: str, forge_version: str, mods_dir: Path) -> Optional[Path]:
+        """
+        Chemin de l'archive pour la combinaison courante, ou None si la JVM ne supporte pas AppCDS dynamique
+
+        Args:
+            java_path: JVM qui lancera le jeu
+            forge_version: Version de Forge configurée
+            mods_dir: Dossier mods de l'instance
+        """
+        info = get_jvm_registry().probe(java_path)
+        if not info or info.major < MIN_DYNAMIC_CDS_VERSION:
+            return None
+        jvm_id = hashlib.sha1(f"{info.path}|{info.version}".encode('utf-8')).hexdigest()[:12]
+        mods_id = compute_mod_set_hash(mods_dir)[:16]
+        safe_forge = ''.join(c if c.isalnum() or c in '.-' else '_' for c in forge_version)
+        return self.cds_dir / f"{jvm_id}_forge-{safe_forge}_{mods_id}.jsa"
+
+    def _invalidate_stale(self, current: Path):
+        """Supprime les archives de la même JVM/Forge construites pour un autre dossier mods"""
+        prefix = current.name.rsplit('_', 1)[0] + '_'
+        try:
+            for archive in self.cds_dir.glob('*.jsa'):
+                if archive.name.startswith(prefix) and archive != current:
+                    archive.unlink()
+                    print(f"[AppCDS] Archive obsolète supprimée (mods modifiés): {archive.name}")
+        except OSError as e:
+            print(f"[AppCDS] Nettoyage impossible: {e}")
+
+    def get_jvm_args(self, java_path: Optional[str], forge_version: str, mods_dir: Path) -> str:
+        """
+        Flags CDS à ajouter aux JvmArgs de l'instance
+
+        Premier lancement: run d'entraînement (l'archive est écrite à la fermeture du jeu).
+        Lancements suivants: l'archive est mappée au démarrage.
+
+        Returns:
+            Flags JVM ('' si AppCDS n'est pas applicable)
+        """
+        if not java_path:
+            return ''
+        archive = self.archive_path(java_path, forge_version, mods_dir)
+        if archive is None:
+            return ''
+
+        self.cds_dir.mkdir(parents=True, exist_ok=True)
+        self._invalidate_stale(archive)
+
+        info = get_jvm_registry().probe(java_path)
+        if info.major >= AUTO_CREATE_CDS_VERSION:
+            # La JVM recrée elle-même l'archive si elle est absente ou invalide
+            print(f"[AppCDS] Archive auto-gérée: {archive.name}")
+            return f'-XX:+AutoCreateSharedArchive -XX:SharedArchiveFile={_quote(archive)}'
+
+        try:
+            ready = archive.stat().st_size > 0
+        except OSError:
+            ready = False
+        if ready:
+            print(f"[AppCDS] Archive réutilisée: {archive.name}")
+            return f'-XX:SharedArchiveFile={_quote(archive)}'
+
+        print(f"[AppCDS] Run d'entraînement, archive écrite à la fermeture du jeu: {archive.name}")
+        return f'-XX:ArchiveClassesAtExit={_quote(archive)}'
+
+
+# Instance globale
+_appcds_instance: Optional[AppCdsManager] = None
+
+
+def get_appcds_manager() -> AppCdsManager:
+    """
+    Retourne le gestionnaire AppCDS global (singleton)
+
+    Returns:
+        Instance d'AppCdsManager
+    """
+    global _appcds_instance
+    if _appcds_instance is None:
+        _appcds_instance = AppCdsManager()
+    return _appcds_instance
+
+
+# Exemple d'utilisation
+if __name__ == "__main__":
+    import sys
+    best = get_jvm_registry().find_best()
+    mods = Path(sys.argv[1]) if len(sys.argv) > 1 else Path('.')
+    print(get_appcds_manager().get_jvm_args(best.path if best else None, '47.4.13', mods) or "AppCDS non applicable")
@@ -32,6 +32,24 @@ def build():
         quick_wins_modules.append("logger_config.py")
     if os.path.exists("download_manager.py"):
         quick_wins_modules.append("download_manager.py")
+    if os.path.exists("java_registry.py"):
+        quick_wins_modules.append("java_registry.py")
+    if os.path.exists("jvm_benchmark.py"):
+        quick_wins_modules.append("jvm_benchmark.py")
+    if os.path.exists("appcds.py"):
+        quick_wins_modules.append("appcds.py")
+    if os.path.exists("mod_index.py"):
+        quick_wins_modules.append("mod_index.py")
+    if os.path.exists("mod_solver.py"):
+        quick_wins_modules.append("mod_solver.py")
+    if os.path.exists("prism_catalog.py"):
+        quick_wins_modules.append("prism_catalog.py")
+    if os.path.exists("startup_trace.py"):
+        quick_wins_modules.append("startup_trace.py")
+    if os.path.exists("sync_report.py"):
+        quick_wins_modules.append("sync_report.py")
+    if os.path.exists("file_hash.py"):
+        quick_wins_modules.append("file_hash.py")
     
     # Commande PyInstaller de base
     cmd = [
@@ -8,10 +8,23 @@ import sys
 import hashlib
 from pathlib import Path
 from typing import Optional
-from dotenv import load_dotenv
 
-# Charger le fichier .env s'il existe
-load_dotenv()
+
+def _find_env_file() -> Optional[Path]:
+    """Cherche un .env dans le dossier courant puis en remontant depuis ce module"""
+    candidates = [Path.cwd() / '.env']
+    candidates += [folder / '.env' for folder in Path(__file__).resolve().parents]
+    for candidate in candidates:
+        if candidate.is_file():
+            return candidate
+    return None
+
+
+# Charger le fichier .env s'il existe (dotenv n'est importé que dans ce cas)
+_env_file = _find_env_file()
+if _env_file:
+    from dotenv import load_dotenv
+    load_dotenv(_env_file)
 
 class Config:
     """Configuration centralisée et sécurisée"""
@@ -4,13 +4,13 @@ Améliore la fiabilité des téléchargements de mods
 """
 
 import time
-import hashlib
 import urllib.request
 import urllib.error
 from pathlib import Path
 from typing import Optional, Callable
 from dataclasses import dataclass
 from logger_config import get_logger
+from file_hash import file_digest
 
 logger = get_logger()
 
@@ -225,13 +225,7 @@ class DownloadManager:
         Returns:
             Hash en hexadécimal (lowercase)
         """
-        hash_obj = hashlib.new(algorithm)
-        
-        with open(filepath, 'rb') as f:
-            for chunk in iter(lambda: f.read(8192), b''):
-                hash_obj.update(chunk)
-        
-        return hash_obj.hexdigest()
+        return file_digest(filepath, algorithm)
     
     @staticmethod
     def verify_file_integrity(
@@ -0,0 +1,216 @@
+"""
+Empreintes de fichiers pour Illama Launcher
+Lecture par grands blocs dans un tampon réutilisé (readinto), mmap pour les gros
+fichiers, et plusieurs algorithmes calculés en une seule lecture
+
+hashlib relâche le GIL pendant update() sur les blocs de plus de 2 KB:
+hash_many() répartit donc réellement le calcul sur plusieurs threads
+"""
+
+import os
+import sys
+import mmap
+import time
+import hashlib
+import threading
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Optional, Iterable, Iterator, Dict, Tuple
+from dataclasses import dataclass, field
+
+# Tampon de lecture (un par thread, alloué une seule fois)
+HASH_BUFFER_SIZE = 1024 * 1024
+
+# Au-delà, le fichier est projeté en mémoire au lieu d'être copié dans le tampon
+MMAP_THRESHOLD = 32 * 1024 * 1024
+
+# Taille des tranches du mmap passées aux digests (gardées en cache CPU entre deux algorithmes)
+MMAP_BLOCK_SIZE = 8 * 1024 * 1024
+
+DEFAULT_WORKERS = min(8, os.cpu_count() or 4)
+
+_local = threading.local()
+
+
+@dataclass
+class FileHash:
+    """Empreintes d'un fichier (error renseigné si le fichier est illisible)"""
+    path: Path
+    size: int = 0
+    digests: Dict[str, str] = field(default_factory=dict)
+    error: Optional[str] = None
+
+    @property
+    def md5(self) -> str:
+        return self.digests.get('md5', '')
+
+
+def _read_buffer() -> memoryview:
+    buffer = getattr(_local, 'buffer', None)
+    if buffer is None:
+        buffer = _local.buffer = memoryview(bytearray(HASH_BUFFER_SIZE))
+    return buffer
+
+
+def _update_all(digests, data):
+    for digest in digests:
+        digest.update(data)
+
+
+def hash_file(path: Path, algorithms: Tuple[str, ...] = ('md5',)) -> FileHash:
+    """
+    Calcule une ou plusieurs empreintes en une seule lecture du fichier
+
+    Args:
+        path: Chemin du fichier
+        algorithms: Noms hashlib ('md5', 'sha1', 'sha256'...)
+
+    Returns:
+        FileHash
+
+    Raises:
+        OSError: fichier absent ou illisible
+    """
+    path = Path(path)
+    digests = [hashlib.new(algorithm) for algorithm in algorithms]
+    with open(path, 'rb', buffering=0) as f:
+        size = os.fstat(f.fileno()).st_size
+        if size >= MMAP_THRESHOLD:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped, memoryview(mapped) as view:
+                for offset in range(0, size, MMAP_BLOCK_SIZE):
+                    with view[offset:offset + MMAP_BLOCK_SIZE] as block:
+                        _update_all(digests, block)
+        else:
+            buffer = _read_buffer()
+            while True:
+                read = f.readinto(buffer)
+                if not read:
+                    break
+                with buffer[:read] as chunk:
+                    _update_all(digests, chunk)
+    return FileHash(
+        path=path,
+        size=size,
+        digests={algorithm: digest.hexdigest() for algorithm, digest in zip(algorithms, digests)}
+    )
+
+
+def file_digest(path: Path, algorithm: str = 'md5') -> str:
+    """
+    Empreinte hexadécimale (lowercase) d'un fichier
+
+    Raises:
+        OSError: fichier absent ou illisible
+    """
+    return hash_file(path, (algorithm,)).digests[algorithm]
+
+
+def _hash_or_error(path: Path, algorithms: Tuple[str, ...]) -> FileHash:
+    try:
+        return hash_file(path, algorithms)
+    except (OSError, ValueError) as e:
+        return FileHash(path=Path(path), error=str(e))
+
+
+def iter_hashes(paths: Iterable[Path], algorithms: Tuple[str, ...] = ('md5',),
+                workers: int = DEFAULT_WORKERS) -> Iterator[FileHash]:
+    """
+    Empreintes de plusieurs fichiers en parallèle, dans l'ordre où elles sont prêtes
+
+    Args:
+        paths: Fichiers à lire
+        algorithms: Noms hashlib calculés pour chaque fichier
+        workers: Nombre de threads
+
+    Yields:
+        FileHash (error renseigné au lieu d'une exception)
+    """
+    paths = list(paths)
+    if workers <= 1 or len(paths) <= 1:
+        for path in paths:
+            yield _hash_or_error(path, algorithms)
+        return
+    with ThreadPoolExecutor(max_workers=min(workers, len(paths)), thread_name_prefix='hash') as executor:
+        futures = [executor.submit(_hash_or_error, path, algorithms) for path in paths]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+def hash_many(paths: Iterable[Path], algorithms: Tuple[str, ...] = ('md5',),
+              workers: int = DEFAULT_WORKERS) -> Dict[Path, FileHash]:
+    """
+    Empreintes de plusieurs fichiers en parallèle
+
+    Returns:
+        {chemin: FileHash}
+    """
+    return {result.path: result for result in iter_hashes(paths, algorithms, workers)}
+
+
+# ============================================================
+# MESURE DU DÉBIT
+# ============================================================
+
+def read_throughput(paths: Iterable[Path]) -> float:
+    """Débit de lecture seule (MB/s) avec le même tampon, sans calcul d'empreinte"""
+    buffer = _read_buffer()
+    total = 0
+    start = time.perf_counter()
+    for path in paths:
+        with open(path, 'rb', buffering=0) as f:
+            while True:
+                read = f.readinto(buffer)
+                if not read:
+                    break
+                total += read
+    return total / 1024 / 1024 / max(time.perf_counter() - start, 1e-9)
+
+
+def _legacy_md5(path: Path) -> str:
+    # Boucle de référence: blocs de 4 KB via iter(lambda: f.read(...))
+    digest = hashlib.md5()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(4096), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+# Exemple d'utilisation
+if __name__ == "__main__":
+    # python file_hash.py [dossier]  (par défaut: un jeu de fichiers temporaire)
+    import shutil
+    import tempfile
+
+    temp_dir = None
+    if len(sys.argv) > 1:
+        files = [p for p in Path(sys.argv[1]).rglob('*') if p.is_file()]
+    else:
+        temp_dir = Path(tempfile.mkdtemp(prefix='illama_hash_'))
+        files = []
+        for index, size_mb in enumerate([100] + [4] * 50):
+            path = temp_dir / f"mod{index:03d}.jar"
+            with open(path, 'wb') as f:
+                for _ in range(size_mb):
+                    f.write(os.urandom(1024 * 1024))
+            files.append(path)
+
+    total_mb = sum(p.stat().st_size for p in files) / 1024 / 1024
+    print(f"{len(files)} fichiers, {total_mb:.0f} MB (2e passage: fichiers dans le cache disque)")
+
+    def timed(label, func):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        print(f"  {label:<32}{elapsed * 1000:>9.0f} ms {total_mb / max(elapsed, 1e-9):>9.0f} MB/s")
+
+    try:
+        for attempt in range(2):
+            print(f"Passage {attempt + 1}:")
+            print(f"  {'lecture seule (readinto)':<32}{'':>12}{read_throughput(files):>9.0f} MB/s")
+            timed("md5 blocs 4 KB (ancien)", lambda: [_legacy_md5(p) for p in files])
+            timed("md5 hash_file", lambda: [hash_file(p) for p in files])
+            timed("md5+sha256 une lecture", lambda: [hash_file(p, ('md5', 'sha256')) for p in files])
+            timed(f"md5 hash_many ({DEFAULT_WORKERS} threads)", lambda: hash_many(files))
+    finally:
+        if temp_dir:
+            shutil.rmtree(temp_dir, ignore_errors=True)
@@ -0,0 +1,94 @@
+"""
+Mesure du coût des imports au démarrage d'Illama Launcher
+Lance `python -X importtime` dans un processus neuf (cache d'imports froid)
+et affiche les modules les plus coûteux
+
+Usage:
+    python import_cost.py                 # import launcher
+    python import_cost.py mod_index 30    # autre module, 30 lignes
+    python import_cost.py launcher --json # sortie JSON (comparaison entre builds)
+"""
+
+import os
+import sys
+import json
+import subprocess
+from typing import List, Dict
+
+# Imports lourds qui ne doivent pas être chargés avant qu'une fonctionnalité en ait besoin
+WATCHED_MODULES = ('tkinter', 'PIL', 'pystray', 'dotenv', 'webbrowser', 'concurrent.futures',
+                   'jvm_benchmark', 'appcds', 'mod_index', 'mod_solver', 'download_manager', 'sync_report',
+                   'file_hash', 'logger_config')
+
+
+def measure_imports(module: str = 'launcher', runs: int = 3) -> List[Dict]:
+    """
+    Mesure les imports d'un module (meilleur de plusieurs runs)
+
+    Args:
+        module: Module à importer
+        runs: Nombre de processus lancés
+
+    Returns:
+        Liste de {'module', 'self_us', 'cumulative_us', 'depth'} dans l'ordre d'import
+    """
+    best = None
+    here = os.path.dirname(os.path.abspath(__file__))
+    for _ in range(runs):
+        result = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+            cwd=here,
+            capture_output=True,
+            text=True,
+            encoding='utf-8',
+            errors='replace'
+        )
+        rows = []
+        for line in result.stderr.splitlines():
+            if not line.startswith('import time:') or 'self [us]' in line:
+                continue
+            self_us, cumulative_us, name = line[len('import time:'):].split('|', 2)
+            rows.append({
+                'module': name.strip(),
+                'self_us': int(self_us),
+                'cumulative_us': int(cumulative_us),
+                'depth': (len(name) - len(name.lstrip()) - 1) // 2
+            })
+        total = sum(r['cumulative_us'] for r in rows if r['depth'] == 0)
+        if best is None or total < best[0]:
+            best = (total, rows)
+    return best[1] if best else []
+
+
+def summarize(rows: List[Dict], module: str, limit: int = 20) -> dict:
+    """Résumé: total, modules racine les plus lents et imports lourds présents"""
+    top_level = [r for r in rows if r['depth'] == 0]
+    loaded = {r['module'] for r in rows}
+    target = next((r for r in top_level if r['module'] == module), None)
+    return {
+        'module': module,
+        'total_ms': round(sum(r['cumulative_us'] for r in top_level) / 1000, 1),
+        'module_ms': round(target['cumulative_us'] / 1000, 1) if target else None,
+        'slowest': [
+            {'module': r['module'], 'cumulative_ms': round(r['cumulative_us'] / 1000, 1)}
+            for r in sorted(rows, key=lambda r: r['cumulative_us'], reverse=True)[:limit]
+        ],
+        'watched_loaded': [name for name in WATCHED_MODULES if name in loaded],
+    }
+
+
+if __name__ == "__main__":
+    args = [a for a in sys.argv[1:] if not a.startswith('--')]
+    target_module = args[0] if args else 'launcher'
+    line_limit = int(args[1]) if len(args) > 1 else 20
+    summary = summarize(measure_imports(target_module), target_module, line_limit)
+
+    if '--json' in sys.argv:
+        print(json.dumps(summary, indent=2))
+        sys.exit(0)
+
+    print(f"\nImport de {target_module}: {summary['module_ms']} ms (total interpréteur {summary['total_ms']} ms)\n")
+    for entry in summary['slowest']:
+        print(f"  {entry['cumulative_ms']:>8.1f} ms  {entry['module']}")
+    loaded_watched = summary['watched_loaded']
+    print(f"\nImports lourds chargés: {', '.join(loaded_watched) if loaded_watched else 'aucun'}")
@@ -0,0 +1,382 @@
+"""
+Registre persistant des JVM installées pour Illama Launcher
+Évite de relancer `where java` et `java -version` à chaque clic sur Jouer
+"""
+
+import os
+import re
+import sys
+import json
+import threading
+import subprocess
+from pathlib import Path
+from typing import Optional, List, Dict
+from dataclasses import dataclass, asdict
+
+# Dossier de données du launcher (même racine que les logs)
+DATA_DIR = Path.home() / 'AppData' / 'Local' / 'IllamaLauncher'
+REGISTRY_FILE = DATA_DIR / 'java_registry.json'
+REGISTRY_FORMAT = 1
+
+JAVA_EXE = 'java.exe' if sys.platform == 'win32' else 'java'
+
+# Propriétés lues dans la sortie de -XshowSettings:properties
+_PROPERTY_RE = re.compile(r'^\s*(java\.version|java\.vendor|os\.arch|java\.home)\s*=\s*(.*?)\s*$', re.MULTILINE)
+
+
+@dataclass
+class JvmInfo:
+    """Description d'une JVM sondée"""
+    path: str
+    size: int
+    mtime_ns: int
+    major: int
+    version: str = ""
+    vendor: str = ""
+    arch: str = ""
+    output: str = ""
+
+    @property
+    def is_64bit(self) -> bool:
+        return self.arch.lower() in ('amd64', 'x86_64', 'aarch64', 'arm64')
+
+
+def parse_java_major(version: str) -> int:
+    """
+    Extrait la version majeure d'une chaîne java.version
+
+    Args:
+        version: "17.0.8", "21", "1.8.0_392"...
+
+    Returns:
+        Version majeure (0 si illisible)
+    """
+    match = re.match(r'(\d+)(?:\.(\d+))?', version.strip().strip('"'))
+    if not match:
+        return 0
+    major = int(match.group(1))
+    # Java 8 et antérieur: "1.8" -> 8
+    if major == 1 and match.group(2):
+        major = int(match.group(2))
+    return major
+
+
+def _file_key(path: str) -> Optional[tuple]:
+    """Clé de validité d'un exécutable: (taille, mtime_ns) ou None s'il n'existe plus"""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_size, st.st_mtime_ns)
+
+
+class JvmRegistry:
+    """
+    Registre des JVM indexé par chemin, taille et mtime
+
+    Une JVM n'est re-sondée (java -version) que si son exécutable a changé.
+    Les vérifications sur le chemin de lancement ne coûtent qu'un stat().
+    """
+
+    def __init__(self, registry_file: Path = REGISTRY_FILE, max_workers: int = 4):
+        self.registry_file = registry_file
+        self.max_workers = max_workers
+        self._lock = threading.RLock()
+        # Une seule écriture à la fois (le fichier .tmp est partagé)
+        self._save_lock = threading.Lock()
+        self._entries: Dict[str, JvmInfo] = {}
+        self._discovered: List[str] = []
+        # Sondages en échec: chemin -> [taille, mtime_ns] (pas de nouveau sondage tant que le fichier n'a pas changé)
+        self._failed: Dict[str, List[int]] = {}
+        self._loaded = False
+        self._dirty = False
+
+    # ------------------------------------------------------------
+    # Persistance
+    # ------------------------------------------------------------
+
+    def _load(self):
+        if self._loaded:
+            return
+        self._loaded = True
+        try:
+            with open(self.registry_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('format') != REGISTRY_FORMAT:
+                return
+            for path, raw in data.get('entries', {}).items():
+                try:
+                    self._entries[path] = JvmInfo(**raw)
+                except TypeError:
+                    continue
+            self._discovered = [p for p in data.get('discovered', []) if isinstance(p, str)]
+            self._failed = {path: list(key) for path, key in data.get('failed', {}).items()
+                            if isinstance(key, list) and len(key) == 2}
+        except (OSError, ValueError):
+            pass
+
+    def save(self):
+        """Écrit le registre sur disque s'il a changé"""
+        with self._save_lock:
+            with self._lock:
+                if not self._dirty:
+                    return
+                data = {
+                    'format': REGISTRY_FORMAT,
+                    'entries': {path: asdict(info) for path, info in self._entries.items()},
+                    'discovered': list(self._discovered),
+                    'failed': dict(self._failed),
+                }
+                self._dirty = False
+            try:
+                self.registry_file.parent.mkdir(parents=True, exist_ok=True)
+                tmp_file = self.registry_file.with_suffix('.tmp')
+                with open(tmp_file, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, indent=2)
+                os.replace(tmp_file, self.registry_file)
+            except OSError as e:
+                # Réessayer au prochain save()
+                with self._lock:
+                    self._dirty = True
+                print(f"[Java] Impossible d'enregistrer le registre JVM: {e}")
+
+    # ------------------------------------------------------------
+    # Sondage
+    # ------------------------------------------------------------
+
+    def _run_probe(self, path: str, key: tuple) -> Optional[JvmInfo]:
+        """Lance la JVM une seule fois pour lire version, vendor et architecture"""
+        try:
+            result = subprocess.run(
+                [path, '-XshowSettings:properties', '-version'],
+                capture_output=True,
+                text=True,
+                timeout=15,
+                creationflags=getattr(subprocess, 'CREATE_NO_WINDOW', 0)
+            )
+        except (OSError, subprocess.TimeoutExpired) as e:
+            print(f"[Java] Sondage impossible pour {path}: {e}")
+            return None
+
+        output = result.stderr or result.stdout or ""
+        props = dict(_PROPERTY_RE.findall(output))
+        version = props.get('java.version', '')
+        if not version:
+            # Anciennes JVM: se rabattre sur la ligne "version "x.y""
+            match = re.search(r'version "([^"]+)"', output)
+            version = match.group(1) if match else ''
+        major = parse_java_major(version) if version else 0
+        if not major:
+            print(f"[Java] Impossible de parser la version. Sortie: {output[:200]}")
+            return None
+
+        # Conserver uniquement les lignes de version (sans le dump des propriétés)
+        version_lines = [line for line in output.splitlines()
+                         if line and not line.startswith((' ', '\t', 'Property settings'))]
+        return JvmInfo(
+            path=path,
+            size=key[0],
+            mtime_ns=key[1],
+            major=major,
+            version=version,
+            vendor=props.get('java.vendor', ''),
+            arch=props.get('os.arch', ''),
+            output="\n".join(version_lines).strip()
+        )
+
+    def probe(self, path: str, save: bool = True) -> Optional[JvmInfo]:
+        """
+        Retourne les informations d'une JVM, depuis le cache si l'exécutable n'a pas changé
+        (un échec de sondage est aussi mémorisé jusqu'à la prochaine modification du fichier)
+
+        Args:
+            path: Chemin de l'exécutable java
+            save: Écrire le registre après un nouveau sondage (discover() écrit une seule fois à la fin)
+
+        Returns:
+            JvmInfo ou None si la JVM est absente ou illisible
+        """
+        path = str(path)
+        key = _file_key(path)
+        if key is None:
+            return None
+
+        with self._lock:
+            self._load()
+            info = self._entries.get(path)
+            if info and (info.size, info.mtime_ns) == key:
+                return info
+            if self._failed.get(path) == list(key):
+                return None
+
+        info = self._run_probe(path, key)
+        with self._lock:
+            if info:
+                self._entries[path] = info
+                self._failed.pop(path, None)
+            else:
+                self._entries.pop(path, None)
+                self._failed[path] = list(key)
+            self._dirty = True
+        if save:
+            self.save()
+        return info
+
+    # ------------------------------------------------------------
+    # Découverte
+    # ------------------------------------------------------------
+
+    @staticmethod
+    def candidate_paths() -> List[str]:
+        """Liste les exécutables java potentiels (JAVA_HOME, PATH, dossiers standards)"""
+        candidates = []
+
+        java_home = os.environ.get('JAVA_HOME')
+        if java_home:
+            candidates.append(Path(java_home) / 'bin' / JAVA_EXE)
+
+        # PATH sans lancer `where java`
+        for entry in os.environ.get('PATH', '').split(os.pathsep):
+            if entry:
+                candidates.append(Path(entry.strip('"')) / JAVA_EXE)
+
+        if sys.platform == 'win32':
+            program_dirs = {
+                os.environ.get('PROGRAMFILES', 'C:/Program Files'),
+                os.environ.get('PROGRAMFILES(X86)', 'C:/Program Files (x86)'),
+                'C:/Program Files',
+                'C:/Program Files (x86)',
+            }
+            vendors = ['Java', 'Eclipse Adoptium', 'Eclipse Foundation', 'Microsoft',
+                       'Zulu', 'BellSoft', 'Amazon Corretto']
+            base_dirs = [Path(p) / v for p in program_dirs for v in vendors]
+        else:
+            base_dirs = [Path('/usr/lib/jvm'), Path('/Library/Java/JavaVirtualMachines')]
+
+        for base_path in base_dirs:
+            try:
+                for java_dir in base_path.iterdir():
+                    candidates.append(java_dir / 'bin' / JAVA_EXE)
+                    candidates.append(java_dir / 'Contents' / 'Home' / 'bin' / JAVA_EXE)
+            except OSError:
+                continue
+
+        # Dédoublonner en conservant l'ordre de priorité
+        seen = set()
+        result = []
+        for candidate in candidates:
+            if not candidate.is_file():
+                continue
+            try:
+                resolved = str(candidate.resolve())
+            except OSError:
+                resolved = str(candidate)
+            if resolved not in seen:
+                seen.add(resolved)
+                result.append(str(candidate))
+        return result
+
+    def discover(self) -> List[JvmInfo]:
+        """
+        Découvre toutes les JVM installées et les sonde en parallèle
+
+        Returns:
+            Liste des JVM valides, dans l'ordre de priorité de découverte
+        """
+        paths = self.candidate_paths()
+        if not paths:
+            infos = []
+        else:
+            from concurrent.futures import ThreadPoolExecutor
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(paths))) as executor:
+                infos = [info for info in executor.map(lambda p: self.probe(p, save=False), paths) if info]
+
+        with self._lock:
+            discovered = [info.path for info in infos]
+            if discovered != self._discovered:
+                self._discovered = discovered
+                self._dirty = True
+        self.save()
+        print(f"[Java] {len(infos)} JVM découverte(s)")
+        return infos
+
+    def installed(self, refresh: bool = False) -> List[JvmInfo]:
+        """
+        JVM connues du registre, revalidées par stat() uniquement
+
+        Args:
+            refresh: Forcer une nouvelle découverte complète
+        """
+        with self._lock:
+            self._load()
+            known = list(self._discovered)
+        if refresh or not known:
+            return self.discover()
+
+        infos = []
+        for path in known:
+            info = self.probe(path)
+            if info:
+                infos.append(info)
+        if not infos:
+            return self.discover()
+        return infos
+
+    def find_best(self, min_major: int = 17, refresh: bool = False) -> Optional[JvmInfo]:
+        """
+        Choisit la JVM la plus adaptée
+
+        Priorité: JAVA_HOME si compatible, puis JVM 64 bits compatible la plus proche
+        de min_major, sinon la première JVM trouvée (incompatible).
+
+        Args:
+            min_major: Version majeure minimale requise
+            refresh: Forcer une nouvelle découverte complète
+
+        Returns:
+            JvmInfo ou None si aucune JVM
+        """
+        infos = self.installed(refresh=refresh)
+        if not infos:
+            return None
+
+        java_home = os.environ.get('JAVA_HOME')
+        if java_home:
+            home_exe = str(Path(java_home) / 'bin' / JAVA_EXE)
+            for info in infos:
+                if info.path == home_exe and info.major >= min_major:
+                    return info
+
+        compatible = [info for info in infos if info.major >= min_major]
+        if compatible:
+            return min(compatible, key=lambda i: (not i.is_64bit, i.major - min_major))
+        return infos[0]
+
+
+# Instance globale du registre
+_registry_instance: Optional[JvmRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_jvm_registry() -> JvmRegistry:
+    """
+    Retourne le registre JVM global (singleton)
+
+    Returns:
+        Instance de JvmRegistry
+    """
+    global _registry_instance
+    with _registry_lock:
+        if _registry_instance is None:
+            _registry_instance = JvmRegistry()
+        return _registry_instance
+
+
+# Exemple d'utilisation
+if __name__ == "__main__":
+    registry = get_jvm_registry()
+    for jvm in registry.installed(refresh=True):
+        print(f"Java {jvm.major} ({jvm.version}) - {jvm.vendor} [{jvm.arch}] -> {jvm.path}")
+
+    best = registry.find_best()
+    print(f"\nJVM retenue: {best.path if best else 'aucune'}")
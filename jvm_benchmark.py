@@ -0,0 +1,330 @@
+"""
+Benchmark des flags JVM pour Illama Launcher
+Mesure les jeux de flags candidats (G1, ZGC, Shenandoah...) sur une charge
+d'allocation synthétique et mémorise le gagnant par JVM et par profil RAM
+"""
+
+import os
+import sys
+import json
+import time
+import tempfile
+import threading
+import subprocess
+from pathlib import Path
+from typing import Optional, Callable, Dict, List
+from dataclasses import dataclass, asdict
+
+from java_registry import DATA_DIR, get_jvm_registry
+
+PROFILES_FILE = DATA_DIR / 'jvm_profiles.json'
+
+# Poids d'une milliseconde de pause max dans le score (les saccades comptent plus que le débit)
+PAUSE_WEIGHT = 10
+
+# Charge synthétique: un ensemble retenu (chunks/textures) + beaucoup d'objets éphémères.
+# Exécutée en mode "source file" (Java 11+), le programme mesure lui-même sa durée et sa pire pause.
+WORKLOAD_SOURCE = """
+import java.util.ArrayList;
+import java.util.List;
+import java.util.Random;
+
+public class IllamaGcWorkload {
+    public static void main(String[] args) {
+        int iterations = Integer.parseInt(args[0]);
+        int retainedMb = Math.max(1, Integer.parseInt(args[1]));
+        List<byte[]> retained = new ArrayList<>();
+        for (int i = 0; i < retainedMb; i++) {
+            retained.add(new byte[1024 * 1024]);
+        }
+        Random rnd = new Random(42);
+        Object[] window = new Object[4096];
+        long sink = 0;
+        long maxPause = 0;
+        long start = System.nanoTime();
+        long last = start;
+        for (int i = 0; i < iterations; i++) {
+            for (int j = 0; j < 256; j++) {
+                byte[] b = new byte[16 + rnd.nextInt(2048)];
+                b[0] = (byte) j;
+                window[rnd.nextInt(window.length)] = b;
+                sink += b.length;
+            }
+            if ((i & 1023) == 0) {
+                retained.set(rnd.nextInt(retained.size()), new byte[1024 * 1024]);
+            }
+            long now = System.nanoTime();
+            if (now - last > maxPause) {
+                maxPause = now - last;
+            }
+            last = now;
+        }
+        long total = System.nanoTime() - start;
+        System.out.println("ILLAMA_RESULT " + (total / 1000000) + " " + (maxPause / 1000) + " " + sink);
+    }
+}
+"""
+
+_COMMON_FLAGS = (
+    '-XX:+UnlockExperimentalVMOptions '
+    '-XX:+DisableExplicitGC '
+    '-XX:+PerfDisableSharedMem '
+)
+
+
+def _g1_flags(region_mb: int, pretouch: bool) -> str:
+    """Flags G1 type Aikar avec taille de région et AlwaysPreTouch paramétrables"""
+    return (
+        '-XX:+UseG1GC '
+        '-XX:+ParallelRefProcEnabled '
+        '-XX:MaxGCPauseMillis=200 '
+        + _COMMON_FLAGS +
+        ('-XX:+AlwaysPreTouch ' if pretouch else '') +
+        '-XX:G1NewSizePercent=30 '
+        '-XX:G1MaxNewSizePercent=40 '
+        f'-XX:G1HeapRegionSize={region_mb}M '
+        '-XX:G1ReservePercent=20 '
+        '-XX:G1HeapWastePercent=5 '
+        '-XX:G1MixedGCCountTarget=4 '
+        '-XX:InitiatingHeapOccupancyPercent=15 '
+        '-XX:G1MixedGCLiveThresholdPercent=90 '
+        '-XX:G1RSetUpdatingPauseTimePercent=5 '
+        '-XX:SurvivorRatio=32 '
+        '-XX:MaxTenuringThreshold=1'
+    )
+
+
+def get_candidate_flag_sets(java_major: int) -> Dict[str, str]:
+    """
+    Jeux de flags candidats pour une version de Java
+
+    Args:
+        java_major: Version majeure de la JVM
+
+    Returns:
+        Dictionnaire nom -> flags JVM
+    """
+    candidates = {
+        'g1_4m': _g1_flags(4, pretouch=False),
+        'g1_8m': _g1_flags(8, pretouch=False),
+        'g1_8m_pretouch': _g1_flags(8, pretouch=True),
+        'g1_16m_pretouch': _g1_flags(16, pretouch=True),
+    }
+    if java_major >= 17:
+        candidates['zgc'] = (
+            '-XX:+UseZGC '
+            + _COMMON_FLAGS +
+            ('-XX:+ZGenerational ' if java_major >= 21 else '') +
+            '-XX:+AlwaysPreTouch'
+        )
+    # Shenandoah n'existe que dans certaines builds (Temurin, Zulu...): un échec au
+    # démarrage élimine simplement le candidat
+    candidates['shenandoah'] = (
+        '-XX:+UseShenandoahGC '
+        + _COMMON_FLAGS +
+        '-XX:+AlwaysPreTouch'
+    )
+    return candidates
+
+
+@dataclass
+class FlagResult:
+    """Résultat d'un jeu de flags sur la charge synthétique"""
+    name: str
+    flags: str
+    run_ms: int = 0
+    max_pause_ms: float = 0.0
+    score: float = 0.0
+    error: Optional[str] = None
+
+
+class JvmFlagBenchmark:
+    """Lance la charge synthétique avec chaque jeu de flags et classe les résultats"""
+
+    def __init__(
+        self,
+        java_path: str,
+        heap_mb: int = 2048,
+        iterations: int = 20000,
+        rounds: int = 2,
+        timeout: int = 120
+    ):
+        self.java_path = java_path
+        self.heap_mb = heap_mb
+        self.iterations = iterations
+        self.rounds = rounds
+        self.timeout = timeout
+
+    def _run_once(self, source_file: Path, flags: str) -> tuple:
+        """Exécute la charge une fois et retourne (run_ms, max_pause_ms)"""
+        retained_mb = max(1, int(self.heap_mb * 0.4))
+        cmd = [self.java_path, f'-Xms{self.heap_mb}M', f'-Xmx{self.heap_mb}M']
+        cmd += flags.split()
+        cmd += [str(source_file), str(self.iterations), str(retained_mb)]
+        result = subprocess.run(
+            cmd,
+            capture_output=True,
+            text=True,
+            timeout=self.timeout,
+            creationflags=getattr(subprocess, 'CREATE_NO_WINDOW', 0)
+        )
+        for line in result.stdout.splitlines():
+            if line.startswith('ILLAMA_RESULT'):
+                parts = line.split()
+                return int(parts[1]), int(parts[2]) / 1000.0
+        output = (result.stderr or result.stdout or '').strip()
+        raise RuntimeError(output.splitlines()[0] if output else f"code retour {result.returncode}")
+
+    def run(self, progress_callback: Optional[Callable[[str, int, int], None]] = None) -> List[FlagResult]:
+        """
+        Mesure tous les candidats
+
+        Args:
+            progress_callback: Callback(message, current, total)
+
+        Returns:
+            Résultats triés du meilleur au moins bon (les échecs à la fin)
+        """
+        info = get_jvm_registry().probe(self.java_path)
+        if not info:
+            raise RuntimeError(f"JVM illisible: {self.java_path}")
+        if info.major < 11:
+            raise RuntimeError(f"Java {info.major} ne supporte pas le mode source (11+ requis)")
+
+        candidates = get_candidate_flag_sets(info.major)
+        results = []
+        with tempfile.TemporaryDirectory(prefix='illama_gc_') as tmp:
+            source_file = Path(tmp) / 'IllamaGcWorkload.java'
+            source_file.write_text(WORKLOAD_SOURCE, encoding='utf-8')
+
+            for index, (name, flags) in enumerate(candidates.items()):
+                if progress_callback:
+                    progress_callback(f"Benchmark JVM: {name}", index, len(candidates))
+                result = FlagResult(name=name, flags=flags)
+                try:
+                    # Garder le meilleur passage (le premier chauffe le cache disque)
+                    runs = [self._run_once(source_file, flags) for _ in range(self.rounds)]
+                    result.run_ms, result.max_pause_ms = min(
+                        runs, key=lambda r: r[0] + PAUSE_WEIGHT * r[1])
+                    result.score = result.run_ms + PAUSE_WEIGHT * result.max_pause_ms
+                    print(f"[JvmBench] {name}: {result.run_ms}ms, pause max {result.max_pause_ms:.1f}ms "
+                          f"(score {result.score:.0f})")
+                except (RuntimeError, subprocess.TimeoutExpired, OSError) as e:
+                    result.error = str(e)
+                    print(f"[JvmBench] {name} ignoré: {e}")
+                results.append(result)
+
+        if progress_callback:
+            progress_callback("Benchmark JVM terminé", len(candidates), len(candidates))
+        return sorted(results, key=lambda r: (r.error is not None, r.score))
+
+
+# ============================================================
+# PROFILS MÉMORISÉS
+# ============================================================
+
+_profiles_lock = threading.Lock()
+_profiles_cache: Optional[dict] = None
+
+
+def _load_profiles() -> dict:
+    global _profiles_cache
+    if _profiles_cache is None:
+        try:
+            with open(PROFILES_FILE, 'r', encoding='utf-8') as f:
+                _profiles_cache = json.load(f)
+        except (OSError, ValueError):
+            _profiles_cache = {}
+    return _profiles_cache
+
+
+def _profile_key(java_path: str) -> Optional[str]:
+    """Clé de profil: chemin + version exacte (un update de la JVM invalide le résultat)"""
+    info = get_jvm_registry().probe(java_path)
+    if not info:
+        return None
+    return f"{info.path}|{info.version}"
+
+
+def get_best_jvm_flags(java_path: Optional[str], ram_tier: str) -> Optional[str]:
+    """
+    Retourne les flags gagnants mémorisés pour une JVM et un profil RAM
+
+    Args:
+        java_path: Chemin de la JVM
+        ram_tier: Profil RAM ("low_end", "medium", "high")
+
+    Returns:
+        Flags JVM ou None si aucun benchmark n'a été fait
+    """
+    if not java_path:
+        return None
+    key = _profile_key(java_path)
+    if not key:
+        return None
+    with _profiles_lock:
+        entry = _load_profiles().get(key, {}).get(ram_tier)
+    return entry.get('flags') if entry else None
+
+
+def run_jvm_benchmark(
+    java_path: str,
+    ram_tier: str,
+    heap_mb: int,
+    progress_callback: Optional[Callable[[str, int, int], None]] = None
+) -> Optional[FlagResult]:
+    """
+    Lance le benchmark et mémorise le gagnant pour (JVM, profil RAM)
+
+    Args:
+        java_path: Chemin de la JVM à mesurer
+        ram_tier: Profil RAM ("low_end", "medium", "high")
+        heap_mb: Taille de heap utilisée pour la charge
+        progress_callback: Callback(message, current, total)
+
+    Returns:
+        Le meilleur FlagResult, ou None si la JVM est illisible ou si tous les candidats ont échoué
+    """
+    # Sans version de JVM, le résultat ne pourrait pas être retrouvé par get_best_jvm_flags
+    key = _profile_key(java_path)
+    if key is None:
+        print(f"[JvmBench] JVM illisible, benchmark annulé: {java_path}")
+        return None
+
+    results = JvmFlagBenchmark(java_path, heap_mb=heap_mb).run(progress_callback)
+    winner = results[0] if results and results[0].error is None else None
+    if not winner:
+        print("[JvmBench] Aucun jeu de flags n'a pu être mesuré")
+        return None
+
+    with _profiles_lock:
+        profiles = _load_profiles()
+        profiles.setdefault(key, {})[ram_tier] = {
+            **asdict(winner),
+            'heap_mb': heap_mb,
+            'measured_at': time.strftime('%Y-%m-%d %H:%M:%S'),
+            'results': [asdict(r) for r in results],
+        }
+        try:
+            PROFILES_FILE.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = PROFILES_FILE.with_suffix('.tmp')
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump(profiles, f, indent=2)
+            os.replace(tmp_file, PROFILES_FILE)
+        except OSError as e:
+            print(f"[JvmBench] Impossible d'enregistrer le profil: {e}")
+
+    print(f"[JvmBench] Gagnant pour {ram_tier}: {winner.name}")
+    return winner
+
+
+# Exemple d'utilisation
+if __name__ == "__main__":
+    best = get_jvm_registry().find_best()
+    if not best:
+        print("Aucune JVM trouvée")
+        sys.exit(1)
+    tier = sys.argv[1] if len(sys.argv) > 1 else 'medium'
+    heap = int(sys.argv[2]) if len(sys.argv) > 2 else 2048
+    winner = run_jvm_benchmark(best.path, tier, heap)
+    print(f"\nMeilleur profil: {winner.name if winner else 'aucun'}")
@@ -7,23 +7,58 @@ VERSION: 2.0.5 - INTÉGRATION QUICK WINS + TOUS BUGS CORRIGÉS
 Date: 22 décembre 2024
 """
 
+# === TRACE DE DÉMARRAGE (ILLAMA_STARTUP_TRACE) - importée en premier: t=0 ===
+try:
+    from startup_trace import get_startup_trace, traced
+    startup_trace = get_startup_trace()
+    QUICK_WINS_STARTUP_TRACE = True
+except ImportError:
+    from contextlib import nullcontext
+    
+    class _NoStartupTrace:
+        """Remplaçant sans effet quand startup_trace.py est absent"""
+        enabled = False
+        
+        def __getattr__(self, name):
+            return lambda *args, **kwargs: nullcontext()
+    
+    def traced(name=None):
+        return lambda func: func
+    
+    startup_trace = _NoStartupTrace()
+    QUICK_WINS_STARTUP_TRACE = False
+startup_trace.begin('imports')
+
 import os
 import sys
 import json
 import hashlib
 import threading
 import subprocess
-import webbrowser
-import base64
-import io
+import importlib
+import importlib.util
 import stat
 import shutil
 from pathlib import Path
 from datetime import datetime
-from typing import Optional, Callable
-from concurrent.futures import ThreadPoolExecutor, as_completed
-import tkinter as tk
-from tkinter import ttk, messagebox, filedialog, simpledialog
+from collections import deque
+from typing import Optional, Callable, List, Iterator, Tuple
+from dataclasses import dataclass, asdict
+from functools import lru_cache
+
+# === MODE HEADLESS (CLI) ===
+# python -m launcher sync|verify|launch|status : ni tkinter, ni PIL, ni pystray
+CLI_COMMANDS = ('sync', 'verify', 'launch', 'status')
+HEADLESS = __name__ == "__main__" and len(sys.argv) > 1 and sys.argv[1] in CLI_COMMANDS
+
+if HEADLESS:
+    tk = ttk = messagebox = filedialog = simpledialog = None
+    # stdout est réservé au JSON du CLI: les messages [Tag] partent sur stderr
+    CLI_STDOUT = sys.stdout
+    sys.stdout = sys.stderr
+else:
+    import tkinter as tk
+    from tkinter import ttk, messagebox, filedialog, simpledialog
 import urllib.request
 import urllib.parse
 import urllib.error
@@ -34,35 +69,123 @@ import tempfile
 import glob
 
 # === QUICK WINS - IMPORTS DES MODULES PROFESSIONNELS ===
-try:
-    from config_secure import Config
-    QUICK_WINS_CONFIG = True
-    print("[QuickWins] Module config_secure chargé ✓")
-except ImportError:
-    QUICK_WINS_CONFIG = False
+# Les modules utilisés seulement par une fonctionnalité (sync, benchmark, lancement)
+# ne sont importés qu'à leur première utilisation: quick_win('module')
+def quick_win_available(module_name: str) -> bool:
+    """Vérifie qu'un module Quick Wins est présent, sans l'importer"""
+    try:
+        return importlib.util.find_spec(module_name) is not None
+    except (ImportError, ValueError):
+        return False
+
+@lru_cache(maxsize=None)
+def quick_win(module_name: str):
+    """Importe un module Quick Wins à sa première utilisation"""
+    return importlib.import_module(module_name)
+
+QUICK_WINS_CONFIG = quick_win_available('config_secure')
+if QUICK_WINS_CONFIG:
+    print("[QuickWins] Module config_secure disponible (chargement différé) ✓")
+else:
     print("[QuickWins] Module config_secure non trouvé - Mode fallback")
 
-try:
-    from logger_config import setup_logger, get_logger
-    QUICK_WINS_LOGGER = True
-    # Initialiser le logger principal
-    logger = get_logger('launcher')
-    print("[QuickWins] Module logger_config chargé ✓")
-except ImportError:
-    QUICK_WINS_LOGGER = False
+QUICK_WINS_LOGGER = quick_win_available('logger_config')
+if QUICK_WINS_LOGGER:
+    print("[QuickWins] Module logger_config disponible (chargement différé) ✓")
+else:
+    print("[QuickWins] Module logger_config non trouvé - Mode fallback")
+
+@lru_cache(maxsize=None)
+def get_launcher_logger():
+    """
+    Logger principal, créé au premier message (dossier de logs, fichier
+    et thread d'écriture ne sont pas initialisés à l'import du launcher)
+    """
+    if QUICK_WINS_LOGGER:
+        return quick_win('logger_config').get_logger('launcher')
     # Fallback : logger simple
     import logging
     logging.basicConfig(level=logging.INFO)
-    logger = logging.getLogger('launcher')
-    print("[QuickWins] Module logger_config non trouvé - Mode fallback")
+    return logging.getLogger('launcher')
+
+
+def emit_event(operation: str, message: str = '', outcome: str = 'info', **fields):
+    """
+    Affiche la ligne de statut habituelle et l'ajoute au journal d'événements JSON
+    
+    Args:
+        operation: Nom de l'opération (ex: "sync.download", "java.install")
+        message: Ligne console ("[Sync] ..."), vide pour un événement sans affichage
+        outcome: ok, error, retry, info...
+        **fields: file, bytes, duration_ms, attempt...
+    """
+    if message:
+        print(message)
+    if QUICK_WINS_LOGGER:
+        quick_win('logger_config').log_event(operation, outcome, message=message or None, **fields)
+
+
+def elapsed_ms(start: float) -> float:
+    """Durée depuis time.perf_counter() en millisecondes (champ duration_ms)"""
+    return round((time.perf_counter() - start) * 1000, 1)
+
+QUICK_WINS_DOWNLOAD = quick_win_available('download_manager')
+if QUICK_WINS_DOWNLOAD:
+    print("[QuickWins] Module download_manager disponible (chargement différé) ✓")
+else:
+    print("[QuickWins] Module download_manager non trouvé - Mode fallback")
 
 try:
-    from download_manager import DownloadManager, RetryPolicy
-    QUICK_WINS_DOWNLOAD = True
-    print("[QuickWins] Module download_manager chargé ✓")
+    from java_registry import get_jvm_registry
+    QUICK_WINS_JAVA_REGISTRY = True
+    print("[QuickWins] Module java_registry chargé ✓")
 except ImportError:
-    QUICK_WINS_DOWNLOAD = False
-    print("[QuickWins] Module download_manager non trouvé - Mode fallback")
+    QUICK_WINS_JAVA_REGISTRY = False
+    print("[QuickWins] Module java_registry non trouvé - Mode fallback")
+
+QUICK_WINS_JVM_BENCHMARK = quick_win_available('jvm_benchmark')
+if QUICK_WINS_JVM_BENCHMARK:
+    print("[QuickWins] Module jvm_benchmark disponible (chargement différé) ✓")
+else:
+    print("[QuickWins] Module jvm_benchmark non trouvé - Mode fallback")
+
+QUICK_WINS_APPCDS = quick_win_available('appcds')
+if QUICK_WINS_APPCDS:
+    print("[QuickWins] Module appcds disponible (chargement différé) ✓")
+else:
+    print("[QuickWins] Module appcds non trouvé - Mode fallback")
+
+QUICK_WINS_MOD_INDEX = quick_win_available('mod_index')
+if QUICK_WINS_MOD_INDEX:
+    print("[QuickWins] Module mod_index disponible (chargement différé) ✓")
+else:
+    print("[QuickWins] Module mod_index non trouvé - Mode fallback")
+
+QUICK_WINS_PREFLIGHT = quick_win_available('mod_solver')
+if QUICK_WINS_PREFLIGHT:
+    print("[QuickWins] Module mod_solver disponible (chargement différé) ✓")
+else:
+    print("[QuickWins] Module mod_solver non trouvé - Mode fallback")
+
+try:
+    from prism_catalog import get_prism_catalog, resolve_prism_data_dir, invalidate_prism_data_dir
+    QUICK_WINS_PRISM_CATALOG = True
+    print("[QuickWins] Module prism_catalog chargé ✓")
+except ImportError:
+    QUICK_WINS_PRISM_CATALOG = False
+    print("[QuickWins] Module prism_catalog non trouvé - Mode fallback")
+
+QUICK_WINS_SYNC_REPORT = quick_win_available('sync_report')
+if QUICK_WINS_SYNC_REPORT:
+    print("[QuickWins] Module sync_report disponible (chargement différé) ✓")
+else:
+    print("[QuickWins] Module sync_report non trouvé - Mode fallback")
+
+QUICK_WINS_FILE_HASH = quick_win_available('file_hash')
+if QUICK_WINS_FILE_HASH:
+    print("[QuickWins] Module file_hash disponible (chargement différé) ✓")
+else:
+    print("[QuickWins] Module file_hash non trouvé - Mode fallback")
 
 # === NETTOYAGE AUTOMATIQUE DES ANCIENS DOSSIERS TEMPORAIRES ===
 def cleanup_old_temp_folders():
@@ -222,8 +345,37 @@ def get_sorted_mc_versions():
         versions.insert(0, "1.20.1")
     return versions
 
+def find_installed_recommended_mods(mods_dir: Path) -> dict:
+    """
+    Repère les mods d'optimisation recommandés présents dans le dossier mods
+    Utilise les modId de l'index (mods.toml) et se rabat sur le nom de fichier
+    Retourne {pattern: nom_du_fichier} pour chaque mod recommandé trouvé
+    """
+    found = {}
+    try:
+        if QUICK_WINS_MOD_INDEX:
+            for meta in quick_win('mod_index').get_mod_index().scan(mods_dir):
+                for pattern in RECOMMENDED_OPTIMIZATION_MODS:
+                    if pattern not in found and (pattern in meta.mod_ids or pattern in meta.file_name.lower()):
+                        found[pattern] = meta.file_name
+        else:
+            for jar in Path(mods_dir).glob('*.jar'):
+                for pattern in RECOMMENDED_OPTIMIZATION_MODS:
+                    if pattern not in found and pattern in jar.name.lower():
+                        found[pattern] = jar.name
+    except Exception as e:
+        print(f"[Mods] Erreur detection des mods recommandes: {e}")
+    return found
+
 def detect_existing_prism_instances():
     """Détecte toutes les instances Prism existantes"""
+    # Catalogue en cache: seules les instances modifiées sont relues
+    if QUICK_WINS_PRISM_CATALOG:
+        try:
+            return get_prism_catalog().list_instances(resolve_prism_data_dir() / 'instances')
+        except Exception as e:
+            print(f"[Detection] Catalogue indisponible, scan complet: {e}")
+    
     prism_path = Path.home() / 'AppData' / 'Roaming' / 'PrismLauncher' / 'instances'
     
     if not prism_path.exists():
@@ -286,8 +438,9 @@ def detect_existing_prism_instances():
     
     return existing_instances
 
+@lru_cache(maxsize=1)
 def get_screen_resolution():
-    """Détecte la résolution de l'écran principal"""
+    """Détecte la résolution de l'écran principal (mémorisée pour le processus)"""
     try:
         if sys.platform == 'win32':
             import ctypes
@@ -301,13 +454,15 @@ def get_screen_resolution():
     except:
         return 1920, 1080  # Fallback par défaut
 
-def get_system_ram_mb():
-    """Détecte la RAM totale du système en MB"""
+def _probe_memory_mb():
+    """
+    Sonde la mémoire du système
+    Retourne (total, disponible, swap_total, swap_libre) en MB
+    """
     try:
         if sys.platform == 'win32':
             import ctypes
             kernel32 = ctypes.windll.kernel32
-            c_ulong = ctypes.c_ulong
             class MEMORYSTATUSEX(ctypes.Structure):
                 _fields_ = [
                     ("dwLength", ctypes.c_ulong),
@@ -323,26 +478,115 @@ def get_system_ram_mb():
             memStatus = MEMORYSTATUSEX()
             memStatus.dwLength = ctypes.sizeof(MEMORYSTATUSEX)
             kernel32.GlobalMemoryStatusEx(ctypes.byref(memStatus))
-            total_ram_gb = memStatus.ullTotalPhys / (1024**3)
-            return int(total_ram_gb * 1024)  # Convertir en MB
-        else:
-            # Linux/Mac - essayer psutil si disponible
+            mb = 1024 ** 2
+            total = int(memStatus.ullTotalPhys / mb)
+            available = int(memStatus.ullAvailPhys / mb)
+            # Le "page file" de Windows inclut la RAM physique
+            swap_total = max(0, int((memStatus.ullTotalPageFile - memStatus.ullTotalPhys) / mb))
+            swap_free = max(0, int((memStatus.ullAvailPageFile - memStatus.ullAvailPhys) / mb))
+            return total, available, swap_total, min(swap_free, swap_total)
+        
+        # Linux: /proc/meminfo est plus rapide qu'importer psutil
+        if sys.platform == 'linux':
             try:
-                import psutil
-                return int(psutil.virtual_memory().total / (1024**2))
-            except ImportError:
-                # Fallback: lire /proc/meminfo sur Linux
-                if sys.platform == 'linux':
-                    try:
-                        with open('/proc/meminfo', 'r') as f:
-                            for line in f:
-                                if line.startswith('MemTotal:'):
-                                    return int(line.split()[1]) // 1024  # Convertir de KB à MB
-                    except:
-                        pass
-                return 8192  # Fallback: 8GB
+                meminfo = {}
+                with open('/proc/meminfo', 'r') as f:
+                    for line in f:
+                        key, _, value = line.partition(':')
+                        meminfo[key] = int(value.split()[0]) // 1024  # KB -> MB
+                total = meminfo['MemTotal']
+                available = meminfo.get('MemAvailable', meminfo.get('MemFree', total // 2))
+                return total, available, meminfo.get('SwapTotal', 0), meminfo.get('SwapFree', 0)
+            except (OSError, KeyError, ValueError):
+                pass
+        
+        # Mac / autres - essayer psutil si disponible
+        try:
+            import psutil
+            vm = psutil.virtual_memory()
+            sw = psutil.swap_memory()
+            mb = 1024 ** 2
+            return int(vm.total / mb), int(vm.available / mb), int(sw.total / mb), int(sw.free / mb)
+        except ImportError:
+            pass
     except:
-        return 8192  # Fallback: 8GB par défaut
+        pass
+    return 8192, 4096, 0, 0  # Fallback: 8GB
+
+def _probe_gpu_vendor():
+    """Détecte le fabricant du GPU principal sans lancer de processus ('' si inconnu)"""
+    try:
+        if sys.platform == 'win32':
+            import winreg
+            key_path = r"SYSTEM\CurrentControlSet\Control\Class\{4d36e968-e325-11ce-bfc1-08002be10318}\0000"
+            with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, key_path) as key:
+                desc = winreg.QueryValueEx(key, 'DriverDesc')[0]
+                return str(desc)
+        if sys.platform == 'linux':
+            vendors = {'0x10de': 'NVIDIA', '0x1002': 'AMD', '0x8086': 'Intel'}
+            for vendor_file in sorted(glob.glob('/sys/class/drm/card[0-9]/device/vendor')):
+                with open(vendor_file, 'r') as f:
+                    vendor_id = f.read().strip()
+                if vendor_id in vendors:
+                    return vendors[vendor_id]
+    except Exception:
+        pass
+    return ''
+
+@dataclass
+class SystemProfile:
+    """Instantané des caractéristiques du PC, calculé une fois par processus"""
+    total_ram_mb: int
+    available_ram_mb: int
+    swap_total_mb: int
+    swap_free_mb: int
+    cpu_cores: int
+    gpu_vendor: str
+    screen_width: int
+    screen_height: int
+    
+    @property
+    def optimization_profile(self) -> str:
+        return get_optimization_profile(self.total_ram_mb)
+    
+    @classmethod
+    def probe(cls) -> 'SystemProfile':
+        total, available, swap_total, swap_free = _probe_memory_mb()
+        width, height = get_screen_resolution()
+        return cls(
+            total_ram_mb=total,
+            available_ram_mb=available,
+            swap_total_mb=swap_total,
+            swap_free_mb=swap_free,
+            cpu_cores=os.cpu_count() or 2,
+            gpu_vendor=_probe_gpu_vendor(),
+            screen_width=width,
+            screen_height=height
+        )
+
+_system_profile: Optional[SystemProfile] = None
+
+def get_system_profile(refresh: bool = False) -> SystemProfile:
+    """
+    Retourne l'instantané système (mémorisé)
+    refresh=True re-sonde la mémoire (la RAM disponible change pendant la session)
+    """
+    global _system_profile
+    if _system_profile is None:
+        _system_profile = SystemProfile.probe()
+        print(f"[System] RAM {_system_profile.total_ram_mb}MB (dispo {_system_profile.available_ram_mb}MB), "
+              f"{_system_profile.cpu_cores} coeurs, GPU: {_system_profile.gpu_vendor or 'inconnu'}")
+    elif refresh:
+        total, available, swap_total, swap_free = _probe_memory_mb()
+        _system_profile.total_ram_mb = total
+        _system_profile.available_ram_mb = available
+        _system_profile.swap_total_mb = swap_total
+        _system_profile.swap_free_mb = swap_free
+    return _system_profile
+
+def get_system_ram_mb():
+    """Détecte la RAM totale du système en MB"""
+    return get_system_profile().total_ram_mb
 
 def get_optimization_profile(ram_mb: int):
     """Détermine le profil d'optimisation basé sur la RAM disponible"""
@@ -461,29 +705,227 @@ def get_optimized_minecraft_options(profile: str):
             'music': 1.0
         }
 
-def get_optimized_ram_settings(profile: str, total_ram_mb: int):
-    """Retourne les paramètres RAM optimisés selon le profil"""
+def cap_heap_to_available_ram(ram_max: int, available_ram_mb: Optional[int], floor_mb: int = 1024):
+    """
+    Limite le heap à la RAM réellement libre (moins une réserve pour Prism et le système)
+    pour éviter que le jeu ne pagine; ne descend jamais sous floor_mb
+    """
+    if available_ram_mb is None:
+        return ram_max
+    headroom = available_ram_mb - 768
+    return max(min(ram_max, headroom), min(ram_max, floor_mb))
+
+def get_optimized_ram_settings(profile: str, total_ram_mb: int, available_ram_mb: Optional[int] = None):
+    """Retourne les paramètres RAM optimisés selon le profil (et la RAM libre si fournie)"""
     if profile == "low_end":
         # Pour petits PC: utiliser 30-40% de la RAM disponible, max 1.5GB (optimisé pour beaucoup de mods)
-        ram_max = min(int(total_ram_mb * 0.4), 1536)
-        ram_min = max(int(ram_max * 0.6), 768)
+        ram_max = cap_heap_to_available_ram(min(int(total_ram_mb * 0.4), 1536), available_ram_mb, 768)
+        ram_min = min(max(int(ram_max * 0.6), 768), ram_max)
         return ram_min, ram_max
     elif profile == "medium":
         # Pour PC moyens: utiliser 40-50% de la RAM disponible, max 2.5GB (optimisé pour beaucoup de mods)
-        ram_max = min(int(total_ram_mb * 0.5), 2560)
-        ram_min = max(int(ram_max * 0.6), 1024)
+        ram_max = cap_heap_to_available_ram(min(int(total_ram_mb * 0.5), 2560), available_ram_mb)
+        ram_min = min(max(int(ram_max * 0.6), 1024), ram_max)
         return ram_min, ram_max
     else:  # high
         # Pour PC performants: utiliser 50-60% de la RAM disponible, max 4GB (pour beaucoup de mods)
-        ram_max = min(int(total_ram_mb * 0.6), 4096)
-        ram_min = max(int(ram_max * 0.6), 2048)
+        ram_max = cap_heap_to_available_ram(min(int(total_ram_mb * 0.6), 4096), available_ram_mb)
+        ram_min = min(max(int(ram_max * 0.6), 2048), ram_max)
         return ram_min, ram_max
 
+@dataclass
+class HeapPlan:
+    """Décision de dimensionnement du heap prise au moment du lancement"""
+    xms: int
+    xmx: int
+    estimated_need_mb: int
+    reasons: list
+
+def estimate_modpack_heap_mb(mods_dir: Path):
+    """
+    Estime le heap nécessaire au modpack à partir du nombre et de la taille des jars
+    Retourne (besoin_mb, nombre_de_mods, taille_totale_mb)
+    """
+    mod_count = 0
+    total_bytes = 0
+    try:
+        for entry in os.scandir(mods_dir):
+            if entry.is_file() and entry.name.lower().endswith('.jar'):
+                mod_count += 1
+                total_bytes += entry.stat().st_size
+    except OSError:
+        pass
+    jars_mb = total_bytes // (1024 * 1024)
+    # Base Forge 1.20.1 (~1GB) + coût moyen par mod + classes/ressources décompressées
+    need = 1024 + mod_count * 8 + int(jars_mb * 1.5)
+    return need, mod_count, jars_mb
+
+def plan_launch_heap(ram_min: int, ram_max: int, mods_dir: Path, system: SystemProfile) -> HeapPlan:
+    """
+    Choisit Xms/Xmx au moment du clic sur Jouer pour éviter la pagination:
+    la valeur configurée est un plafond, réduit selon la RAM libre et la pression sur le swap
+    """
+    reasons = []
+    need, mod_count, jars_mb = estimate_modpack_heap_mb(mods_dir)
+    reasons.append(f"modpack: {mod_count} mods ({jars_mb}MB de jars) -> besoin estime {need}MB")
+    
+    # Réserve pour Windows, Prism et la mémoire native de la JVM (métaspace, threads, GPU)
+    reserve = 768 + min(1024, mod_count * 2)
+    budget = system.available_ram_mb - reserve
+    reasons.append(f"RAM libre {system.available_ram_mb}MB - reserve {reserve}MB = budget {budget}MB")
+    
+    if system.swap_total_mb > 0:
+        swap_used_ratio = 1 - system.swap_free_mb / system.swap_total_mb
+        if swap_used_ratio > 0.5:
+            budget = int(budget * 0.85)
+            reasons.append(f"swap utilise a {swap_used_ratio:.0%} -> budget reduit a {budget}MB")
+    
+    xmx = ram_max
+    if xmx > budget:
+        # Le plancher de 1024MB ne dépasse jamais la valeur configurée (plafond)
+        xmx = min(ram_max, max(budget, 1024))
+        reasons.append(f"Xmx configure {ram_max}MB > budget -> {xmx}MB")
+    else:
+        reasons.append(f"Xmx configure {ram_max}MB conserve (tient dans la RAM libre)")
+    if xmx < need:
+        reasons.append(f"attention: Xmx {xmx}MB < besoin estime {need}MB, fermez des applications")
+    
+    xms = min(ram_min, xmx)
+    if xms != ram_min:
+        reasons.append(f"Xms ramene de {ram_min}MB a {xms}MB")
+    return HeapPlan(xms=xms, xmx=xmx, estimated_need_mb=need, reasons=reasons)
+
 # Fichiers de config
 CONFIG_FILE = Path.home() / ".illama_launcher_config.json"
 AUTH_FILE = Path.home() / ".illama_launcher_auth.json"
 LOCK_FILE = Path.home() / ".illama_launcher.lock"
 
+# ============================================================
+# PERSISTANCE DE LA CONFIGURATION
+# ============================================================
+
+CONFIG_SAVE_DELAY_S = 1.0  # Fenêtre de regroupement des écritures
+
+
+class ConfigStore:
+    """
+    Config en mémoire avec écritures regroupées et atomiques
+    
+    save() ne fait que programmer une écriture: toutes les demandes reçues
+    pendant CONFIG_SAVE_DELAY_S donnent un seul fichier écrit, et seulement
+    si des clés ont changé depuis la dernière écriture (fichier temporaire
+    puis os.replace). flush() écrit tout de suite (fermeture, CLI).
+    """
+    
+    def __init__(self, config_file: Path = CONFIG_FILE, delay_s: float = CONFIG_SAVE_DELAY_S):
+        self.config_file = config_file
+        self.delay_s = delay_s
+        self.data = {}
+        self._lock = threading.Lock()
+        self._persisted = {}  # clé -> valeur encodée en JSON lors de la dernière écriture
+        self._timer = None
+        # Mesures
+        self.save_requests = 0
+        self.writes = 0
+    
+    def read(self) -> dict:
+        """Contenu actuel du fichier, sans modifier la config en mémoire"""
+        try:
+            with open(self.config_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+    
+    def load(self, defaults: dict) -> dict:
+        """Charge le fichier par-dessus les valeurs par défaut et retourne le dict partagé"""
+        stored = self.read()
+        with self._lock:
+            self.data = {**defaults, **stored}
+            self._persisted = {key: self._encode(value) for key, value in stored.items()}
+        return self.data
+    
+    def bind(self, data: dict) -> dict:
+        """Utilise ce dict comme config courante (les appelants gardent la même référence)"""
+        with self._lock:
+            self.data = data
+        return data
+    
+    @staticmethod
+    def _encode(value) -> str:
+        return json.dumps(value, sort_keys=True)
+    
+    def dirty_keys(self) -> list:
+        """Clés modifiées (ou supprimées) depuis la dernière écriture"""
+        with self._lock:
+            return sorted(self._diff(dict(self.data)))
+    
+    def _diff(self, snapshot: dict) -> dict:
+        """clé -> nouvelle valeur encodée (None si supprimée), à appeler sous le verrou"""
+        changed = {}
+        for key, value in snapshot.items():
+            encoded = self._encode(value)
+            if self._persisted.get(key) != encoded:
+                changed[key] = encoded
+        for key in self._persisted:
+            if key not in snapshot:
+                changed[key] = None
+        return changed
+    
+    def save(self):
+        """Programme une écriture (regroupée avec les demandes suivantes)"""
+        with self._lock:
+            self.save_requests += 1
+            if self._timer is not None:
+                return
+            self._timer = threading.Timer(self.delay_s, self.flush)
+            self._timer.daemon = True
+            self._timer.start()
+    
+    def flush(self) -> bool:
+        """
+        Écrit la config maintenant si des clés ont changé
+        
+        Returns:
+            True si le fichier a été écrit
+        """
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            snapshot = dict(self.data)
+            try:
+                dirty = self._diff(snapshot)
+                if not dirty:
+                    return False
+                self.config_file.parent.mkdir(parents=True, exist_ok=True)
+                tmp_file = self.config_file.with_suffix('.tmp')
+                with open(tmp_file, 'w', encoding='utf-8') as f:
+                    json.dump(snapshot, f, indent=2)
+                os.replace(tmp_file, self.config_file)
+            except (OSError, TypeError, ValueError) as e:
+                print(f"[Config] Impossible d'enregistrer la config: {e}")
+                return False
+            for key, encoded in dirty.items():
+                if encoded is None:
+                    self._persisted.pop(key, None)
+                else:
+                    self._persisted[key] = encoded
+            self.writes += 1
+            return True
+
+
+_config_store: Optional[ConfigStore] = None
+
+
+def get_config_store() -> ConfigStore:
+    """Retourne le ConfigStore du launcher (singleton, écrit aussi à la sortie du processus)"""
+    global _config_store
+    if _config_store is None:
+        _config_store = ConfigStore()
+        import atexit
+        atexit.register(_config_store.flush)
+    return _config_store
+
 # ============================================================
 # GESTION DES INSTANCES UNIQUES
 # ============================================================
@@ -609,6 +1051,9 @@ DEFAULT_CONFIG = {
     "borderless": True,  # Activé par défaut
     "java_path": "java",
     "jvm_args": "",
+    "appcds_enabled": True,  # Archive CDS par (JVM, Forge, mods) pour accélérer le démarrage
+    "adaptive_heap": True,  # Réduire Xmx au lancement si la RAM libre ne suffit pas
+    "preflight_check": True,  # Vérifier dépendances/versions des mods avant de lancer
     "show_console": False,
     "auto_connect": True,
     "keep_launcher_open": False,
@@ -663,7 +1108,7 @@ def create_modern_frame(parent, **kwargs):
                     highlightthickness=1, **kwargs)
     return frame
 
-class ScrollableFrame(ttk.Frame):
+class ScrollableFrame(ttk.Frame if ttk else object):
     """Frame avec scrollbar fonctionnel et animations fluides"""
     def __init__(self, container, *args, **kwargs):
         super().__init__(container, *args, **kwargs)
@@ -738,7 +1183,233 @@ class ScrollableFrame(ttk.Frame):
         scroll_step()
 
 
-class AnimatedButton(tk.Canvas):
+# ============================================================
+# ANIMATIONS
+# ============================================================
+
+ANIMATION_FRAME_MS = 16  # ~60 FPS
+COLOR_RAMP_STEPS = 64
+
+
+def interpolate_color(color1: str, color2: str, factor: float) -> str:
+    """Interpole entre deux couleurs hex"""
+    def hex_to_rgb(hex_color):
+        hex_color = hex_color.lstrip('#')
+        return tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
+    
+    rgb1 = hex_to_rgb(color1)
+    rgb2 = hex_to_rgb(color2)
+    rgb = tuple(rgb1[i] + (rgb2[i] - rgb1[i]) * factor for i in range(3))
+    return '#{:02x}{:02x}{:02x}'.format(int(rgb[0]), int(rgb[1]), int(rgb[2]))
+
+
+@lru_cache(maxsize=None)
+def color_ramp(color1: str, color2: str, steps: int = COLOR_RAMP_STEPS) -> tuple:
+    """Dégradé précalculé de color1 à color2 (partagé par tous les widgets)"""
+    return tuple(interpolate_color(color1, color2, i / (steps - 1)) for i in range(steps))
+
+
+def ramp_color(color1: str, color2: str, factor: float) -> str:
+    """Couleur du dégradé précalculé la plus proche de factor (0.0 à 1.0)"""
+    ramp = color_ramp(color1, color2)
+    index = int(round(max(0.0, min(1.0, factor)) * (len(ramp) - 1)))
+    return ramp[index]
+
+
+class AnimationScheduler:
+    """
+    Boucle d'animation partagée par les widgets d'une fenêtre Tk
+    
+    Ne tourne que tant qu'au moins un widget est en transition: au repos
+    (ou fenêtre minimisée pendant le jeu) aucun callback Tk n'est programmé.
+    Un widget s'inscrit avec start(widget); son _step() retourne False
+    quand sa transition est terminée.
+    """
+    
+    def __init__(self, root):
+        self.root = root
+        self.active = []
+        self.job = None
+    
+    def start(self, widget):
+        """Inscrit un widget (sans effet s'il est déjà en cours d'animation)"""
+        if widget not in self.active:
+            self.active.append(widget)
+        if self.job is None:
+            self.job = self.root.after(ANIMATION_FRAME_MS, self._tick)
+    
+    def _tick(self):
+        self.job = None
+        still_active = []
+        for widget in self.active:
+            try:
+                if widget.winfo_exists() and widget._step():
+                    still_active.append(widget)
+            except tk.TclError:
+                # Widget détruit pendant la transition
+                pass
+        self.active = still_active
+        if self.active:
+            self.job = self.root.after(ANIMATION_FRAME_MS, self._tick)
+
+
+def get_animation_scheduler(widget) -> AnimationScheduler:
+    """Retourne la boucle d'animation de la fenêtre Tk du widget (créée au besoin)"""
+    root = widget._root()
+    scheduler = getattr(root, '_illama_animations', None)
+    if scheduler is None:
+        scheduler = AnimationScheduler(root)
+        root._illama_animations = scheduler
+    return scheduler
+
+
+# ============================================================
+# FILE DE MESSAGES VERS LE THREAD TK
+# ============================================================
+
+UI_DRAIN_MS = 16  # Fenêtre de regroupement des messages avant vidage
+UI_WAKE_EVENT = '<<IllamaUiPost>>'
+
+
+class UiDispatcher:
+    """
+    File de messages des threads de travail vers le thread Tk
+    
+    Les threads n'appellent jamais Tk: post() ajoute un callable dans une file
+    protégée par un verrou, vidée sur le thread Tk en un seul tick after().
+    Un message avec une clé remplace celui de même clé encore en attente
+    (progression, statut...): seul le dernier état est affiché.
+    
+    Aucun tick au repos: seul le passage de la file de vide à non vide réveille
+    le thread Tk (événement virtuel), et le vidage s'arrête dès que la file est vide.
+    """
+    
+    def __init__(self, root):
+        self.root = root
+        self.thread_id = threading.get_ident()
+        self._lock = threading.Lock()
+        self._pending = {}  # clé -> (callback, heure de dépôt), dans l'ordre de dépôt
+        self._counter = 0
+        self._job = None
+        self._armed = False  # Un vidage est déjà programmé ou demandé
+        # Mesures
+        self.posted = 0
+        self.coalesced = 0
+        self.drained = 0
+        self.last_latency_ms = 0.0
+        self.max_latency_ms = 0.0
+        self._latency_total_ms = 0.0
+        root.bind(UI_WAKE_EVENT, lambda event: self._schedule(UI_DRAIN_MS), add='+')
+    
+    def on_ui_thread(self) -> bool:
+        return threading.get_ident() == self.thread_id
+    
+    def post(self, callback: Callable, key: Optional[str] = None):
+        """
+        Dépose un callable à exécuter sur le thread Tk (appelable depuis n'importe quel thread)
+        
+        Args:
+            callback: Fonction sans argument
+            key: Si fournie, remplace le message de même clé encore en attente
+        """
+        with self._lock:
+            self.posted += 1
+            if key is None:
+                self._counter += 1
+                token = self._counter
+            else:
+                token = ('key', key)
+            previous = self._pending.get(token)
+            if previous is not None:
+                self.coalesced += 1
+                # Garde la place et l'heure du premier message: la latence reste honnête
+                self._pending[token] = (callback, previous[1])
+            else:
+                self._pending[token] = (callback, time.perf_counter())
+            wake = not self._armed
+            self._armed = True
+        if wake:
+            self._wake()
+    
+    def _wake(self):
+        """Programme un vidage (après un passage de la file de vide à non vide)"""
+        if self.on_ui_thread():
+            self._schedule(UI_DRAIN_MS)
+            return
+        try:
+            # event_generate est le seul appel Tk sûr depuis un autre thread
+            self.root.event_generate(UI_WAKE_EVENT, when='tail')
+        except (tk.TclError, RuntimeError):
+            # Boucle Tk pas encore démarrée: after() depuis ce thread en dernier recours
+            try:
+                self.root.after(UI_DRAIN_MS, self._drain)
+            except (tk.TclError, RuntimeError):
+                with self._lock:
+                    self._armed = False
+    
+    def call(self, callback: Callable, key: Optional[str] = None):
+        """Exécute tout de suite sur le thread Tk, sinon dépose dans la file"""
+        if self.on_ui_thread():
+            callback()
+        else:
+            self.post(callback, key)
+    
+    def _schedule(self, delay_ms: int):
+        if self._job is not None:
+            return
+        try:
+            self._job = self.root.after(delay_ms, self._drain)
+        except tk.TclError:
+            # Fenêtre détruite
+            self._job = None
+    
+    def _drain(self):
+        self._job = None
+        with self._lock:
+            batch = self._pending
+            self._pending = {}
+        
+        now = time.perf_counter()
+        for callback, posted_at in batch.values():
+            latency_ms = (now - posted_at) * 1000
+            self.last_latency_ms = latency_ms
+            self.max_latency_ms = max(self.max_latency_ms, latency_ms)
+            self._latency_total_ms += latency_ms
+            self.drained += 1
+            try:
+                callback()
+            except Exception as e:
+                print(f"[UI] Erreur dans un message: {e}")
+        
+        # Continuer tant que des messages arrivent, s'arrêter dès que la file est vide
+        with self._lock:
+            more = bool(self._pending)
+            self._armed = more
+        if more:
+            self._schedule(UI_DRAIN_MS)
+    
+    def stats(self) -> dict:
+        """Compteurs et latence de vidage (dépôt -> exécution sur le thread Tk)"""
+        return {
+            'posted': self.posted,
+            'coalesced': self.coalesced,
+            'drained': self.drained,
+            'last_latency_ms': round(self.last_latency_ms, 1),
+            'max_latency_ms': round(self.max_latency_ms, 1),
+            'avg_latency_ms': round(self._latency_total_ms / self.drained, 1) if self.drained else 0.0,
+        }
+
+
+def get_ui_dispatcher(root) -> UiDispatcher:
+    """Retourne la file de messages de la fenêtre Tk (créée au besoin, depuis le thread Tk)"""
+    dispatcher = getattr(root, '_illama_ui', None)
+    if dispatcher is None:
+        dispatcher = UiDispatcher(root)
+        root._illama_ui = dispatcher
+    return dispatcher
+
+
+class AnimatedButton(tk.Canvas if tk else object):
     """Bouton animé moderne avec transitions fluides"""
     def __init__(self, parent, text, command, color='green', width=200, height=50, **kwargs):
         super().__init__(parent, width=width, height=height, highlightthickness=0, 
@@ -748,7 +1419,6 @@ class AnimatedButton(tk.Canvas):
         self.text = text
         self.width = width
         self.height = height
-        self.animation_id = None
         self.is_hovered = False
         self.is_pressed = False
         self.enabled = True
@@ -783,30 +1453,47 @@ class AnimatedButton(tk.Canvas):
         self.current_color = self.color_normal
         self.target_color = self.color_normal
         
+        self._drawn_state = None
+        self._create_items()
         self.draw()
-        self._animate()
         
         self.bind('<Enter>', self.on_enter)
         self.bind('<Leave>', self.on_leave)
         self.bind('<ButtonPress-1>', self.on_press)
         self.bind('<ButtonRelease-1>', self.on_release)
     
-    def _interpolate_color(self, color1, color2, factor):
-        """Interpole entre deux couleurs hex"""
-        def hex_to_rgb(hex_color):
-            hex_color = hex_color.lstrip('#')
-            return tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
-        
-        def rgb_to_hex(rgb):
-            return '#{:02x}{:02x}{:02x}'.format(int(rgb[0]), int(rgb[1]), int(rgb[2]))
+    def _create_items(self):
+        """Crée une fois les éléments du canvas; draw() ne fait ensuite que les modifier"""
+        # Ombre portée moderne (couleurs fixes, calculées une seule fois)
+        shadow_offset = 3
+        shadow_blur = 2
+        for i in range(shadow_blur):
+            alpha = 0.1 - (i * 0.03)
+            shadow_color = interpolate_color(COLORS['bg_dark'], '#000000', alpha)
+            self.create_rectangle(
+                shadow_offset + i, shadow_offset + i,
+                self.width - shadow_offset + i, self.height - shadow_offset + i,
+                fill=shadow_color, outline='', width=0
+            )
         
-        rgb1 = hex_to_rgb(color1)
-        rgb2 = hex_to_rgb(color2)
-        rgb = tuple(rgb1[i] + (rgb2[i] - rgb1[i]) * factor for i in range(3))
-        return rgb_to_hex(rgb)
+        # Glow effect (caché tant que l'opacité est nulle)
+        self.glow_item = self.create_rectangle(-2, -2, self.width+2, self.height+2,
+                                               outline='', width=0, state='hidden')
+        # Bouton principal
+        self.body_item = self.create_rectangle(2, 2, self.width-2, self.height-2, width=2)
+        # Texte avec ombre légère
+        self.text_shadow_item = self.create_text(
+            self.width//2 + 1, self.height//2 + 1,
+            text=self.text, fill='#000000', font=('Segoe UI', 12, 'bold'),
+            state='disabled'
+        )
+        self.text_item = self.create_text(
+            self.width//2, self.height//2,
+            text=self.text, font=('Segoe UI', 12, 'bold')
+        )
     
-    def _animate(self):
-        """Animation continue pour transitions fluides"""
+    def _step(self):
+        """Avance la transition d'une image; retourne False quand elle est terminée"""
         if self.anim_direction != 0:
             self.anim_progress += self.anim_direction * self.anim_speed
             if self.anim_progress <= 0:
@@ -817,12 +1504,9 @@ class AnimatedButton(tk.Canvas):
                 self.anim_direction = 0
             
             self.draw()
-        
-        self.animation_id = self.after(16, self._animate)  # ~60 FPS
+        return self.anim_direction != 0
     
     def draw(self):
-        self.delete("all")
-        
         if not self.enabled:
             color = COLORS['bg_light']
             border = COLORS['bg_medium']
@@ -833,68 +1517,50 @@ class AnimatedButton(tk.Canvas):
             glow_opacity = 0.3
         elif self.is_hovered:
             # Interpolation fluide pour le hover
-            color = self._interpolate_color(self.color_normal, self.color_hover, self.anim_progress)
+            color = ramp_color(self.color_normal, self.color_hover, self.anim_progress)
             border = self.color_glow
             glow_opacity = self.anim_progress * 0.2
         else:
-            color = self._interpolate_color(self.color_hover, self.color_normal, 1 - self.anim_progress)
+            color = ramp_color(self.color_hover, self.color_normal, 1 - self.anim_progress)
             border = COLORS['border']
             glow_opacity = 0
         
-        # Ombre portée moderne
-        shadow_offset = 3
-        shadow_blur = 2
-        for i in range(shadow_blur):
-            alpha = 0.1 - (i * 0.03)
-            shadow_color = self._interpolate_color(COLORS['bg_dark'], '#000000', alpha)
-            self.create_rectangle(
-                shadow_offset + i, shadow_offset + i,
-                self.width - shadow_offset + i, self.height - shadow_offset + i,
-                fill=shadow_color, outline='', width=0
-            )
+        # Rien à envoyer à Tk si l'image est identique à la précédente
+        offset = 2 if self.is_pressed else 0
+        state = (color, border, glow_opacity, offset, self.enabled)
+        if state == self._drawn_state:
+            return
+        self._drawn_state = state
         
         # Glow effect
         if glow_opacity > 0:
-            glow_color = self._interpolate_color(COLORS['bg_dark'], self.color_glow, glow_opacity)
-            self.create_rectangle(-2, -2, self.width+2, self.height+2,
-                                fill=glow_color, outline='', width=0)
+            glow_color = ramp_color(COLORS['bg_dark'], self.color_glow, glow_opacity)
+            self.itemconfig(self.glow_item, fill=glow_color, state='normal')
+        else:
+            self.itemconfig(self.glow_item, state='hidden')
         
         # Bouton principal avec coins arrondis (simulés)
-        offset = 2 if self.is_pressed else 0
-        radius = 6
-        
-        # Rectangle principal
-        self.create_rectangle(
-            2+offset, 2+offset,
-            self.width-2+offset, self.height-2+offset,
-            fill=color, outline=border, width=2
-        )
+        self.coords(self.body_item, 2+offset, 2+offset, self.width-2+offset, self.height-2+offset)
+        self.itemconfig(self.body_item, fill=color, outline=border)
         
-        # Texte avec ombre légère
         text_color = COLORS['text_white'] if self.enabled else COLORS['text_muted']
-        # Ombre du texte
-        self.create_text(
-            self.width//2 + offset + 1, self.height//2 + offset + 1,
-            text=self.text, fill='#000000', font=('Segoe UI', 12, 'bold'),
-            state='disabled'
-        )
-        # Texte principal
-        self.create_text(
-            self.width//2 + offset, self.height//2 + offset,
-            text=self.text, fill=text_color, font=('Segoe UI', 12, 'bold')
-        )
+        self.coords(self.text_shadow_item, self.width//2 + offset + 1, self.height//2 + offset + 1)
+        self.coords(self.text_item, self.width//2 + offset, self.height//2 + offset)
+        self.itemconfig(self.text_item, fill=text_color)
     
     def on_enter(self, event):
         if self.enabled:
             self.is_hovered = True
             self.anim_direction = 1
             self.target_color = self.color_hover
+            get_animation_scheduler(self).start(self)
     
     def on_leave(self, event):
         self.is_hovered = False
         self.is_pressed = False
         self.anim_direction = -1
         self.target_color = self.color_normal
+        get_animation_scheduler(self).start(self)
     
     def on_press(self, event):
         if self.enabled:
@@ -914,11 +1580,14 @@ class AnimatedButton(tk.Canvas):
     
     def set_text(self, text):
         self.text = text
-        self.draw()
+        self.itemconfig(self.text_shadow_item, text=text)
+        self.itemconfig(self.text_item, text=text)
 
 
-class ProgressBarMC(tk.Canvas):
+class ProgressBarMC(tk.Canvas if tk else object):
     """Barre de progression moderne avec animations fluides"""
+    GRADIENT_STEPS = 3
+    
     def __init__(self, parent, width=300, height=20, **kwargs):
         super().__init__(parent, width=width, height=height, highlightthickness=0,
                         bg=COLORS['bg_dark'], **kwargs)
@@ -927,24 +1596,12 @@ class ProgressBarMC(tk.Canvas):
         self.progress = 0
         self.target_progress = 0
         self.animating = False
+        self._drawn_text = None
+        self._create_items()
         self.draw()
-        self._animate()
-    
-    def _animate(self):
-        """Animation fluide de la barre de progression"""
-        if abs(self.progress - self.target_progress) > 0.5:
-            diff = self.target_progress - self.progress
-            self.progress += diff * 0.1  # Interpolation fluide
-            self.draw()
-        else:
-            self.progress = self.target_progress
-            self.animating = False
-        
-        self.after(16, self._animate)  # ~60 FPS
     
-    def draw(self):
-        self.delete("all")
-        
+    def _create_items(self):
+        """Crée une fois les éléments du canvas; draw() ne fait ensuite que les déplacer"""
         # Ombre de la barre
         self.create_rectangle(2, 2, self.width, self.height + 2, 
                             fill=COLORS['bg_dark'], outline='', width=0)
@@ -953,58 +1610,122 @@ class ProgressBarMC(tk.Canvas):
         self.create_rectangle(0, 0, self.width, self.height, 
                             fill=COLORS['bg_medium'], outline=COLORS['border'], width=1)
         
-        # Barre de progression avec dégradé simulé
+        # Barre de progression avec dégradé simulé (plusieurs rectangles)
+        self.gradient_items = []
+        for i in range(self.GRADIENT_STEPS):
+            # Interpolation de couleur pour dégradé
+            factor = i / self.GRADIENT_STEPS
+            color = interpolate_color(
+                COLORS['accent_green_pressed'],
+                COLORS['accent_green'],
+                factor
+            )
+            self.gradient_items.append(self.create_rectangle(
+                2, 2, 2, self.height - 2, fill=color, outline='', width=0, state='hidden'))
+        
+        # Lueur en haut de la barre
+        self.glow_item = self.create_line(2, 2, 2, 2, fill=COLORS['accent_green_hover'],
+                                          width=1, state='hidden')
+        
+        # Texte avec ombre
+        self.text_shadow_item = self.create_text(self.width//2 + 1, self.height//2 + 1, 
+                                                 text="0%", fill='#000000', 
+                                                 font=('Segoe UI', 9, 'bold'), state='disabled')
+        self.text_item = self.create_text(self.width//2, self.height//2, 
+                                          text="0%", fill=COLORS['text_white'], 
+                                          font=('Segoe UI', 9, 'bold'))
+    
+    def _step(self):
+        """Animation fluide de la barre; retourne False une fois la cible atteinte"""
+        if abs(self.progress - self.target_progress) > 0.5:
+            diff = self.target_progress - self.progress
+            self.progress += diff * 0.1  # Interpolation fluide
+            self.draw()
+            return True
+        self.progress = self.target_progress
+        self.animating = False
+        self.draw()
+        return False
+    
+    def draw(self):
         if self.progress > 0:
             pw = int((self.width - 4) * (self.progress / 100))
-            
-            # Dégradé (simulé avec plusieurs rectangles)
-            gradient_steps = 3
-            step_width = pw // gradient_steps
-            for i in range(gradient_steps):
+            step_width = pw // self.GRADIENT_STEPS
+            for i, item in enumerate(self.gradient_items):
                 x1 = 2 + (i * step_width)
-                x2 = 2 + ((i + 1) * step_width) if i < gradient_steps - 1 else 2 + pw
-                
-                # Interpolation de couleur pour dégradé
-                factor = i / gradient_steps
-                color = self._interpolate_color(
-                    COLORS['accent_green_pressed'],
-                    COLORS['accent_green'],
-                    factor
-                )
-                
-                self.create_rectangle(x1, 2, x2, self.height - 2,
-                                    fill=color, outline='', width=0)
-            
-            # Lueur en haut de la barre
-            self.create_line(2, 2, 2 + pw, 2,
-                           fill=COLORS['accent_green_hover'], width=1)
+                x2 = 2 + ((i + 1) * step_width) if i < self.GRADIENT_STEPS - 1 else 2 + pw
+                self.coords(item, x1, 2, x2, self.height - 2)
+                self.itemconfig(item, state='normal')
+            self.coords(self.glow_item, 2, 2, 2 + pw, 2)
+            self.itemconfig(self.glow_item, state='normal')
+        else:
+            for item in self.gradient_items:
+                self.itemconfig(item, state='hidden')
+            self.itemconfig(self.glow_item, state='hidden')
         
-        # Texte avec ombre
         text = f"{int(self.progress)}%"
-        self.create_text(self.width//2 + 1, self.height//2 + 1, 
-                        text=text, fill='#000000', 
-                        font=('Segoe UI', 9, 'bold'), state='disabled')
-        self.create_text(self.width//2, self.height//2, 
-                        text=text, fill=COLORS['text_white'], 
-                        font=('Segoe UI', 9, 'bold'))
-    
-    def _interpolate_color(self, color1, color2, factor):
-        """Interpole entre deux couleurs hex"""
-        def hex_to_rgb(hex_color):
-            hex_color = hex_color.lstrip('#')
-            return tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
-        
-        def rgb_to_hex(rgb):
-            return '#{:02x}{:02x}{:02x}'.format(int(rgb[0]), int(rgb[1]), int(rgb[2]))
-        
-        rgb1 = hex_to_rgb(color1)
-        rgb2 = hex_to_rgb(color2)
-        rgb = tuple(rgb1[i] + (rgb2[i] - rgb1[i]) * factor for i in range(3))
-        return rgb_to_hex(rgb)
+        if text != self._drawn_text:
+            self._drawn_text = text
+            self.itemconfig(self.text_shadow_item, text=text)
+            self.itemconfig(self.text_item, text=text)
     
     def set_progress(self, value):
         self.target_progress = max(0, min(100, value))
         self.animating = True
+        get_animation_scheduler(self).start(self)
+
+
+class LogConsole:
+    """
+    Journal affiché dans un Text, borné à max_lines lignes
+    
+    Les messages sont mis en file et insérés en un seul insert par image;
+    les lignes les plus anciennes sont supprimées par blocs, pas une à une.
+    """
+    
+    def __init__(self, text_widget, max_lines: int = 5000, trim_slack: int = 500):
+        self.text = text_widget
+        self.max_lines = max_lines
+        self.trim_slack = trim_slack
+        self.history = deque(maxlen=max_lines)  # Ring buffer des dernières lignes
+        self.pending = deque()
+        self.widget_lines = 0
+        self.flush_job = None
+    
+    def write(self, line: str):
+        """Met une ligne en file; elle sera affichée à la prochaine image"""
+        self.history.append(line)
+        self.pending.append(line)
+        if self.flush_job is None:
+            self.flush_job = self.text.after(ANIMATION_FRAME_MS, self.flush)
+    
+    def flush(self):
+        """Insère les lignes en attente en une fois puis coupe le début si besoin"""
+        self.flush_job = None
+        if not self.pending:
+            return
+        lines = []
+        while self.pending:
+            lines.append(self.pending.popleft())
+        # Inutile d'insérer ce qui serait coupé aussitôt
+        lines = lines[-self.max_lines:]
+        
+        try:
+            self.text.insert('end', "\n".join(lines) + "\n")
+            # Un message peut contenir plusieurs lignes (traceback, rapport de preflight)
+            self.widget_lines += sum(line.count('\n') + 1 for line in lines)
+            if self.widget_lines > self.max_lines + self.trim_slack:
+                excess = self.widget_lines - self.max_lines
+                self.text.delete('1.0', f'{excess + 1}.0')
+                self.widget_lines -= excess
+            self.text.see('end')
+        except tk.TclError:
+            # Fenêtre fermée
+            pass
+    
+    def get_text(self) -> str:
+        """Contenu du journal (dernières max_lines lignes)"""
+        return "\n".join(self.history)
 
 
 # ============================================================
@@ -1017,18 +1738,29 @@ class SystemTray:
         self.root = root
         self.on_quit = on_quit
         self.on_show = on_show
+        # Les callbacks pystray arrivent sur son propre thread
+        self.ui = get_ui_dispatcher(root)
         self.icon = None
-        self.tray_available = False
-        
-        try:
-            import pystray
-            from PIL import Image
-            self.pystray = pystray
-            self.PIL_Image = Image
-            self.tray_available = True
-        except ImportError:
+        self.pystray = None
+        self.PIL_Image = None
+        # pystray et PIL ne sont importés qu'au setup() (différé après l'affichage)
+        self.tray_available = quick_win_available('pystray') and quick_win_available('PIL')
+        if not self.tray_available:
             print("[Tray] pystray ou PIL non disponible")
     
+    def _load(self) -> bool:
+        """Importe pystray et PIL à la première utilisation"""
+        if self.pystray is None:
+            try:
+                import pystray
+                from PIL import Image
+                self.pystray = pystray
+                self.PIL_Image = Image
+            except ImportError:
+                print("[Tray] pystray ou PIL non disponible")
+                self.tray_available = False
+        return self.tray_available
+    
     def create_image(self):
         """Crée l'icône pour le tray"""
         # Créer une image simple 64x64 (Creeper face)
@@ -1053,7 +1785,7 @@ class SystemTray:
     
     def setup(self):
         """Configure l'icône tray"""
-        if not self.tray_available:
+        if not self._load():
             return False
         
         try:
@@ -1070,13 +1802,13 @@ class SystemTray:
     
     def _on_show(self, icon=None, item=None):
         if self.on_show:
-            self.root.after(0, self.on_show)
+            self.ui.post(self.on_show)
     
     def _on_quit(self, icon=None, item=None):
         if self.icon:
             self.icon.stop()
         if self.on_quit:
-            self.root.after(0, self.on_quit)
+            self.ui.post(self.on_quit)
     
     def run(self):
         """Lance l'icône tray dans un thread séparé"""
@@ -1097,11 +1829,42 @@ class SystemTray:
 # ============================================================
 
 class GoogleDriveSync:
+    # Points d'accès Drive (redirigés vers un serveur local par sync_bench.py)
+    API_FILES_URL = "https://www.googleapis.com/drive/v3/files"
+    FOLDER_URL = "https://drive.google.com/drive/folders/{folder_id}"
+    # URLs de téléchargement, ordre par vitesse
+    DOWNLOAD_URLS = (
+        "https://drive.usercontent.google.com/download?id={file_id}&export=download&confirm=t&uuid=",
+        "https://drive.google.com/uc?export=download&id={file_id}&confirm=t",
+        "https://drive.google.com/uc?export=download&id={file_id}",
+    )
+    # Threads de vérification locale (au-delà, le disque sature avant les cœurs)
+    VERIFY_MAX_WORKERS = 8
+    
     def __init__(self, folder_id: str, local_mods_path: Path, api_key: str = ""):
         self.folder_id = folder_id
         self.local_mods_path = local_mods_path
         self.api_key = api_key
         self.ssl_context = ssl.create_default_context()
+        self.recorder = None  # SyncRecorder de la sync en cours
+        self.last_report = None
+    
+    def _event(self, operation: str, message: str = '', outcome: str = 'info', **fields):
+        """emit_event + collecte pour le rapport de la sync en cours"""
+        emit_event(operation, message, outcome, **fields)
+        if self.recorder:
+            self.recorder.record(operation, outcome, fields)
+    
+    def _finish_report(self):
+        """Enregistre le rapport de la sync dans l'historique"""
+        recorder, self.recorder = self.recorder, None
+        if not recorder:
+            return
+        sync_report = quick_win('sync_report')
+        self.last_report = recorder.build()
+        sync_report.get_sync_history().append(self.last_report)
+        for line in sync_report.format_report(self.last_report):
+            print(f"[Sync] {line}")
         
     def _make_request(self, url: str) -> bytes:
         req = urllib.request.Request(url)
@@ -1114,20 +1877,25 @@ class GoogleDriveSync:
         
         # Methode API
         if self.api_key:
+            start = time.perf_counter()
             try:
-                url = f"https://www.googleapis.com/drive/v3/files?q='{self.folder_id}'+in+parents&key={self.api_key}&fields=files(id,name,size,md5Checksum)&pageSize=1000"
-                data = json.loads(self._make_request(url))
+                url = f"{self.API_FILES_URL}?q='{self.folder_id}'+in+parents&key={self.api_key}&fields=files(id,name,size,md5Checksum)&pageSize=1000"
+                raw = self._make_request(url)
+                data = json.loads(raw)
                 for f in data.get('files', []):
                     if f['name'].endswith('.jar'):
                         files.append({'id': f['id'], 'name': f['name'], 'md5': f.get('md5Checksum', '')})
-                print(f"[API] {len(files)} mods trouves")
+                self._event('drive.list', f"[API] {len(files)} mods trouves", 'ok',
+                           method='api', count=len(files), bytes=len(raw), duration_ms=elapsed_ms(start))
                 return files
             except Exception as e:
-                print(f"[API] Erreur: {e}")
+                self._event('drive.list', f"[API] Erreur: {e}", 'error',
+                           method='api', error=str(e), duration_ms=elapsed_ms(start))
         
         # Methode scraping fallback
+        start = time.perf_counter()
         try:
-            url = f"https://drive.google.com/drive/folders/{self.folder_id}"
+            url = self.FOLDER_URL.format(folder_id=self.folder_id)
             html = self._make_request(url).decode('utf-8', errors='ignore')
             
             jar_names = set(re.findall(r'"([^"]+\.jar)"', html, re.IGNORECASE))
@@ -1140,24 +1908,75 @@ class GoogleDriveSync:
                     files.append({'id': file_id, 'name': file_name, 'md5': ''})
                     seen_names.add(file_name)
             
-            print(f"[Scraping] {len(files)} mods trouves")
+            self._event('drive.list', f"[Scraping] {len(files)} mods trouves", 'ok',
+                       method='scraping', count=len(files), bytes=len(html), duration_ms=elapsed_ms(start))
         except Exception as e:
-            print(f"[Scraping] Erreur: {e}")
+            self._event('drive.list', f"[Scraping] Erreur: {e}", 'error',
+                       method='scraping', error=str(e), duration_ms=elapsed_ms(start))
             
         return files
     
     def _calculate_md5(self, file_path: Path) -> str:
-        """Calcule le MD5 d'un fichier local"""
+        """Calcule le MD5 d'un fichier local (depuis l'index des mods si le fichier n'a pas changé)"""
+        if QUICK_WINS_MOD_INDEX:
+            return quick_win('mod_index').get_mod_index().get_md5(file_path)
         try:
+            if QUICK_WINS_FILE_HASH:
+                return quick_win('file_hash').file_digest(file_path, 'md5')
             hash_md5 = hashlib.md5()
             with open(file_path, 'rb') as f:
                 for chunk in iter(lambda: f.read(4096), b''):
                     hash_md5.update(chunk)
             return hash_md5.hexdigest()
         except Exception as e:
-            print(f"[MD5] Erreur pour {file_path}: {e}")
+            self._event('md5', f"[MD5] Erreur pour {file_path}: {e}", 'error', file=file_path.name, error=str(e))
             return ''
     
+    def _verify_workers(self, count: int) -> int:
+        """Threads de hachage: bornés par les cœurs, VERIFY_MAX_WORKERS et le nombre de fichiers"""
+        return max(1, min(os.cpu_count() or 1, self.VERIFY_MAX_WORKERS, count))
+    
+    def _iter_local_md5(self, names: List[str]) -> Iterator[Tuple[str, str]]:
+        """
+        MD5 des fichiers locaux en parallèle, les plus gros en premier,
+        renvoyés au fur et à mesure (au plus 2 fichiers en attente par thread)
+        
+        Yields:
+            (nom, md5) dans l'ordre de fin de calcul ('' si illisible)
+        """
+        def size_of(name):
+            try:
+                return (self.local_mods_path / name).stat().st_size
+            except OSError:
+                return 0
+        
+        pending_names = sorted(names, key=size_of, reverse=True)
+        workers = self._verify_workers(len(pending_names))
+        if workers == 1:
+            for name in pending_names:
+                yield name, self._calculate_md5(self.local_mods_path / name)
+            return
+        
+        from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+        queue = iter(pending_names)
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='verify') as executor:
+            in_flight = {}
+            try:
+                while True:
+                    for name in queue:
+                        in_flight[executor.submit(self._calculate_md5, self.local_mods_path / name)] = name
+                        if len(in_flight) >= workers * 2:
+                            break
+                    if not in_flight:
+                        break
+                    done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield in_flight.pop(future), future.result()
+            finally:
+                # Générateur abandonné: ne pas lancer les calculs restants
+                for future in in_flight:
+                    future.cancel()
+    
     def download_file(self, file_id: str, file_name: str, overwrite: bool = True, progress_callback: Optional[Callable] = None, config: Optional[dict] = None) -> bool:
         """Télécharge un fichier avec optimisations pour la vitesse"""
         if config is None:
@@ -1173,18 +1992,17 @@ class GoogleDriveSync:
                 pass
         
         # URLs optimisées pour Google Drive (ordre par vitesse)
-        urls = [
-            f"https://drive.usercontent.google.com/download?id={file_id}&export=download&confirm=t&uuid=",
-            f"https://drive.google.com/uc?export=download&id={file_id}&confirm=t",
-            f"https://drive.google.com/uc?export=download&id={file_id}"
-        ]
+        urls = [template.format(file_id=file_id) for template in self.DOWNLOAD_URLS]
         
         max_retries = config.get('download_retries', 3)
         chunk_size = config.get('download_chunk_size', 32768)  # 32KB par défaut
         timeout = config.get('download_timeout', 180)
         
         for attempt in range(max_retries):
-            for url in urls:
+            for url_index, url in enumerate(urls):
+                start = time.perf_counter()
+                # Champs communs des événements de cette tentative
+                event = {'file': file_name, 'attempt': attempt + 1, 'url_index': url_index}
                 try:
                     req = urllib.request.Request(url)
                     req.add_header('User-Agent', 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36')
@@ -1196,6 +2014,7 @@ class GoogleDriveSync:
                         content_type = response.headers.get('Content-Type', '').lower()
                         if 'text/html' in content_type or 'text/plain' in content_type:
                             # Probablement une page HTML, essayer l'URL suivante
+                            self._event('sync.download', outcome='html', duration_ms=elapsed_ms(start), **event)
                             continue
                         
                         # Télécharger avec buffer optimisé
@@ -1219,34 +2038,85 @@ class GoogleDriveSync:
                             with open(file_path, 'rb') as f:
                                 header = f.read(2)
                                 if header == b'PK':
-                                    file_size_mb = file_path.stat().st_size / 1024 / 1024
-                                    print(f"[Download] {file_name} telecharge ({file_size_mb:.2f} MB)")
+                                    file_size = file_path.stat().st_size
+                                    self._event('sync.download',
+                                               f"[Download] {file_name} telecharge ({file_size / 1024 / 1024:.2f} MB)", 'ok',
+                                               bytes=file_size, duration_ms=elapsed_ms(start), **event)
                                     return True
                         
                         # Si le fichier n'est pas valide, le supprimer et réessayer
+                        self._event('sync.download', outcome='invalid', bytes=downloaded,
+                                   duration_ms=elapsed_ms(start), **event)
                         try:
                             file_path.unlink()
                         except:
                             pass
                         
                 except urllib.error.HTTPError as e:
+                    self._event('sync.download', outcome='retry', status=e.code,
+                               duration_ms=elapsed_ms(start), **event)
                     if e.code == 429:  # Too Many Requests
                         time.sleep(2 ** attempt)  # Backoff exponentiel
                     continue
                 except (urllib.error.URLError, TimeoutError, OSError) as e:
+                    self._event('sync.download', outcome='retry', error=str(e),
+                               duration_ms=elapsed_ms(start), **event)
                     if attempt < max_retries - 1:
                         time.sleep(0.5 * (attempt + 1))  # Petit délai avant retry
                     continue
                 except Exception as e:
-                    print(f"[Download] Erreur {file_name} (tentative {attempt + 1}): {e}")
+                    self._event('sync.download', f"[Download] Erreur {file_name} (tentative {attempt + 1}): {e}", 'retry',
+                               error=str(e), duration_ms=elapsed_ms(start), **event)
                     continue
         
         # Si tous les essais ont échoué
-        print(f"[Download] Echec apres {max_retries} tentatives: {file_name}")
+        self._event('sync.download', f"[Download] Echec apres {max_retries} tentatives: {file_name}", 'error',
+                   file=file_name, attempt=max_retries)
         return False
     
+    def verify(self, progress_callback: Optional[Callable] = None) -> dict:
+        """
+        Compare le dossier local à la liste distante sans rien télécharger
+        Retourne {'missing', 'extra', 'mismatched', 'ok', 'unverified'} (listes de noms)
+        """
+        result = {'missing': [], 'extra': [], 'mismatched': [], 'ok': [], 'unverified': []}
+        start = time.perf_counter()
+        remote_files = self.get_folder_files()
+        local_files = set()
+        if self.local_mods_path.exists():
+            local_files = {f.name for f in self.local_mods_path.iterdir() if f.is_file() and f.suffix == '.jar'}
+        
+        total = len(remote_files)
+        to_hash = {}
+        for f in remote_files:
+            if f['name'] not in local_files:
+                result['missing'].append(f['name'])
+            elif not f.get('md5'):
+                result['unverified'].append(f['name'])
+            else:
+                to_hash[f['name']] = f['md5']
+        
+        done = total - len(to_hash)
+        for name, local_md5 in self._iter_local_md5(list(to_hash)):
+            done += 1
+            if progress_callback:
+                progress_callback(f"Verification {name[:30]}...", done, total)
+            result['ok' if local_md5 == to_hash[name] else 'mismatched'].append(name)
+        result['extra'] = sorted(local_files - {f['name'] for f in remote_files})
+        
+        if QUICK_WINS_MOD_INDEX:
+            quick_win('mod_index').get_mod_index().save()
+        if progress_callback:
+            progress_callback("Verification terminee", total, total)
+        self._event('sync.verify', outcome='ok' if not (result['missing'] or result['mismatched']) else 'mismatch',
+                   duration_ms=elapsed_ms(start), workers=self._verify_workers(len(to_hash)), **{key: len(names) for key, names in result.items()})
+        return result
+    
     def sync(self, progress_callback: Optional[Callable] = None, force_replace: bool = False, config: Optional[dict] = None) -> dict:
         stats = {'added': [], 'removed': [], 'unchanged': [], 'updated': [], 'errors': []}
+        sync_start = time.perf_counter()
+        if QUICK_WINS_SYNC_REPORT:
+            self.recorder = quick_win('sync_report').SyncRecorder(LAUNCHER_VERSION)
         self.local_mods_path.mkdir(parents=True, exist_ok=True)
         
         if progress_callback:
@@ -1263,13 +2133,19 @@ class GoogleDriveSync:
                 if f.is_file() and f.suffix == '.jar':
                     local_files.add(f.name)
         
-        print(f"[Sync] Fichiers distants: {len(remote_names)}, Fichiers locaux: {len(local_files)}")
+        self._event('sync.list', f"[Sync] Fichiers distants: {len(remote_names)}, Fichiers locaux: {len(local_files)}",
+                   remote=len(remote_names), local=len(local_files), duration_ms=elapsed_ms(sync_start))
         
         # Fichiers à télécharger (nouveaux)
         to_download = [f for f in remote_files if f['name'] not in local_files]
         
         # Fichiers à remplacer (existants mais différents)
         to_replace = []
+        compare_start = time.perf_counter()
+        hashed = 0
+        hash_workers = 0
+        index = quick_win('mod_index').get_mod_index() if QUICK_WINS_MOD_INDEX else None
+        hits_before = index.hits if index else 0
         if force_replace:
             # Si force_replace est True, on remplace tous les fichiers existants
             for f in remote_files:
@@ -1280,27 +2156,36 @@ class GoogleDriveSync:
             if progress_callback:
                 progress_callback("Verification des fichiers...", 10, 100)
             
+            existing = {}
             for f in remote_files:
-                if f['name'] in local_files:
-                    local_path = self.local_mods_path / f['name']
-                    local_md5 = self._calculate_md5(local_path)
-                    remote_md5 = f.get('md5', '')
-                    
-                    # Si les MD5 sont différents ou si le MD5 distant n'est pas disponible, on marque pour remplacement
-                    if remote_md5 and local_md5 and remote_md5 != local_md5:
-                        to_replace.append(f)
-                    elif not remote_md5:
-                        # Si pas de MD5 distant, on considère comme inchangé (fallback)
-                        stats['unchanged'].append(f['name'])
-                    elif local_md5 == remote_md5:
-                        stats['unchanged'].append(f['name'])
-                    else:
-                        # Si pas de MD5 local, on remplace
-                        to_replace.append(f)
+                if f['name'] not in local_files:
+                    continue
+                if f.get('md5'):
+                    existing[f['name']] = f
+                else:
+                    # Si pas de MD5 distant, on considère comme inchangé (fallback, sans hacher)
+                    stats['unchanged'].append(f['name'])
+
+            # Les empreintes locales arrivent dans l'ordre de fin de calcul
+            hash_workers = self._verify_workers(len(existing))
+            for name, local_md5 in self._iter_local_md5(list(existing)):
+                hashed += 1
+                if local_md5 == existing[name]['md5']:
+                    stats['unchanged'].append(name)
+                else:
+                    # MD5 différent ou MD5 local indisponible: on remplace
+                    to_replace.append(existing[name])
+            
+            if QUICK_WINS_MOD_INDEX:
+                quick_win('mod_index').get_mod_index().save()
         
         # Fichiers à supprimer (présents localement mais absents du Drive)
         to_remove = local_files - remote_names
         
+        self._event('sync.plan', download=len(to_download), replace=len(to_replace), remove=len(to_remove),
+                   unchanged=len(stats['unchanged']), force_replace=force_replace,
+                   hashed=hashed, hash_workers=hash_workers, cache_hits=(index.hits - hits_before) if index else 0,
+                   duration_ms=elapsed_ms(compare_start))
         if to_remove:
             print(f"[Sync] {len(to_remove)} fichier(s) a supprimer: {list(to_remove)[:5]}{'...' if len(to_remove) > 5 else ''}")
         
@@ -1311,6 +2196,9 @@ class GoogleDriveSync:
         if total == 0 and len(to_remove) == 0:
             if progress_callback:
                 progress_callback("Synchronisation terminee!", 100, 100)
+            self._event('sync', outcome='ok', files=0, duration_ms=elapsed_ms(sync_start),
+                        **{key: len(names) for key, names in stats.items()})
+            self._finish_report()
             return stats
         
         # Téléchargement parallèle avec ThreadPoolExecutor
@@ -1361,6 +2249,7 @@ class GoogleDriveSync:
             return (file_info, action, result)
         
         # Lancer les téléchargements en parallèle
+        from concurrent.futures import ThreadPoolExecutor, as_completed
         with ThreadPoolExecutor(max_workers=max_workers) as executor:
             futures = {executor.submit(download_with_callback, file_info, action): (file_info, action) 
                       for file_info, action in all_files}
@@ -1380,7 +2269,8 @@ class GoogleDriveSync:
                 except Exception as e:
                     file_info, action = futures[future]
                     stats['errors'].append(file_info['name'])
-                    print(f"[Sync] Erreur telechargement {file_info['name']}: {e}")
+                    self._event('sync.download', f"[Sync] Erreur telechargement {file_info['name']}: {e}", 'error',
+                               file=file_info['name'], error=str(e))
         
         # Supprimer les fichiers obsolètes (présents localement mais absents du Drive)
         if to_remove:
@@ -1393,11 +2283,12 @@ class GoogleDriveSync:
                     if file_path.exists():
                         file_path.unlink()
                         stats['removed'].append(file_name)
-                        print(f"[Sync] Fichier supprime: {file_name}")
+                        self._event('sync.remove', f"[Sync] Fichier supprime: {file_name}", 'ok', file=file_name)
                     else:
-                        print(f"[Sync] Fichier deja supprime: {file_name}")
+                        self._event('sync.remove', f"[Sync] Fichier deja supprime: {file_name}", 'missing', file=file_name)
                 except Exception as e:
-                    print(f"[Sync] Erreur suppression {file_name}: {e}")
+                    self._event('sync.remove', f"[Sync] Erreur suppression {file_name}: {e}", 'error',
+                               file=file_name, error=str(e))
                     stats['errors'].append(f"Suppression: {file_name}")
             
             if progress_callback:
@@ -1405,6 +2296,16 @@ class GoogleDriveSync:
         
         if progress_callback:
             progress_callback("Synchronisation terminee!", 100, 100)
+        downloaded_bytes = 0
+        for file_name in stats['added'] + stats['updated']:
+            try:
+                downloaded_bytes += (self.local_mods_path / file_name).stat().st_size
+            except OSError:
+                pass
+        self._event('sync', outcome='error' if stats['errors'] else 'ok', files=total, workers=max_workers,
+                   bytes=downloaded_bytes, duration_ms=elapsed_ms(sync_start),
+                   **{key: len(names) for key, names in stats.items()})
+        self._finish_report()
         return stats
 
 
@@ -1427,8 +2328,19 @@ class JavaManager:
     ADOPTIUM_BASE_URL = "https://api.adoptium.net/v3/binary/latest"
     
     @staticmethod
-    def find_java() -> Optional[str]:
-        """Trouve le chemin de Java installé"""
+    def find_java(refresh: bool = False) -> Optional[str]:
+        """
+        Trouve le chemin de Java installé
+        Avec le registre JVM, seul un stat() est fait tant que rien n'a changé
+        (refresh=True force une nouvelle découverte complète)
+        """
+        if QUICK_WINS_JAVA_REGISTRY:
+            try:
+                best = get_jvm_registry().find_best(JavaManager.REQUIRED_JAVA_VERSION, refresh=refresh)
+                return best.path if best else None
+            except Exception as e:
+                emit_event('java.find', f"[Java] Registre JVM indisponible, détection classique: {e}", 'info')
+        
         # Vérifier JAVA_HOME
         java_home = os.environ.get('JAVA_HOME')
         if java_home:
@@ -1478,6 +2390,13 @@ class JavaManager:
             if not java_path:
                 return None
             
+            # Réutiliser le sondage mis en cache (clé: chemin + taille + mtime)
+            if QUICK_WINS_JAVA_REGISTRY:
+                info = get_jvm_registry().probe(java_path)
+                if info:
+                    return (info.major, info.output)
+                return None
+            
             # Exécuter java -version
             # Note: java -version envoie la sortie sur stderr, pas stdout
             result = subprocess.run(
@@ -1489,7 +2408,7 @@ class JavaManager:
             
             # java -version envoie toujours sur stderr
             output = result.stderr or result.stdout or ""
-            print(f"[Java] Sortie java -version: {output[:200]}")  # Log pour debug
+            emit_event('java.version', f"[Java] Sortie java -version: {output[:200]}", 'info')  # Log pour debug
             
             # Parser la version (format: "openjdk version "17.0.x" ou "java version "1.8.0_x"")
             # Essayer plusieurs patterns pour être plus robuste
@@ -1515,18 +2434,19 @@ class JavaManager:
                         if java8_match:
                             major = int(java8_match.group(1))
                     
-                    print(f"[Java] Version détectée: {major} (sortie complète: {output[:100]})")
+                    emit_event('java.version', f"[Java] Version détectée: {major} (sortie complète: {output[:100]})", 'ok',
+                               file=java_path, major=major)
                     return (major, output.strip())
             
             # Si aucun pattern ne correspond, afficher la sortie pour debug
-            print(f"[Java] Impossible de parser la version. Sortie: {output[:200]}")
+            emit_event('java.version', f"[Java] Impossible de parser la version. Sortie: {output[:200]}", 'error')
             return None
             
         except subprocess.TimeoutExpired:
-            print(f"[Java] Timeout lors de la vérification de version")
+            emit_event('java.version', f"[Java] Timeout lors de la vérification de version", 'error')
             return None
         except Exception as e:
-            print(f"[Java] Erreur vérification version: {e}")
+            emit_event('java.version', f"[Java] Erreur vérification version: {e}", 'error')
             import traceback
             traceback.print_exc()
         
@@ -1548,6 +2468,7 @@ class JavaManager:
         Télécharge l'installateur Java depuis Adoptium (Eclipse Temurin)
         Retourne le chemin du fichier téléchargé ou None
         """
+        start = time.perf_counter()
         try:
             # Déterminer l'architecture
             import platform
@@ -1576,8 +2497,8 @@ class JavaManager:
                 if progress_callback:
                     progress_callback(f"Téléchargement de Java {version}...", 0, 100)
                 
-                print(f"[Java] Téléchargement depuis: {api_url}")
-                print(f"[Java] Destination: {download_path}")
+                emit_event('java.download', f"[Java] Téléchargement depuis: {api_url}", 'info')
+                emit_event('java.download', f"[Java] Destination: {download_path}", 'info')
                 
                 # Télécharger avec gestion d'erreurs améliorée
                 ssl_ctx = ssl.create_default_context()
@@ -1594,7 +2515,7 @@ class JavaManager:
                     
                     # Vérifier le code de statut
                     if response.status != 200:
-                        print(f"[Java] Erreur HTTP: {response.status}")
+                        emit_event('java.download', f"[Java] Erreur HTTP: {response.status}", 'error')
                         response.close()
                         return None
                     
@@ -1602,7 +2523,7 @@ class JavaManager:
                     total_size = int(response.headers.get('Content-Length', 0))
                     if total_size == 0:
                         # Si pas de Content-Length, essayer de lire pour obtenir la taille
-                        print("[Java] Avertissement: Content-Length non disponible")
+                        emit_event('java.download', "[Java] Avertissement: Content-Length non disponible", 'warning')
                     
                     downloaded_size = 0
                     chunk_size = 65536  # 64KB chunks pour plus de performance
@@ -1611,7 +2532,7 @@ class JavaManager:
                     if download_path.exists():
                         existing_size = download_path.stat().st_size
                         if existing_size > 0 and total_size > 0 and existing_size < total_size:
-                            print(f"[Java] Fichier partiel trouvé ({existing_size} bytes), reprise du téléchargement...")
+                            emit_event('java.download', f"[Java] Fichier partiel trouvé ({existing_size} bytes), reprise du téléchargement...", 'info')
                             downloaded_size = existing_size
                             # Ajouter le header Range pour reprendre
                             req.add_header('Range', f'bytes={existing_size}-')
@@ -1657,38 +2578,39 @@ class JavaManager:
                     # Vérifier que le fichier a été téléchargé correctement
                     if download_path.exists() and download_path.stat().st_size > 0:
                         file_size_mb = download_path.stat().st_size / 1024 / 1024
-                        print(f"[Java] Téléchargement terminé: {download_path} ({file_size_mb:.1f} MB)")
+                        emit_event('java.download', f"[Java] Téléchargement terminé: {download_path} ({file_size_mb:.1f} MB)", 'ok',
+                                   file=download_path.name, bytes=download_path.stat().st_size, duration_ms=elapsed_ms(start))
                         if progress_callback:
                             progress_callback(f"Téléchargement terminé ({file_size_mb:.1f} MB)", 100, 100)
                         return download_path
                     else:
-                        print(f"[Java] Erreur: fichier téléchargé invalide ou vide")
+                        emit_event('java.download', f"[Java] Erreur: fichier téléchargé invalide ou vide", 'error')
                         if download_path.exists():
                             download_path.unlink()  # Supprimer le fichier invalide
                         return None
                         
                 except urllib.error.HTTPError as e:
-                    print(f"[Java] Erreur HTTP: {e.code} - {e.reason}")
+                    emit_event('java.download', f"[Java] Erreur HTTP: {e.code} - {e.reason}", 'error')
                     if e.code == 404:
-                        print(f"[Java] URL non trouvée. Tentative avec une autre méthode...")
+                        emit_event('java.download', f"[Java] URL non trouvée. Tentative avec une autre méthode...", 'retry')
                         # Fallback: essayer avec une URL alternative
                         return JavaManager._download_java_fallback(version, download_path, progress_callback)
                     return None
                 except urllib.error.URLError as e:
-                    print(f"[Java] Erreur URL: {e.reason}")
+                    emit_event('java.download', f"[Java] Erreur URL: {e.reason}", 'error')
                     # Fallback: essayer avec une URL alternative
                     return JavaManager._download_java_fallback(version, download_path, progress_callback)
                 except Exception as e:
-                    print(f"[Java] Erreur lors du téléchargement: {e}")
+                    emit_event('java.download', f"[Java] Erreur lors du téléchargement: {e}", 'error')
                     import traceback
                     traceback.print_exc()
                     return None
             else:
-                print(f"[Java] Plateforme non supportée: {sys.platform} {arch}")
+                emit_event('java.download', f"[Java] Plateforme non supportée: {sys.platform} {arch}", 'error')
                 return None
                     
         except Exception as e:
-            print(f"[Java] Erreur téléchargement: {e}")
+            emit_event('java.download', f"[Java] Erreur téléchargement: {e}", 'error')
             import traceback
             traceback.print_exc()
             return None
@@ -1696,8 +2618,9 @@ class JavaManager:
     @staticmethod
     def _download_java_fallback(version: int, download_path: Path, progress_callback: Optional[Callable] = None) -> Optional[Path]:
         """Méthode de fallback pour télécharger Java depuis une source alternative"""
+        start = time.perf_counter()
         try:
-            print(f"[Java] Tentative de téléchargement avec méthode alternative...")
+            emit_event('java.download_fallback', f"[Java] Tentative de téléchargement avec méthode alternative...", 'info')
             
             # Utiliser l'API Adoptium pour obtenir les informations de la dernière release
             api_info_url = f"https://api.adoptium.net/v3/assets/latest/{version}/hotspot"
@@ -1719,7 +2642,7 @@ class JavaManager:
                         if package.get('name', '').endswith('.msi'):
                             download_url = package.get('link')
                             if download_url:
-                                print(f"[Java] URL alternative trouvée: {download_url}")
+                                emit_event('java.download_fallback', f"[Java] URL alternative trouvée: {download_url}", 'info')
                                 
                                 # Télécharger depuis cette URL
                                 req_dl = urllib.request.Request(
@@ -1750,11 +2673,12 @@ class JavaManager:
                                                 )
                                 
                                 if download_path.exists() and download_path.stat().st_size > 0:
-                                    print(f"[Java] Téléchargement terminé: {download_path}")
+                                    emit_event('java.download_fallback', f"[Java] Téléchargement terminé: {download_path}", 'ok',
+                                               file=download_path.name, bytes=downloaded_size, duration_ms=elapsed_ms(start))
                                     return download_path
                                 
         except Exception as e:
-            print(f"[Java] Erreur méthode alternative: {e}")
+            emit_event('java.download_fallback', f"[Java] Erreur méthode alternative: {e}", 'error')
         
         return None
     
@@ -1766,10 +2690,10 @@ class JavaManager:
         """
         try:
             if not installer_path.exists():
-                print(f"[Java] Fichier installateur introuvable: {installer_path}")
+                emit_event('java.install', f"[Java] Fichier installateur introuvable: {installer_path}", 'error')
                 return False
             
-            print(f"[Java] Installation de Java depuis: {installer_path}")
+            emit_event('java.install', f"[Java] Installation de Java depuis: {installer_path}", 'info')
             
             # Commande d'installation silencieuse MSI
             # /quiet = installation silencieuse
@@ -1794,25 +2718,25 @@ class JavaManager:
                 # Attendre un peu pour voir si ça démarre
                 time.sleep(2)
                 if process.poll() is None:
-                    print("[Java] Installation en cours... (cela peut prendre quelques minutes)")
+                    emit_event('java.install', "[Java] Installation en cours... (cela peut prendre quelques minutes)", 'info')
                     return True
                 else:
                     # Le processus s'est terminé rapidement, peut-être une erreur
                     stdout, stderr = process.communicate()
                     if process.returncode == 0:
-                        print("[Java] Installation terminée avec succès")
+                        emit_event('java.install', "[Java] Installation terminée avec succès", 'ok', file=installer_path.name)
                         return True
                     else:
-                        print(f"[Java] Erreur installation: {stderr.decode() if stderr else 'Code retour: ' + str(process.returncode)}")
+                        emit_event('java.install', f"[Java] Erreur installation: {stderr.decode() if stderr else 'Code retour: ' + str(process.returncode)}", 'error')
                         return False
             else:
                 # Installation avec interface utilisateur
                 subprocess.Popen(cmd)
-                print("[Java] Interface d'installation lancée")
+                emit_event('java.install', "[Java] Interface d'installation lancée", 'info')
                 return True
                 
         except Exception as e:
-            print(f"[Java] Erreur lors de l'installation: {e}")
+            emit_event('java.install', f"[Java] Erreur lors de l'installation: {e}", 'error')
             import traceback
             traceback.print_exc()
             return False
@@ -1825,35 +2749,35 @@ class JavaManager:
         Retourne (succès, chemin_java)
         Si Java n'est pas installé, télécharge et installe automatiquement
         """
-        # Vérifier si Java est déjà installé et compatible
+        # Vérifier si Java est déjà installé et compatible (un seul sondage)
+        start = time.perf_counter()
         java_path = JavaManager.find_java()
-        if java_path and JavaManager.is_java_compatible(java_path):
-            print(f"[Java] Java compatible trouvé: {java_path}")
-            version_info = JavaManager.check_java_version(java_path)
-            if version_info:
-                print(f"[Java] Version: {version_info[1]}")
+        version_info = JavaManager.check_java_version(java_path) if java_path else None
+        if version_info and version_info[0] >= JavaManager.REQUIRED_JAVA_VERSION:
+            emit_event('java.ensure', f"[Java] Java compatible trouvé: {java_path}", 'ok',
+                       file=java_path, major=version_info[0], duration_ms=elapsed_ms(start))
+            emit_event('java.ensure', f"[Java] Version: {version_info[1]}", 'info')
             return (True, java_path)
         
         # Java n'est pas installé ou version incompatible
         if java_path:
-            version_info = JavaManager.check_java_version(java_path)
             if version_info:
-                print(f"[Java] Java trouvé mais version incompatible: {version_info[0]} (requis: {JavaManager.REQUIRED_JAVA_VERSION}+)")
+                emit_event('java.ensure', f"[Java] Java trouvé mais version incompatible: {version_info[0]} (requis: {JavaManager.REQUIRED_JAVA_VERSION}+)", 'error')
         else:
-            print("[Java] Java non trouvé sur le système")
+            emit_event('java.ensure', "[Java] Java non trouvé sur le système", 'missing')
         
         # Télécharger et installer Java
         if progress_callback:
             progress_callback("Java non trouvé, téléchargement en cours...", 0, 100)
         
-        print("[Java] Téléchargement de Java...")
+        emit_event('java.ensure', "[Java] Téléchargement de Java...", 'info')
         installer_path = JavaManager.download_java_installer(
             version=JavaManager.REQUIRED_JAVA_VERSION,
             progress_callback=progress_callback
         )
         
         if not installer_path:
-            print("[Java] Échec du téléchargement")
+            emit_event('java.ensure', "[Java] Échec du téléchargement", 'error')
             if progress_callback:
                 progress_callback("Échec du téléchargement. Veuillez installer Java manuellement.", 0, 100)
             return (False, None)
@@ -1870,23 +2794,25 @@ class JavaManager:
         
         if success:
             # Attendre un peu pour que l'installation se termine
-            print("[Java] Attente de la fin de l'installation...")
+            emit_event('java.ensure', "[Java] Attente de la fin de l'installation...", 'info')
             time.sleep(10)  # Attendre 10 secondes
             
-            # Vérifier à nouveau
-            java_path = JavaManager.find_java()
+            # Vérifier à nouveau (nouvelle découverte: la JVM vient d'être installée)
+            java_path = JavaManager.find_java(refresh=True)
             if java_path and JavaManager.is_java_compatible(java_path):
                 if progress_callback:
                     progress_callback("Java installé avec succès!", 100, 100)
-                print(f"[Java] Java installé et vérifié: {java_path}")
+                emit_event('java.ensure', f"[Java] Java installé et vérifié: {java_path}", 'ok',
+                           file=java_path, installed=True, duration_ms=elapsed_ms(start))
                 return (True, java_path)
             else:
-                print("[Java] Installation terminée mais Java non détecté (redémarrage peut être nécessaire)")
+                emit_event('java.ensure', "[Java] Installation terminée mais Java non détecté (redémarrage peut être nécessaire)", 'error',
+                           duration_ms=elapsed_ms(start))
                 if progress_callback:
                     progress_callback("Installation terminée. Redémarrez le launcher.", 100, 100)
                 return (False, None)
         else:
-            print("[Java] Échec de l'installation")
+            emit_event('java.ensure', "[Java] Échec de l'installation", 'error')
             return (False, None)
 
 
@@ -1894,14 +2820,38 @@ class JavaManager:
 # MINECRAFT LAUNCHER
 # ============================================================
 
+@dataclass
+class ResolvedPaths:
+    """Chemins d'une instance résolus une seule fois (voir MinecraftLauncher.invalidate_paths)"""
+    prism_data_dir: Optional[Path] = None
+    instance_dir: Optional[Path] = None
+    minecraft_dir: Optional[Path] = None
+    mods_dir: Optional[Path] = None
+
+
 class MinecraftLauncher:
     def __init__(self, config: dict):
         self.config = config
+        self.monitor_thread = None
         # Utiliser le nom d'instance depuis la config, ou "IllamaServer" par défaut
         self.instance_name = config.get('prism_instance_name', 'IllamaServer')
+        self._paths = ResolvedPaths()
+    
+    def invalidate_paths(self):
+        """Force une nouvelle résolution des chemins (instance renommée, Prism déplacé...)"""
+        self._paths = ResolvedPaths()
+        self.instance_name = self.config.get('prism_instance_name', 'IllamaServer')
         
     def get_prism_data_dir(self) -> Path:
         """Trouve le dossier data de Prism Launcher"""
+        if self._paths.prism_data_dir is None:
+            self._paths.prism_data_dir = self._resolve_prism_data_dir()
+        return self._paths.prism_data_dir
+    
+    def _resolve_prism_data_dir(self) -> Path:
+        if QUICK_WINS_PRISM_CATALOG:
+            # Résolu une fois par processus (find_prism_launcher n'est plus relancé à chaque chemin)
+            return resolve_prism_data_dir(self.find_prism_launcher)
         if sys.platform == 'win32':
             # Prism stocke ses données dans AppData/Roaming/PrismLauncher
             prism_dir = Path(os.environ.get('APPDATA', '')) / 'PrismLauncher'
@@ -1921,17 +2871,24 @@ class MinecraftLauncher:
     
     def get_instance_dir(self) -> Path:
         """Retourne le dossier de notre instance"""
-        return self.get_instances_dir() / self.instance_name
+        if self._paths.instance_dir is None:
+            self._paths.instance_dir = self.get_instances_dir() / self.instance_name
+        return self._paths.instance_dir
     
     def get_minecraft_dir(self) -> Path:
-        """Retourne le dossier .minecraft de l'instance (unifié)"""
+        """Retourne le dossier .minecraft de l'instance (unifié, migration vérifiée une seule fois)"""
+        if self._paths.minecraft_dir is None:
+            self._paths.minecraft_dir = self._resolve_minecraft_dir()
+        return self._paths.minecraft_dir
+    
+    def _resolve_minecraft_dir(self) -> Path:
         instance_dir = self.get_instance_dir()
         mc_dir = instance_dir / '.minecraft'
         old_mc_dir = instance_dir / 'minecraft'  # Ancien dossier sans point
         
         # Si l'ancien dossier existe mais pas le nouveau, migrer
         if old_mc_dir.exists() and not mc_dir.exists():
-            print(f"[Instance] Migration: {old_mc_dir} -> {mc_dir}")
+            emit_event('instance.resolve', f"[Instance] Migration: {old_mc_dir} -> {mc_dir}", 'info')
             try:
                 # Déplacer le contenu de l'ancien dossier vers le nouveau
                 mc_dir.mkdir(parents=True, exist_ok=True)
@@ -1944,30 +2901,31 @@ class MinecraftLauncher:
                 # Supprimer l'ancien dossier s'il est vide
                 try:
                     old_mc_dir.rmdir()
-                    print(f"[Instance] Ancien dossier supprime: {old_mc_dir}")
+                    emit_event('instance.resolve', f"[Instance] Ancien dossier supprime: {old_mc_dir}", 'info')
                 except:
                     # Le dossier n'est pas vide, on le laisse
-                    print(f"[Instance] Ancien dossier non vide, conserve: {old_mc_dir}")
+                    emit_event('instance.resolve', f"[Instance] Ancien dossier non vide, conserve: {old_mc_dir}", 'info')
             except Exception as e:
-                print(f"[Instance] Erreur migration: {e}")
+                emit_event('instance.resolve', f"[Instance] Erreur migration: {e}", 'error')
                 # En cas d'erreur, créer le nouveau dossier quand même
                 mc_dir.mkdir(parents=True, exist_ok=True)
         
         # S'assurer que .minecraft existe
         if not mc_dir.exists():
             mc_dir.mkdir(parents=True, exist_ok=True)
-            print(f"[Instance] Dossier .minecraft cree: {mc_dir}")
+            emit_event('instance.resolve', f"[Instance] Dossier .minecraft cree: {mc_dir}", 'info')
         
         return mc_dir
     
     def get_mods_dir(self) -> Path:
         """Retourne le dossier mods de l'instance"""
-        mc_dir = self.get_minecraft_dir()
-        mods_dir = mc_dir / 'mods'
-        # S'assurer que le dossier mods existe
-        mods_dir.mkdir(parents=True, exist_ok=True)
-        print(f"[Instance] Dossier mods: {mods_dir}")
-        return mods_dir
+        if self._paths.mods_dir is None:
+            mods_dir = self.get_minecraft_dir() / 'mods'
+            # S'assurer que le dossier mods existe
+            mods_dir.mkdir(parents=True, exist_ok=True)
+            emit_event('instance.mods_dir', f"[Instance] Dossier mods: {mods_dir}", 'info')
+            self._paths.mods_dir = mods_dir
+        return self._paths.mods_dir
     
     def get_resourcepacks_dir(self) -> Path:
         """Retourne le dossier resourcepacks de l'instance"""
@@ -2043,8 +3001,8 @@ InstanceType=OneSix
         mods_dir.mkdir(parents=True, exist_ok=True)
         (mc_dir / 'resourcepacks').mkdir(parents=True, exist_ok=True)
         (mc_dir / 'shaderpacks').mkdir(parents=True, exist_ok=True)
-        print(f"[Instance] Dossier .minecraft cree: {mc_dir}")
-        print(f"[Instance] Dossier mods cree: {mods_dir}")
+        emit_event('instance.create', f"[Instance] Dossier .minecraft cree: {mc_dir}", 'info')
+        emit_event('instance.create', f"[Instance] Dossier mods cree: {mods_dir}", 'info')
         
         # Créer servers.dat dans l'instance
         self.create_server_dat()
@@ -2052,7 +3010,7 @@ InstanceType=OneSix
         # Créer options.txt dans l'instance  
         self.create_options_txt()
         
-        print(f"[Instance] Creee: {instance_dir}")
+        emit_event('instance.create', f"[Instance] Creee: {instance_dir}", 'info')
         return True
     
     def create_server_dat(self):
@@ -2132,9 +3090,9 @@ InstanceType=OneSix
                 # Ignorer si on ne peut pas changer les permissions
                 pass
             
-            print(f"[Server] servers.dat force avec {SERVER_ADDRESS} uniquement (lecture seule)")
+            emit_event('server.create_dat', f"[Server] servers.dat force avec {SERVER_ADDRESS} uniquement (lecture seule)", 'info')
         except Exception as e:
-            print(f"[Server] Erreur: {e}")
+            emit_event('server.create_dat', f"[Server] Erreur: {e}", 'error')
     
     def _add_auto_connect_arguments(self):
         """Ajoute les arguments JVM pour se connecter automatiquement au serveur au démarrage"""
@@ -2143,7 +3101,7 @@ InstanceType=OneSix
             instance_cfg = instance_path / 'instance.cfg'
             
             if not instance_cfg.exists():
-                print("[AutoConnect] instance.cfg introuvable")
+                emit_event('autoconnect', "[AutoConnect] instance.cfg introuvable", 'error')
                 return
             
             # Lire le fichier de configuration
@@ -2183,9 +3141,9 @@ InstanceType=OneSix
             with open(instance_cfg, 'w', encoding='utf-8') as f:
                 f.writelines(new_lines)
             
-            print(f"[AutoConnect] Arguments de connexion automatique ajoutes: --server {SERVER_ADDRESS}")
+            emit_event('autoconnect', f"[AutoConnect] Arguments de connexion automatique ajoutes: --server {SERVER_ADDRESS}", 'info')
         except Exception as e:
-            print(f"[AutoConnect] Erreur lors de l'ajout des arguments: {e}")
+            emit_event('autoconnect', f"[AutoConnect] Erreur lors de l'ajout des arguments: {e}", 'error')
     
     def create_options_txt(self):
         """Crée options.txt - FORCE uniquement la connexion serveur, préserve TOUS les autres paramètres"""
@@ -2222,7 +3180,7 @@ InstanceType=OneSix
             for key, value in options.items():
                 f.write(f"{key}:{value}\n")
         
-        print(f"[Options] Connexion auto forcee vers {SERVER_ADDRESS}, tous les autres paramètres préservés")
+        emit_event('options.write', f"[Options] Connexion auto forcee vers {SERVER_ADDRESS}, tous les autres paramètres préservés", 'info')
     
     def update_instance_settings(self):
         """Met à jour les paramètres de l'instance (RAM, etc.)"""
@@ -2231,6 +3189,17 @@ InstanceType=OneSix
         ram_min = self.config.get('ram_min', 2048)  # En MB
         ram_max = self.config.get('ram_max', 4096)  # En MB
         
+        # Ajuster au moment du lancement selon la RAM libre et la taille du modpack
+        if self.config.get('adaptive_heap', True):
+            try:
+                plan = plan_launch_heap(ram_min, ram_max, self.get_mods_dir(), get_system_profile(refresh=True))
+                for reason in plan.reasons:
+                    emit_event('heap', f"[Heap] {reason}", 'info')
+                get_launcher_logger().info(f"Heap planifie: Xms={plan.xms}MB Xmx={plan.xmx}MB ({'; '.join(plan.reasons)})")
+                ram_min, ram_max = plan.xms, plan.xmx
+            except Exception as e:
+                emit_event('heap', f"[Heap] Planification impossible, valeurs configurees utilisees: {e}", 'info')
+        
         # Créer/modifier instance.cfg avec les JVM args
         instance_cfg_path = instance_dir / 'instance.cfg'
         
@@ -2259,10 +3228,21 @@ InstanceType=OneSix
             total_ram = get_system_ram_mb()
             profile = get_optimization_profile(total_ram)
             
-            if profile == "low_end":
+            # Flags mesurés sur cette machine (benchmark JVM) en priorité
+            measured_args = None
+            if QUICK_WINS_JVM_BENCHMARK:
+                try:
+                    measured_args = quick_win('jvm_benchmark').get_best_jvm_flags(JavaManager.find_java(), profile)
+                except Exception as e:
+                    emit_event('instance.settings', f"[Instance] Profil JVM mesuré indisponible: {e}", 'info')
+            
+            if measured_args:
+                jvm_args = measured_args
+                emit_event('instance.settings', f"[Instance] JVM args issus du benchmark appliqués (profil {profile})", 'info')
+            elif profile == "low_end":
                 # Utiliser les JVM args optimisés pour petits PC
                 jvm_args = get_low_end_jvm_args()
-                print(f"[Instance] Petit PC detecte ({total_ram}MB RAM) - JVM args optimises pour petits PC appliques")
+                emit_event('instance.settings', f"[Instance] Petit PC detecte ({total_ram}MB RAM) - JVM args optimises pour petits PC appliques", 'info')
             else:
                 # JVM args optimisés par défaut pour améliorer les FPS
                 jvm_args = (
@@ -2287,7 +3267,21 @@ InstanceType=OneSix
                     '-Dusing.aikars.flags=https://mcflags.emc.gs '
                     '-Daikars.new.flags=true'
                 )
-                print("[Instance] JVM args optimisés appliqués pour améliorer les FPS")
+                emit_event('instance.settings', "[Instance] JVM args optimisés appliqués pour améliorer les FPS", 'info')
+        
+        # Archive AppCDS (JVM, Forge, empreinte des mods): entraînement puis réutilisation
+        if QUICK_WINS_APPCDS and self.config.get('appcds_enabled', True):
+            try:
+                java_path = JavaManager.find_java()
+                cds_args = quick_win('appcds').get_appcds_manager().get_jvm_args(
+                    java_path, self.config.get('forge_version', '47.4.13'), self.get_mods_dir())
+                if cds_args:
+                    jvm_args = f"{jvm_args} {cds_args}".strip()
+                    # L'archive n'est valide que pour la JVM qui l'a produite
+                    cfg_content['JavaPath'] = java_path
+                    cfg_content['OverrideJavaLocation'] = 'true'
+            except Exception as e:
+                emit_event('appcds', f"[AppCDS] Désactivé pour ce lancement: {e}", 'info')
         
         if jvm_args:
             cfg_content['JvmArgs'] = jvm_args
@@ -2301,7 +3295,7 @@ InstanceType=OneSix
         
         ram_min_gb = ram_min / 1024
         ram_max_gb = ram_max / 1024
-        print(f"[Instance] RAM: {ram_min}MB ({ram_min_gb:.1f}GB) - {ram_max}MB ({ram_max_gb:.1f}GB)")
+        emit_event('instance.settings', f"[Instance] RAM: {ram_min}MB ({ram_min_gb:.1f}GB) - {ram_max}MB ({ram_max_gb:.1f}GB)", 'info')
     
     def find_prism_launcher(self) -> str:
         """Trouve l'exécutable Prism Launcher"""
@@ -2379,26 +3373,52 @@ InstanceType=OneSix
                     return True
                 return False
         except Exception as e:
-            print(f"[Check] Erreur lors de la vérification des processus: {e}")
+            emit_event('check.game_running', f"[Check] Erreur lors de la vérification des processus: {e}", 'error')
             # En cas d'erreur, on assume que le jeu n'est pas en cours (pour ne pas bloquer)
             return False
     
+    def preflight_check(self):
+        """
+        Vérifie le modpack (dépendances, versions, doublons) avant de démarrer la JVM
+        Retourne un PreflightReport, ou None si la vérification est indisponible/désactivée
+        """
+        if not QUICK_WINS_PREFLIGHT or not self.config.get('preflight_check', True):
+            return None
+        try:
+            return quick_win('mod_solver').run_preflight(
+                self.get_mods_dir(),
+                self.config.get('minecraft_version', '1.20.1'),
+                self.config.get('forge_version', '47.4.13')
+            )
+        except Exception as e:
+            emit_event('preflight', f"[Preflight] Verification impossible, lancement sans controle: {e}", 'info')
+            return None
+    
+    def _notify(self, title: str, message: str, error: bool = False):
+        """Affiche un message (boîte de dialogue, ou console en mode headless)"""
+        if messagebox is None:
+            print(f"[Launch] {title}: {message}", file=sys.stderr)
+        elif error:
+            messagebox.showerror(title, message)
+        else:
+            messagebox.showinfo(title, message)
+    
     def launch(self) -> bool:
         """Lance l'instance directement - FORCE le serveur Illama uniquement"""
         # Vérifier si le jeu est déjà en cours d'exécution
         if self.is_game_running():
-            print("[Launch] Le jeu est deja en cours d'execution!")
+            emit_event('launch', "[Launch] Le jeu est deja en cours d'execution!", 'info')
             return False
         
         prism_path = self.find_prism_launcher()
         
         if not prism_path:
-            print("[Launch] Prism Launcher non trouve!")
+            emit_event('launch', "[Launch] Prism Launcher non trouve!", 'error')
             return False
         
         # Créer l'instance si elle n'existe pas
         if not self.instance_exists():
-            print("[Launch] Creation de l'instance...")
+            emit_event('launch', "[Launch] Creation de l'instance...", 'info')
             self.create_instance()
         
         # Mettre à jour les paramètres
@@ -2406,7 +3426,7 @@ InstanceType=OneSix
         
         # FORCER le serveur Illama à chaque lancement (écrase toute modification)
         # Faire cela JUSTE AVANT le lancement pour éviter toute modification
-        print("[Launch] Verification et enforcement du serveur Illama...")
+        emit_event('launch', "[Launch] Verification et enforcement du serveur Illama...", 'info')
         self._enforce_server_only()
         self.create_options_txt()
         
@@ -2419,7 +3439,7 @@ InstanceType=OneSix
         try:
             # Lancer Prism avec l'instance directement
             # -l <instance> lance l'instance directement
-            print(f"[Launch] Lancement de l'instance {self.instance_name} avec connexion automatique au serveur...")
+            emit_event('launch', f"[Launch] Lancement de l'instance {self.instance_name} avec connexion automatique au serveur...", 'info')
             
             try:
                 process = subprocess.Popen(
@@ -2428,7 +3448,7 @@ InstanceType=OneSix
                 )
             except PermissionError as e:
                 # Erreur de permission - probablement antivirus ou UAC
-                print(f"[Launch] Erreur de permission: {e}")
+                emit_event('launch', f"[Launch] Erreur de permission: {e}", 'error')
                 error_msg = (
                     "ERREUR: Impossible de lancer Minecraft\n\n"
                     "Cause probable: Votre antivirus bloque le lancement.\n\n"
@@ -2445,12 +3465,12 @@ InstanceType=OneSix
                     "   - Lancez Prism Launcher manuellement\n"
                     "   - Puis lancez l'instance 'Illama Server'"
                 )
-                messagebox.showerror("Erreur de Lancement", error_msg)
+                self._notify("Erreur de Lancement", error_msg, error=True)
                 return False
             
             except OSError as e:
                 # Erreur système - fichier non trouvé ou accès refusé
-                print(f"[Launch] Erreur système: {e}")
+                emit_event('launch', f"[Launch] Erreur système: {e}", 'error')
                 error_msg = (
                     "ERREUR: Impossible de lancer Prism Launcher\n\n"
                     f"Détails: {str(e)}\n\n"
@@ -2462,7 +3482,7 @@ InstanceType=OneSix
                     "Lancez Prism Launcher manuellement,\n"
                     "puis lancez l'instance 'Illama Server'"
                 )
-                messagebox.showerror("Erreur de Lancement", error_msg)
+                self._notify("Erreur de Lancement", error_msg, error=True)
                 return False
             
             # Surveiller et réécrire servers.dat périodiquement pendant que le jeu tourne
@@ -2477,7 +3497,7 @@ InstanceType=OneSix
                 while check_count < max_checks:
                     if not self.is_game_running():
                         # Le jeu s'est arrêté, arrêter la surveillance
-                        print("[Server] Jeu arrete, surveillance terminee")
+                        emit_event('launch.monitor', "[Server] Jeu arrete, surveillance terminee", 'info')
                         break
                     
                     # Vérifier et forcer le serveur toutes les 10 secondes
@@ -2486,18 +3506,19 @@ InstanceType=OneSix
                         self.create_server_dat()
                         self.create_options_txt()  # Réécrire aussi options.txt pour forcer autoConnect
                     except Exception as e:
-                        print(f"[Server] Erreur lors de la surveillance: {e}")
+                        emit_event('launch.monitor', f"[Server] Erreur lors de la surveillance: {e}", 'error')
                     
                     time.sleep(10)  # Attendre 10 secondes avant la prochaine vérification
                     check_count += 1
                 
-                print("[Server] Surveillance terminee")
+                emit_event('launch.monitor', "[Server] Surveillance terminee", 'info')
             
-            threading.Thread(target=monitor_and_enforce_server, daemon=True).start()
+            self.monitor_thread = threading.Thread(target=monitor_and_enforce_server, daemon=True)
+            self.monitor_thread.start()
             
             return True
         except Exception as e:
-            print(f"[Launch] Erreur inattendue: {e}")
+            emit_event('launch', f"[Launch] Erreur inattendue: {e}", 'error')
             import traceback
             traceback.print_exc()
             
@@ -2511,13 +3532,13 @@ InstanceType=OneSix
                 "3. Lancez Prism Launcher manuellement\n\n"
                 "Si le problème persiste, contactez le support."
             )
-            messagebox.showerror("Erreur", error_msg)
+            self._notify("Erreur", error_msg, error=True)
             
             # Fallback: essayer de lancer Prism sans argument
             try:
-                print("[Launch] Tentative de lancement de Prism sans argument...")
+                emit_event('launch', "[Launch] Tentative de lancement de Prism sans argument...", 'info')
                 subprocess.Popen([prism_path])
-                messagebox.showinfo(
+                self._notify(
                     "Lancement Alternatif",
                     "Prism Launcher a été lancé manuellement.\n\n"
                     "Veuillez sélectionner l'instance 'Illama Server'\n"
@@ -2525,7 +3546,7 @@ InstanceType=OneSix
                 )
                 return True
             except Exception as fallback_error:
-                print(f"[Launch] Échec du fallback: {fallback_error}")
+                emit_event('launch', f"[Launch] Échec du fallback: {fallback_error}", 'error')
                 return False
     
     def _enforce_server_only(self):
@@ -2546,16 +3567,16 @@ InstanceType=OneSix
                         # Un fichier avec un seul serveur devrait être relativement petit
                         # Si le fichier fait plus de 500 bytes, il y a probablement plusieurs serveurs
                         if len(content) > 500:
-                            print(f"[Server] Fichier trop volumineux ({len(content)} bytes), reecriture necessaire")
+                            emit_event('server.enforce', f"[Server] Fichier trop volumineux ({len(content)} bytes), reecriture necessaire", 'info')
                             needs_rewrite = True
                         else:
                             # Le fichier semble correct, mais on le réécrit quand même pour être sûr
                             needs_rewrite = True
                     else:
-                        print("[Server] Serveur Illama non trouve dans servers.dat, reecriture necessaire")
+                        emit_event('server.enforce', "[Server] Serveur Illama non trouve dans servers.dat, reecriture necessaire", 'info')
                         needs_rewrite = True
             except Exception as e:
-                print(f"[Server] Erreur lecture servers.dat: {e}, reecriture necessaire")
+                emit_event('server.enforce', f"[Server] Erreur lecture servers.dat: {e}, reecriture necessaire", 'info')
                 needs_rewrite = True
         
         # Toujours réécrire le fichier pour forcer notre serveur
@@ -2573,21 +3594,21 @@ InstanceType=OneSix
                             attrs = win32api.GetFileAttributes(str(server_file))
                             if not (attrs & 1):  # Si pas en lecture seule
                                 win32api.SetFileAttributes(str(server_file), 1)  # FILE_ATTRIBUTE_READONLY
-                                print("[Server] Fichier servers.dat mis en lecture seule")
+                                emit_event('server.enforce', "[Server] Fichier servers.dat mis en lecture seule", 'info')
                         except (ImportError, AttributeError):
                             # Fallback sans win32api
                             import stat
                             os.chmod(server_file, stat.S_IREAD)
-                            print("[Server] Fichier servers.dat mis en lecture seule (fallback)")
+                            emit_event('server.enforce', "[Server] Fichier servers.dat mis en lecture seule (fallback)", 'info')
                     else:
                         os.chmod(server_file, 0o444)  # Lecture seule
-                        print("[Server] Fichier servers.dat mis en lecture seule")
+                        emit_event('server.enforce', "[Server] Fichier servers.dat mis en lecture seule", 'info')
                 except Exception as e:
-                    print(f"[Server] Erreur mise en lecture seule: {e}")
+                    emit_event('server.enforce', f"[Server] Erreur mise en lecture seule: {e}", 'error')
             
-            print("[Server] Enforcement: serveur Illama force et verrouille")
+            emit_event('server.enforce', "[Server] Enforcement: serveur Illama force et verrouille", 'info')
         except Exception as e:
-            print(f"[Server] Erreur enforcement: {e}")
+            emit_event('server.enforce', f"[Server] Erreur enforcement: {e}", 'error')
 
 
 # ============================================================
@@ -2733,6 +3754,7 @@ class LoginScreen:
         self.on_success = on_success
         self.auth = MicrosoftAuth()
         self.root = tk.Tk()
+        self.ui = get_ui_dispatcher(self.root)
         self.root.title("Illama Launcher - Connexion")
         self.root.geometry("550x600")  # Augmenté de 500x450 à 550x600
         self.root.minsize(500, 550)    # Augmenté de 450x400 à 500x550
@@ -2850,47 +3872,48 @@ class LoginScreen:
             user_code = device_data['user_code']
             device_code = device_data['device_code']
             
-            self.root.after(0, lambda c=user_code: self.code_label.config(text=c))
-            self.root.after(0, lambda: self.status.config(text="Code copié ! Entre-le sur microsoft.com/link", 
+            self.ui.post(lambda c=user_code: self.code_label.config(text=c))
+            self.ui.post(lambda: self.status.config(text="Code copié ! Entre-le sur microsoft.com/link", 
                                                          fg=COLORS['minecraft_green']))
-            self.root.after(0, lambda: self.progress.set_progress(10))
+            self.ui.post(lambda: self.progress.set_progress(10))
             
             # COPIER AUTOMATIQUEMENT LE CODE dans le presse-papiers
-            self.root.after(0, lambda: self.root.clipboard_clear())
-            self.root.after(0, lambda c=user_code: self.root.clipboard_append(c))
-            self.root.after(0, lambda: self.root.update())  # Forcer la mise à jour du clipboard
+            self.ui.post(lambda: self.root.clipboard_clear())
+            self.ui.post(lambda c=user_code: self.root.clipboard_append(c))
+            self.ui.post(lambda: self.root.update())  # Forcer la mise à jour du clipboard
             
             # Ouvrir le navigateur
+            import webbrowser
             webbrowser.open('https://microsoft.com/link')
             
             # Poll pour le token
-            self.root.after(0, lambda: self.status.config(text="En attente de connexion..."))
+            self.ui.post(lambda: self.status.config(text="En attente de connexion..."))
             token_data = self.auth.poll_for_token(device_code)
             
-            self.root.after(0, lambda: self.progress.set_progress(30))
-            self.root.after(0, lambda: self.status.config(text="Connexion Xbox Live..."))
+            self.ui.post(lambda: self.progress.set_progress(30))
+            self.ui.post(lambda: self.status.config(text="Connexion Xbox Live..."))
             
             # Xbox Live
             xbox_data = self.auth.get_xbox_token(token_data['access_token'])
             xbox_token = xbox_data['Token']
             user_hash = xbox_data['DisplayClaims']['xui'][0]['uhs']
             
-            self.root.after(0, lambda: self.progress.set_progress(50))
-            self.root.after(0, lambda: self.status.config(text="Verification XSTS..."))
+            self.ui.post(lambda: self.progress.set_progress(50))
+            self.ui.post(lambda: self.status.config(text="Verification XSTS..."))
             
             # XSTS
             xsts_data = self.auth.get_xsts_token(xbox_token)
             xsts_token = xsts_data['Token']
             
-            self.root.after(0, lambda: self.progress.set_progress(70))
-            self.root.after(0, lambda: self.status.config(text="Connexion Minecraft..."))
+            self.ui.post(lambda: self.progress.set_progress(70))
+            self.ui.post(lambda: self.status.config(text="Connexion Minecraft..."))
             
             # Minecraft token
             mc_data = self.auth.get_minecraft_token(xsts_token, user_hash)
             mc_token = mc_data['access_token']
             
-            self.root.after(0, lambda: self.progress.set_progress(85))
-            self.root.after(0, lambda: self.status.config(text="Verification licence..."))
+            self.ui.post(lambda: self.progress.set_progress(85))
+            self.ui.post(lambda: self.status.config(text="Verification licence..."))
             
             # Verifier possession
             if not self.auth.check_game_ownership(mc_token):
@@ -2899,7 +3922,7 @@ class LoginScreen:
             # Profil
             profile = self.auth.get_profile(mc_token)
             
-            self.root.after(0, lambda: self.progress.set_progress(100))
+            self.ui.post(lambda: self.progress.set_progress(100))
             
             # Sauvegarder
             auth_data = {
@@ -2915,11 +3938,11 @@ class LoginScreen:
                 json.dump(auth_data, f)
             
             username = profile['name']
-            self.root.after(0, lambda u=username: self._on_success(u, auth_data))
+            self.ui.post(lambda u=username: self._on_success(u, auth_data))
             
         except Exception as e:
             error_msg = str(e)
-            self.root.after(0, lambda m=error_msg: self._on_error(m))
+            self.ui.post(lambda m=error_msg: self._on_error(m))
     
     def _on_success(self, username, auth_data):
         self.status.config(text=f"Bienvenue {username}!", fg=COLORS['minecraft_green'])
@@ -3312,9 +4335,11 @@ class LauncherGUI:
     """Interface principale du launcher"""
     
     def __init__(self, config: dict = None):
-        self.config = config if config else self.load_config()
+        self.config_store = get_config_store()
+        self.config = self.config_store.bind(config) if config else self.load_config()
         
         self.root = tk.Tk()
+        self.ui = get_ui_dispatcher(self.root)
         self.root.title("Illama Launcher")
         
         # Définir une taille initiale confortable
@@ -3350,12 +4375,13 @@ class LauncherGUI:
         self.update_check_job = None  # Job de vérification périodique
         self.game_monitor_job = None  # Job de surveillance du jeu
         self.game_was_running = False  # État précédent du jeu
+        self._adv_status = {}  # Statuts Java/Prism de l'onglet Avancé (construit à la demande)
         
         # System Tray
         self.tray = SystemTray(self.root, self.quit_app, self.show_window)
         if self.config.get('minimize_to_tray', True):
-            self.tray.setup()
-            self.tray.run()
+            # Import de pystray/PIL différé: la fenêtre s'affiche d'abord
+            self.root.after(200, self._start_tray)
         
         # Intercepter la fermeture
         self.root.protocol("WM_DELETE_WINDOW", self.on_close)
@@ -3381,6 +4407,7 @@ class LauncherGUI:
         # Verifier Prism au demarrage (après la vérification de mise à jour)
         self.root.after(500, self.check_prism_status)
     
+    @traced()
     def setup_style(self):
         style = ttk.Style()
         style.theme_use('clam')
@@ -3428,6 +4455,7 @@ class LauncherGUI:
                  background=[('active', COLORS['accent_green'])],
                  arrowcolor=[('active', COLORS['text_white'])])
     
+    @traced()
     def create_widgets(self):
         # Header avec dégradé moderne
         header = tk.Frame(self.root, bg=COLORS['bg_medium'], height=80, relief='flat')
@@ -3479,11 +4507,48 @@ class LauncherGUI:
         self.notebook.add(self.minecraft_tab, text="  Minecraft  ")
         self.notebook.add(self.advanced_tab, text="  Avance  ")
         
-        self.create_play_tab()
-        self.create_settings_tab()
-        self.create_minecraft_tab()
-        self.create_advanced_tab()
+        # Onglets construits à leur première sélection (Jouer tout de suite)
+        self._tab_frames = {
+            'play': self.play_tab,
+            'settings': self.settings_tab,
+            'minecraft': self.minecraft_tab,
+            'advanced': self.advanced_tab,
+        }
+        self._tab_builders = {
+            'play': self.create_play_tab,
+            'settings': self.create_settings_tab,
+            'minecraft': self.create_minecraft_tab,
+            'advanced': self.create_advanced_tab,
+        }
+        self._built_tabs = set()
+        self._minecraft_sections = None
+        self.ensure_tab('play')
+        self.notebook.bind('<<NotebookTabChanged>>', self._on_tab_changed)
     
+    def ensure_tab(self, name: str, complete: bool = False):
+        """
+        Construit un onglet s'il ne l'est pas encore
+        
+        Args:
+            name: 'play', 'settings', 'minecraft' ou 'advanced'
+            complete: Termine immédiatement les sections construites par étapes
+                      (quand le code a besoin de leurs variables)
+        """
+        if name not in self._built_tabs:
+            self._built_tabs.add(name)
+            self._tab_builders[name]()
+        if complete and name == 'minecraft':
+            self._finish_minecraft_tab()
+    
+    def _on_tab_changed(self, event=None):
+        """Construit l'onglet sélectionné à sa première ouverture"""
+        selected = self.notebook.select()
+        for name, frame in self._tab_frames.items():
+            if str(frame) == selected:
+                self.ensure_tab(name)
+                break
+    
+    @traced()
     def create_play_tab(self):
         """Onglet principal pour jouer"""
         main = tk.Frame(self.play_tab, bg=COLORS['bg_dark'])
@@ -3552,9 +4617,11 @@ class LauncherGUI:
         scrollbar = ttk.Scrollbar(self.log_text, orient='vertical', command=self.log_text.yview)
         scrollbar.pack(side='right', fill='y')
         self.log_text.configure(yscrollcommand=scrollbar.set)
+        self.log_console = LogConsole(self.log_text)
         
         self.log("Illama Launcher demarre")
     
+    @traced()
     def create_settings_tab(self):
         """Onglet parametres"""
         scroll = ScrollableFrame(self.settings_tab)
@@ -3621,13 +4688,14 @@ class LauncherGUI:
         opt_frame = tk.Frame(ram_frame, bg=COLORS['bg_medium'])
         opt_frame.pack(fill='x', pady=(15, 0))
         
-        total_ram = get_system_ram_mb()
-        profile = get_optimization_profile(total_ram)
+        system = get_system_profile()
+        total_ram = system.total_ram_mb
+        profile = system.optimization_profile
         profile_names = {"low_end": "Petit PC", "medium": "PC Moyen", "high": "PC Performant"}
         profile_name = profile_names.get(profile, "PC Moyen")
         
         info_label = tk.Label(opt_frame, 
-                            text=f"RAM detectee: {total_ram}MB ({total_ram/1024:.1f}GB) - Profil: {profile_name}",
+                            text=f"RAM detectee: {total_ram}MB ({total_ram/1024:.1f}GB, {system.available_ram_mb}MB libres) - Profil: {profile_name}",
                             font=('Segoe UI', 9),
                             bg=COLORS['bg_medium'], fg=COLORS['text_gray'])
         info_label.pack(side='left', padx=(0, 10))
@@ -3805,13 +4873,35 @@ class LauncherGUI:
                                  color='green', width=150, height=40)
         save_btn.pack(pady=20)
     
+    @traced()
     def create_minecraft_tab(self):
-        """Onglet pour gérer tous les paramètres Minecraft"""
+        """Onglet pour gérer tous les paramètres Minecraft (sections construites par étapes)"""
         scroll = ScrollableFrame(self.minecraft_tab)
         scroll.pack(fill='both', expand=True)
         
-        main = scroll.scrollable_frame
-        
+        self._minecraft_sections = self._build_minecraft_sections(scroll.scrollable_frame)
+        self._build_next_minecraft_section()
+    
+    def _build_next_minecraft_section(self):
+        """Construit une section puis rend la main à Tk (l'onglet reste réactif)"""
+        if self._minecraft_sections is None:
+            return
+        try:
+            next(self._minecraft_sections)
+        except StopIteration:
+            self._minecraft_sections = None
+            return
+        self.root.after(1, self._build_next_minecraft_section)
+    
+    def _finish_minecraft_tab(self):
+        """Construit tout de suite les sections restantes de l'onglet Minecraft"""
+        if self._minecraft_sections is not None:
+            for _ in self._minecraft_sections:
+                pass
+            self._minecraft_sections = None
+    
+    def _build_minecraft_sections(self, main):
+        """Générateur: une section de l'onglet Minecraft par étape"""
         # Charger les options Minecraft existantes
         minecraft_options = self.config.get('minecraft_options', {})
         
@@ -3906,6 +4996,8 @@ class LauncherGUI:
                                   selectcolor=COLORS['bg_dark'], font=('Segoe UI', 10))
         vbo_check.pack(anchor='w', pady=(5, 0))
         
+        yield
+        
         # Section Rendu Avancé
         render_adv_frame = tk.Frame(main, bg=COLORS['bg_medium'], padx=20, pady=15)
         render_adv_frame.pack(fill='x', padx=20, pady=(0, 10))
@@ -4017,6 +5109,8 @@ class LauncherGUI:
                                        selectcolor=COLORS['bg_dark'], font=('Segoe UI', 10))
         sun_moon_check.pack(anchor='w', pady=(5, 0))
         
+        yield
+        
         # Section Performance
         perf_frame = tk.Frame(main, bg=COLORS['bg_medium'], padx=20, pady=15)
         perf_frame.pack(fill='x', padx=20, pady=(0, 10))
@@ -4049,6 +5143,8 @@ class LauncherGUI:
                                       selectcolor=COLORS['bg_dark'], font=('Segoe UI', 10))
         animate_check.pack(anchor='w', pady=(5, 0))
         
+        yield
+        
         # Section Audio
         audio_frame = tk.Frame(main, bg=COLORS['bg_medium'], padx=20, pady=15)
         audio_frame.pack(fill='x', padx=20, pady=(0, 10))
@@ -4084,6 +5180,8 @@ class LauncherGUI:
                               length=200, showvalue=True)
         music_scale.pack(side='left', padx=(10, 0))
         
+        yield
+        
         # Section Contrôles
         controls_frame = tk.Frame(main, bg=COLORS['bg_medium'], padx=20, pady=15)
         controls_frame.pack(fill='x', padx=20, pady=(0, 10))
@@ -4119,6 +5217,8 @@ class LauncherGUI:
                                        selectcolor=COLORS['bg_dark'], font=('Segoe UI', 10))
         autojump_check.pack(anchor='w', pady=(5, 0))
         
+        yield
+        
         # Section Interface
         interface_frame = tk.Frame(main, bg=COLORS['bg_medium'], padx=20, pady=15)
         interface_frame.pack(fill='x', padx=20, pady=(0, 10))
@@ -4156,6 +5256,8 @@ class LauncherGUI:
                                       selectcolor=COLORS['bg_dark'], font=('Segoe UI', 10))
         bobbing_check.pack(anchor='w', pady=(5, 0))
         
+        yield
+        
         # Section Chat
         chat_frame = tk.Frame(main, bg=COLORS['bg_medium'], padx=20, pady=15)
         chat_frame.pack(fill='x', padx=20, pady=(0, 10))
@@ -4184,6 +5286,8 @@ class LauncherGUI:
                                            selectcolor=COLORS['bg_dark'], font=('Segoe UI', 10))
         chat_colors_check.pack(anchor='w', pady=(5, 0))
         
+        yield
+        
         # Section Resource Packs et Shaders
         packs_frame = tk.Frame(main, bg=COLORS['bg_medium'], padx=20, pady=15)
         packs_frame.pack(fill='x', padx=20, pady=(0, 10))
@@ -4244,6 +5348,8 @@ class LauncherGUI:
         # Charger la liste des packs
         self.root.after(100, self.refresh_packs_list)
         
+        yield
+        
         # Section Autres
         other_frame = tk.Frame(main, bg=COLORS['bg_medium'], padx=20, pady=15)
         other_frame.pack(fill='x', padx=20, pady=(0, 10))
@@ -4282,10 +5388,22 @@ class LauncherGUI:
                                     color='green', width=250, height=40)
         save_mc_btn.pack(pady=20)
     
+    def get_minecraft_launcher(self) -> 'MinecraftLauncher':
+        """
+        MinecraftLauncher partagé par l'interface (chemins résolus une seule fois)
+        Recréé uniquement si l'instance configurée change
+        """
+        instance_name = self.config.get('prism_instance_name', 'IllamaServer')
+        launcher = getattr(self, '_minecraft_launcher', None)
+        if launcher is None or launcher.instance_name != instance_name:
+            launcher = MinecraftLauncher(self.config)
+            self._minecraft_launcher = launcher
+        return launcher
+    
     def upload_resourcepack(self):
         """Ouvre un dialogue pour uploader un resource pack"""
         try:
-            launcher = MinecraftLauncher(self.config)
+            launcher = self.get_minecraft_launcher()
             resourcepacks_dir = launcher.get_resourcepacks_dir()
             resourcepacks_dir.mkdir(parents=True, exist_ok=True)
             
@@ -4314,7 +5432,7 @@ class LauncherGUI:
     def upload_shader(self):
         """Ouvre un dialogue pour uploader un shader"""
         try:
-            launcher = MinecraftLauncher(self.config)
+            launcher = self.get_minecraft_launcher()
             shaderpacks_dir = launcher.get_shaderpacks_dir()
             shaderpacks_dir.mkdir(parents=True, exist_ok=True)
             
@@ -4343,7 +5461,7 @@ class LauncherGUI:
     def open_packs_folders(self):
         """Ouvre les dossiers resourcepacks et shaderpacks dans l'explorateur"""
         try:
-            launcher = MinecraftLauncher(self.config)
+            launcher = self.get_minecraft_launcher()
             resourcepacks_dir = launcher.get_resourcepacks_dir()
             shaderpacks_dir = launcher.get_shaderpacks_dir()
             
@@ -4368,31 +5486,38 @@ class LauncherGUI:
             messagebox.showerror("Erreur", f"Impossible d'ouvrir les dossiers:\n{e}")
     
     def refresh_packs_list(self):
-        """Rafraîchit la liste des resource packs et shaders installés"""
-        try:
-            if not hasattr(self, 'packs_listbox'):
-                return
-            
-            self.packs_listbox.delete(0, tk.END)
-            
-            launcher = MinecraftLauncher(self.config)
-            resourcepacks_dir = launcher.get_resourcepacks_dir()
-            shaderpacks_dir = launcher.get_shaderpacks_dir()
-            
-            # Ajouter les resource packs
-            if resourcepacks_dir.exists():
-                for pack_file in resourcepacks_dir.glob('*.zip'):
-                    self.packs_listbox.insert(tk.END, f"📦 Resource Pack: {pack_file.name}")
-            
-            # Ajouter les shaders
-            if shaderpacks_dir.exists():
-                for shader_file in shaderpacks_dir.glob('*.zip'):
-                    self.packs_listbox.insert(tk.END, f"✨ Shader: {shader_file.name}")
-            
-            if self.packs_listbox.size() == 0:
-                self.packs_listbox.insert(tk.END, "Aucun pack installe")
-        except Exception as e:
-            self.log(f"Erreur rafraîchissement liste packs: {e}")
+        """Rafraîchit la liste des resource packs et shaders installés (lecture disque en arrière-plan)"""
+        if not hasattr(self, 'packs_listbox'):
+            return
+        launcher = self.get_minecraft_launcher()
+        
+        def scan():
+            try:
+                entries = []
+                resourcepacks_dir = launcher.get_resourcepacks_dir()
+                shaderpacks_dir = launcher.get_shaderpacks_dir()
+                
+                # Ajouter les resource packs
+                if resourcepacks_dir.exists():
+                    for pack_file in resourcepacks_dir.glob('*.zip'):
+                        entries.append(f"📦 Resource Pack: {pack_file.name}")
+                
+                # Ajouter les shaders
+                if shaderpacks_dir.exists():
+                    for shader_file in shaderpacks_dir.glob('*.zip'):
+                        entries.append(f"✨ Shader: {shader_file.name}")
+                
+                self.ui.post(lambda: self._fill_packs_list(entries))
+            except Exception as e:
+                message = f"Erreur rafraîchissement liste packs: {e}"
+                self.ui.post(lambda: self.log(message))
+        
+        threading.Thread(target=scan, daemon=True).start()
+    
+    def _fill_packs_list(self, entries: list):
+        """Remplit la liste des packs en une seule insertion"""
+        self.packs_listbox.delete(0, tk.END)
+        self.packs_listbox.insert(tk.END, *(entries or ["Aucun pack installe"]))
     
     def delete_selected_pack(self):
         """Supprime le pack sélectionné dans la liste"""
@@ -4408,12 +5533,12 @@ class LauncherGUI:
             if "Resource Pack:" in selected_text:
                 file_name = selected_text.split("Resource Pack: ")[1].strip()
                 pack_type = "resource pack"
-                launcher = MinecraftLauncher(self.config)
+                launcher = self.get_minecraft_launcher()
                 file_path = launcher.get_resourcepacks_dir() / file_name
             elif "Shader:" in selected_text:
                 file_name = selected_text.split("Shader: ")[1].strip()
                 pack_type = "shader"
-                launcher = MinecraftLauncher(self.config)
+                launcher = self.get_minecraft_launcher()
                 file_path = launcher.get_shaderpacks_dir() / file_name
             else:
                 messagebox.showwarning("Erreur", "Impossible de determiner le type de pack")
@@ -4449,15 +5574,16 @@ class LauncherGUI:
         except:
             return 0
     
+    @traced()
     def check_for_updates(self, silent: bool = False):
         """Vérifie les mises à jour disponibles sur GitHub"""
         def check():
             try:
-                self.root.after(0, lambda: self.log("Verification des mises a jour..."))
+                self.ui.post(lambda: self.log("Verification des mises a jour..."))
                 
                 # Vérifier la version minimale requise
                 if self.compare_versions(LAUNCHER_VERSION, MIN_REQUIRED_VERSION) < 0:
-                    self.root.after(0, lambda: self._force_update_dialog(
+                    self.ui.post(lambda: self._force_update_dialog(
                         f"Version minimale requise: {MIN_REQUIRED_VERSION}\n"
                         f"Votre version: {LAUNCHER_VERSION}\n\n"
                         "Une mise a jour est obligatoire pour continuer."
@@ -4505,27 +5631,27 @@ class LauncherGUI:
                     # Comparer les versions
                     if self.compare_versions(LAUNCHER_VERSION, latest_version) < 0:
                         # Mise à jour disponible
-                        self.root.after(0, lambda: self._show_update_dialog(
+                        self.ui.post(lambda: self._show_update_dialog(
                             latest_version, 
                             data.get('body', ''),
                             final_url
                         ))
                     else:
                         if not silent:
-                            self.root.after(0, lambda: self.log(f"Launcher a jour (v{LAUNCHER_VERSION})"))
+                            self.ui.post(lambda: self.log(f"Launcher a jour (v{LAUNCHER_VERSION})"))
             
             except urllib.error.URLError as e:
                 if not silent:
                     error_msg = str(e) if e else "Erreur de connexion"
-                    self.root.after(0, lambda: self.log(f"Impossible de verifier les mises a jour: {error_msg}"))
+                    self.ui.post(lambda: self.log(f"Impossible de verifier les mises a jour: {error_msg}"))
             except urllib.error.HTTPError as e:
                 if not silent:
                     error_msg = f"HTTP {e.code}: {e.reason}" if e else "Erreur HTTP"
-                    self.root.after(0, lambda: self.log(f"Impossible de verifier les mises a jour: {error_msg}"))
+                    self.ui.post(lambda: self.log(f"Impossible de verifier les mises a jour: {error_msg}"))
             except Exception as e:
                 if not silent:
                     error_msg = str(e) if e else "Erreur inconnue"
-                    self.root.after(0, lambda: self.log(f"Erreur verification mises a jour: {error_msg}"))
+                    self.ui.post(lambda: self.log(f"Erreur verification mises a jour: {error_msg}"))
         
         threading.Thread(target=check, daemon=True).start()
     
@@ -4571,14 +5697,14 @@ class LauncherGUI:
         
         def check_game_status():
             try:
-                launcher = MinecraftLauncher(self.config)
+                launcher = self.get_minecraft_launcher()
                 is_running = launcher.is_game_running()
                 
                 # Si le jeu était en cours d'exécution et qu'il ne l'est plus maintenant
                 if self.game_was_running and not is_running:
                     # Le jeu s'est fermé, restaurer le launcher
                     print("[Game Monitor] Le jeu s'est ferme, restauration du launcher...")
-                    self.root.after(0, self._restore_launcher_after_game)
+                    self.ui.post(self._restore_launcher_after_game)
                     # Arrêter la surveillance
                     self.stop_game_monitoring()
                 elif is_running:
@@ -4673,6 +5799,7 @@ class LauncherGUI:
         
         def download_update():
             dialog.destroy()
+            import webbrowser
             webbrowser.open(f"https://github.com/{GITHUB_REPO_OWNER}/{GITHUB_REPO_NAME}/releases/latest")
             self.root.after(1000, self.root.quit)
         
@@ -4737,6 +5864,7 @@ class LauncherGUI:
         
         def download_update():
             dialog.destroy()
+            import webbrowser
             webbrowser.open(download_url if download_url else 
                           f"https://github.com/{GITHUB_REPO_OWNER}/{GITHUB_REPO_NAME}/releases/latest")
             self.log("Redirection vers la page de telechargement")
@@ -4828,20 +5956,23 @@ class LauncherGUI:
                                 size_mb = downloaded_size / 1024 / 1024
                                 total_mb = total_size / 1024 / 1024
                                 
-                                progress_dialog.after(0, lambda p=progress: progress_bar.set_progress(p))
-                                progress_dialog.after(0, lambda p=progress: progress_label.config(text=f"{p:.1f}%"))
-                                progress_dialog.after(0, lambda s=f"{size_mb:.1f} MB / {total_mb:.1f} MB": status_label.config(text=s))
+                                # Une seule entrée en attente: seul le dernier état est affiché
+                                self.ui.post(lambda p=progress, s=f"{size_mb:.1f} MB / {total_mb:.1f} MB": (
+                                    progress_bar.set_progress(p),
+                                    progress_label.config(text=f"{p:.1f}%"),
+                                    status_label.config(text=s)
+                                ), key='update_download')
                 
                 # Vérifier que le fichier est valide
                 if download_path.stat().st_size < 1000000:  # Moins de 1 MB = invalide
                     raise Exception("Fichier telecharge invalide")
                 
                 # Fermer le dialogue de progression
-                progress_dialog.after(0, progress_dialog.destroy)
+                self.ui.post(progress_dialog.destroy)
                 
                 # Lancer l'installateur
-                self.root.after(0, lambda: self.log("Installateur de mise a jour telecharge, fermeture du launcher..."))
-                self.root.after(0, lambda: status_label.config(text="Fermeture du launcher et lancement de l'installateur..."))
+                self.ui.post(lambda: self.log("Installateur de mise a jour telecharge, fermeture du launcher..."))
+                self.ui.post(lambda: status_label.config(text="Fermeture du launcher et lancement de l'installateur..."))
                 
                 if sys.platform == 'win32':
                     # Créer un script batch qui attend la fermeture complète du launcher puis lance l'installateur
@@ -4990,7 +6121,7 @@ exit
                                 sys.exit(0)
                         
                         # Laisser un court délai pour que l'interface affiche le message
-                        self.root.after(500, force_quit)
+                        self.ui.post(lambda: self.root.after(500, force_quit))
                     except Exception as e:
                         print(f"[Update] Erreur creation script batch: {e}")
                         # Fallback: lancer directement l'installateur après fermeture
@@ -5011,7 +6142,7 @@ exit
                             except:
                                 import sys
                                 sys.exit(0)
-                        self.root.after(100, fallback_install)
+                        self.ui.post(lambda: self.root.after(100, fallback_install))
                 else:
                     # Linux/Mac - fermer puis ouvrir
                     def close_and_install():
@@ -5037,22 +6168,23 @@ exit
                 
             except urllib.error.HTTPError as e:
                 if e.code == 404:
-                    progress_dialog.after(0, lambda: messagebox.showerror("Erreur",
+                    self.ui.post(lambda: messagebox.showerror("Erreur",
                         "L'installateur n'a pas ete trouve sur GitHub.\n\n"
                         "Assure-toi que le fichier 'IllamaLauncher_Setup.exe' est bien present dans la release."))
                 else:
-                    progress_dialog.after(0, lambda: messagebox.showerror("Erreur",
+                    self.ui.post(lambda: messagebox.showerror("Erreur",
                         f"Erreur HTTP {e.code} lors du telechargement."))
-                progress_dialog.after(0, progress_dialog.destroy)
+                self.ui.post(progress_dialog.destroy)
             except Exception as e:
                 error_msg = str(e)
-                progress_dialog.after(0, lambda: messagebox.showerror("Erreur",
+                self.ui.post(lambda: messagebox.showerror("Erreur",
                     f"Impossible de telecharger la mise a jour:\n\n{error_msg}\n\n"
                     "Tu peux telecharger manuellement depuis GitHub."))
-                progress_dialog.after(0, progress_dialog.destroy)
+                self.ui.post(progress_dialog.destroy)
         
         threading.Thread(target=download, daemon=True).start()
     
+    @traced()
     def create_advanced_tab(self):
         """Onglet avance"""
         scroll = ScrollableFrame(self.advanced_tab)
@@ -5132,6 +6264,8 @@ exit
         self.java_adv_status = tk.Label(java_frame, text="Vérification en cours...",
                                        font=('Segoe UI', 10), bg=COLORS['bg_medium'], fg=COLORS['text_gray'])
         self.java_adv_status.pack(anchor='w', pady=(10, 10))
+        # Dernier état connu (vérifié avant la construction de l'onglet)
+        self.java_adv_status.config(**self._adv_status.get('java', {}))
         
         java_btns = tk.Frame(java_frame, bg=COLORS['bg_medium'])
         java_btns.pack(fill='x')
@@ -5144,6 +6278,11 @@ exit
                                          color='gold', width=100, height=32)
         install_java_btn.pack(side='left', padx=(10, 0))
         
+        if QUICK_WINS_JVM_BENCHMARK:
+            bench_java_btn = AnimatedButton(java_btns, "Benchmark", self.run_jvm_benchmark,
+                                           color='gray', width=110, height=32)
+            bench_java_btn.pack(side='left', padx=(10, 0))
+        
         # Prism
         prism_frame = tk.Frame(main, bg=COLORS['bg_medium'], padx=20, pady=15)
         prism_frame.pack(fill='x', padx=20, pady=(0, 10))
@@ -5154,6 +6293,7 @@ exit
         self.prism_adv_status = tk.Label(prism_frame, text="Verification...",
                                         font=('Segoe UI', 10), bg=COLORS['bg_medium'], fg=COLORS['text_gray'])
         self.prism_adv_status.pack(anchor='w', pady=(10, 10))
+        self.prism_adv_status.config(**self._adv_status.get('prism', {}))
         
         prism_btns = tk.Frame(prism_frame, bg=COLORS['bg_medium'])
         prism_btns.pack(fill='x')
@@ -5317,6 +6457,23 @@ exit
         tk.Label(chunk_frame, text="(8-128 KB, recommande: 32)", font=('Segoe UI', 9),
                 bg=COLORS['bg_medium'], fg=COLORS['text_gray']).pack(side='left', padx=(5, 0))
         
+        # Performances des synchronisations
+        if QUICK_WINS_SYNC_REPORT:
+            perf_frame = tk.Frame(main, bg=COLORS['bg_medium'], padx=20, pady=15)
+            perf_frame.pack(fill='x', padx=20, pady=(0, 10))
+            
+            tk.Label(perf_frame, text="Performances de synchronisation", font=('Segoe UI', 12, 'bold'),
+                    bg=COLORS['bg_medium'], fg=COLORS['text_white']).pack(anchor='w')
+            
+            tk.Label(perf_frame, text="Derniere sync et historique par version du launcher",
+                    font=('Segoe UI', 9), bg=COLORS['bg_medium'], fg=COLORS['text_gray']).pack(anchor='w', pady=(5, 10))
+            
+            self.sync_report_label = tk.Label(perf_frame, text="Aucune synchronisation enregistree",
+                                             font=('Consolas', 9), justify='left', anchor='w',
+                                             bg=COLORS['bg_medium'], fg=COLORS['text_white'])
+            self.sync_report_label.pack(fill='x')
+            self._refresh_sync_report()
+        
         # Compte
         acc_frame = tk.Frame(main, bg=COLORS['bg_medium'], padx=20, pady=15)
         acc_frame.pack(fill='x', padx=20, pady=(0, 10))
@@ -5353,69 +6510,121 @@ exit
             self.forge_combo['values'] = data['versions']
             self.forge_var.set(data['recommended'])
     
+    def _set_adv_status(self, kind: str, **options):
+        """Met à jour le statut 'java' ou 'prism' de l'onglet Avancé, même s'il n'est pas encore construit"""
+        self._adv_status.setdefault(kind, {}).update(options)
+        label = getattr(self, f'{kind}_adv_status', None)
+        if label is not None:
+            label.config(**options)
+    
+    @traced()
     def check_java_status(self):
         """Vérifie si Java est installé et compatible"""
         self.log("Verification de Java...")
-        self.java_adv_status.config(text="Verification...", fg=COLORS['text_gray'])
+        self._set_adv_status('java', text="Verification...", fg=COLORS['text_gray'])
         
         def verify():
             try:
-                java_path = JavaManager.find_java()
+                # Redécouverte en arrière-plan: le clic sur Jouer n'aura plus qu'un stat() à faire
+                java_path = JavaManager.find_java(refresh=True)
                 if java_path:
                     version_info = JavaManager.check_java_version(java_path)
                     if version_info:
                         major_version = version_info[0]
                         if JavaManager.is_java_compatible(java_path):
-                            self.root.after(0, lambda: self.java_adv_status.config(
+                            self.ui.post(lambda: self._set_adv_status('java',
                                 text=f"Java {major_version} installe: {java_path}", 
                                 fg=COLORS['minecraft_green']))
-                            self.root.after(0, lambda: self.log(f"Java {major_version} OK: {java_path}"))
+                            self.ui.post(lambda: self.log(f"Java {major_version} OK: {java_path}"))
                         else:
-                            self.root.after(0, lambda: self.java_adv_status.config(
+                            self.ui.post(lambda: self._set_adv_status('java',
                                 text=f"Java {major_version} incompatible (requis: {JavaManager.REQUIRED_JAVA_VERSION}+)", 
                                 fg=COLORS['accent_red']))
-                            self.root.after(0, lambda: self.log(f"Java {major_version} incompatible"))
+                            self.ui.post(lambda: self.log(f"Java {major_version} incompatible"))
                     else:
                         # Afficher la sortie brute pour debug
                         version_output = version_info[1] if version_info else "N/A"
-                        self.root.after(0, lambda: self.java_adv_status.config(
+                        self.ui.post(lambda: self._set_adv_status('java',
                             text=f"Java detecte mais version inconnue (sortie: {version_output[:50]}...)", 
                             fg=COLORS['accent_red']))
-                        self.root.after(0, lambda: self.log(f"Java detecte mais version inconnue. Sortie: {version_output}"))
+                        self.ui.post(lambda: self.log(f"Java detecte mais version inconnue. Sortie: {version_output}"))
                 else:
-                    self.root.after(0, lambda: self.java_adv_status.config(
+                    self.ui.post(lambda: self._set_adv_status('java',
                         text="Java non trouve", 
                         fg=COLORS['accent_red']))
-                    self.root.after(0, lambda: self.log("Java non trouve"))
+                    self.ui.post(lambda: self.log("Java non trouve"))
             except Exception as e:
-                self.root.after(0, lambda: self.java_adv_status.config(
+                self.ui.post(lambda: self._set_adv_status('java',
                     text=f"Erreur: {e}", 
                     fg=COLORS['accent_red']))
-                self.root.after(0, lambda: self.log(f"Erreur verification Java: {e}"))
+                self.ui.post(lambda: self.log(f"Erreur verification Java: {e}"))
         
         threading.Thread(target=verify, daemon=True).start()
     
+    def run_jvm_benchmark(self):
+        """Mesure les jeux de flags JVM sur ce PC et mémorise le meilleur pour le profil RAM"""
+        if getattr(self, '_jvm_benchmark_running', False):
+            return
+        self._jvm_benchmark_running = True
+        self.log("Benchmark JVM: mesure des flags GC (quelques minutes)...")
+        self._set_adv_status('java', text="Benchmark JVM en cours...", fg=COLORS['text_gray'])
+        
+        def bench():
+            try:
+                java_path = JavaManager.find_java()
+                if not java_path:
+                    self.ui.post(lambda: self.log("Benchmark JVM impossible: Java non trouve"))
+                    return
+                system = get_system_profile(refresh=True)
+                profile = system.optimization_profile
+                _, heap_mb = get_optimized_ram_settings(profile, system.total_ram_mb, system.available_ram_mb)
+                
+                def progress(msg, current, total):
+                    self.ui.post(lambda: self._set_adv_status('java', text=f"{msg} ({current}/{total})"),
+                                 key='jvm_benchmark')
+                
+                winner = quick_win('jvm_benchmark').run_jvm_benchmark(java_path, profile, heap_mb, progress)
+                if winner:
+                    self.ui.post(lambda: self._set_adv_status('java',
+                        text=f"Flags JVM retenus: {winner.name} (profil {profile})",
+                        fg=COLORS['minecraft_green']))
+                    self.ui.post(lambda: self.log(
+                        f"Benchmark JVM: {winner.name} retenu ({winner.run_ms}ms, pause max {winner.max_pause_ms:.1f}ms)"))
+                else:
+                    self.ui.post(lambda: self._set_adv_status('java',
+                        text="Benchmark JVM: aucun resultat", fg=COLORS['accent_red']))
+            except Exception as e:
+                # e est supprimé à la fin du bloc except: figer le message pour les callbacks
+                msg = str(e)
+                self.ui.post(lambda m=msg: self._set_adv_status('java',
+                    text=f"Erreur benchmark: {m}", fg=COLORS['accent_red']))
+                self.ui.post(lambda m=msg: self.log(f"Erreur benchmark JVM: {m}"))
+            finally:
+                self._jvm_benchmark_running = False
+        
+        threading.Thread(target=bench, daemon=True).start()
+    
     def install_java_manual(self):
         """Télécharge et installe Java manuellement"""
         # Vérifier d'abord si Java est déjà installé et compatible
         self.log("Verification de Java avant installation...")
-        self.java_adv_status.config(text="Verification...", fg=COLORS['text_gray'])
+        self._set_adv_status('java', text="Verification...", fg=COLORS['text_gray'])
         
         def check_and_install():
             try:
                 # Vérifier si Java est déjà installé et compatible
-                java_path = JavaManager.find_java()
+                java_path = JavaManager.find_java(refresh=True)
                 if java_path:
                     version_info = JavaManager.check_java_version(java_path)
                     if version_info:
                         major_version = version_info[0]
                         if JavaManager.is_java_compatible(java_path):
                             # Java est déjà installé et compatible
-                            self.root.after(0, lambda: self.java_adv_status.config(
+                            self.ui.post(lambda: self._set_adv_status('java',
                                 text=f"Java {major_version} deja installe et compatible", 
                                 fg=COLORS['minecraft_green']))
-                            self.root.after(0, lambda: self.log(f"Java {major_version} deja installe: {java_path}"))
-                            self.root.after(0, lambda: messagebox.showinfo(
+                            self.ui.post(lambda: self.log(f"Java {major_version} deja installe: {java_path}"))
+                            self.ui.post(lambda: messagebox.showinfo(
                                 "Java déjà installé",
                                 f"Java {major_version} est déjà installé et compatible.\n\n"
                                 f"Chemin: {java_path}\n\n"
@@ -5424,34 +6633,34 @@ exit
                             return
                         else:
                             # Java est installé mais version incompatible
-                            self.root.after(0, lambda: self.log(
+                            self.ui.post(lambda: self.log(
                                 f"Java {major_version} installe mais incompatible, installation d'une nouvelle version..."))
                             # Continuer avec l'installation
                     else:
                         # Java trouvé mais version inconnue
-                        self.root.after(0, lambda: self.log("Java detecte mais version inconnue, installation d'une nouvelle version..."))
+                        self.ui.post(lambda: self.log("Java detecte mais version inconnue, installation d'une nouvelle version..."))
                         # Continuer avec l'installation
                 else:
                     # Java non trouvé, continuer avec l'installation
-                    self.root.after(0, lambda: self.log("Java non trouve, installation necessaire..."))
+                    self.ui.post(lambda: self.log("Java non trouve, installation necessaire..."))
                 
                 # Si on arrive ici, Java n'est pas compatible ou n'existe pas, on peut installer
-                self.root.after(0, lambda: self.log("Telechargement de Java..."))
-                self.root.after(0, lambda: self.java_adv_status.config(
+                self.ui.post(lambda: self.log("Telechargement de Java..."))
+                self.ui.post(lambda: self._set_adv_status('java',
                     text="Telechargement...", fg=COLORS['accent_gold']))
                 
                 installer_path = JavaManager.download_java_installer(
                     version=JavaManager.REQUIRED_JAVA_VERSION,
-                    progress_callback=lambda msg, current, total: self.root.after(0, lambda: (
+                    progress_callback=lambda msg, current, total: self.ui.post(lambda: (
                         self.log(msg),
-                        self.java_adv_status.config(text=msg)
+                        self._set_adv_status('java', text=msg)
                     ))
                 )
                 
                 if installer_path:
-                    self.root.after(0, lambda: self.java_adv_status.config(
+                    self.ui.post(lambda: self._set_adv_status('java',
                         text="Installation en cours...", fg=COLORS['accent_gold']))
-                    self.root.after(0, lambda: messagebox.showinfo(
+                    self.ui.post(lambda: messagebox.showinfo(
                         "Installation Java",
                         f"Java va être installé.\n\n"
                         f"Fichier: {installer_path.name}\n\n"
@@ -5462,16 +6671,16 @@ exit
                     success = JavaManager.install_java(installer_path, silent=True)
                     
                     if success:
-                        self.root.after(0, lambda: self.java_adv_status.config(
+                        self.ui.post(lambda: self._set_adv_status('java',
                             text="Installation terminee. Redemarrez le launcher.", 
                             fg=COLORS['minecraft_green']))
-                        self.root.after(0, lambda: messagebox.showinfo(
+                        self.ui.post(lambda: messagebox.showinfo(
                             "Installation terminee",
                             "Java a ete installe avec succes!\n\n"
                             "Veuillez redemarrer le launcher pour que les changements prennent effet."
                         ))
                     else:
-                        self.root.after(0, lambda: self.java_adv_status.config(
+                        self.ui.post(lambda: self._set_adv_status('java',
                             text="Erreur installation", fg=COLORS['accent_red']))
                 else:
                     error_msg = (
@@ -5482,26 +6691,30 @@ exit
                         "3. Installez Java\n"
                         "4. Redémarrez le launcher"
                     )
-                    self.root.after(0, lambda: self.java_adv_status.config(
+                    self.ui.post(lambda: self._set_adv_status('java',
                         text="Erreur telechargement", fg=COLORS['accent_red']))
-                    self.root.after(0, lambda: messagebox.showerror(
+                    self.ui.post(lambda: messagebox.showerror(
                         "Erreur téléchargement Java",
                         error_msg
                     ))
             except Exception as e:
                 error_msg = f"Erreur lors de l'installation de Java:\n\n{e}\n\nVeuillez installer Java manuellement depuis https://adoptium.net/"
-                self.root.after(0, lambda: self.java_adv_status.config(
+                self.ui.post(lambda: self._set_adv_status('java',
                     text=f"Erreur: {str(e)[:50]}...", fg=COLORS['accent_red']))
-                self.root.after(0, lambda: self.log(f"Erreur installation Java: {e}"))
-                self.root.after(0, lambda: messagebox.showerror(
+                self.ui.post(lambda: self.log(f"Erreur installation Java: {e}"))
+                self.ui.post(lambda: messagebox.showerror(
                     "Erreur installation Java",
                     error_msg
                 ))
         
         threading.Thread(target=check_and_install, daemon=True).start()
     
+    @traced()
     def check_prism_status(self):
         """Verifie si Prism est installe et valide"""
+        if QUICK_WINS_PRISM_CATALOG:
+            # Prism vient peut-être d'être installé ou déplacé
+            invalidate_prism_data_dir()
         launcher = MinecraftLauncher(self.config)
         prism_path = launcher.find_prism_launcher()
         
@@ -5514,33 +6727,33 @@ exit
                     if file_size > 1000000:  # Au moins 1 MB
                         self.prism_status.config(text=f"Prism Launcher installe ({file_size / 1024 / 1024:.1f} MB)", 
                                                 fg=COLORS['minecraft_green'])
-                        self.prism_adv_status.config(text=f"Installe: {prism_path}", fg=COLORS['minecraft_green'])
+                        self._set_adv_status('prism', text=f"Installe: {prism_path}", fg=COLORS['minecraft_green'])
                         self.install_prism_btn.pack_forget()
                         self.play_btn.set_enabled(True)
                         self.log(f"Prism Launcher detecte et valide: {prism_path}")
                     else:
                         # Fichier trop petit, probablement corrompu
                         self.prism_status.config(text="Prism Launcher corrompu", fg=COLORS['accent_red'])
-                        self.prism_adv_status.config(text="Installation invalide", fg=COLORS['accent_red'])
+                        self._set_adv_status('prism', text="Installation invalide", fg=COLORS['accent_red'])
                         self.install_prism_btn.pack(side='right')
                         self.play_btn.set_enabled(False)
                         self.log("Prism Launcher detecte mais fichier invalide (trop petit)")
                 else:
                     # Fichier n'existe pas
                     self.prism_status.config(text="Prism Launcher non trouve", fg=COLORS['accent_red'])
-                    self.prism_adv_status.config(text="Fichier introuvable", fg=COLORS['accent_red'])
+                    self._set_adv_status('prism', text="Fichier introuvable", fg=COLORS['accent_red'])
                     self.install_prism_btn.pack(side='right')
                     self.play_btn.set_enabled(False)
                     self.log("Prism Launcher non trouve a l'emplacement attendu")
             except Exception as e:
                 self.prism_status.config(text="Erreur verification", fg=COLORS['accent_red'])
-                self.prism_adv_status.config(text=f"Erreur: {e}", fg=COLORS['accent_red'])
+                self._set_adv_status('prism', text=f"Erreur: {e}", fg=COLORS['accent_red'])
                 self.install_prism_btn.pack(side='right')
                 self.play_btn.set_enabled(False)
                 self.log(f"Erreur lors de la verification: {e}")
         else:
             self.prism_status.config(text="Prism Launcher non installe", fg=COLORS['accent_red'])
-            self.prism_adv_status.config(text="Non installe", fg=COLORS['accent_red'])
+            self._set_adv_status('prism', text="Non installe", fg=COLORS['accent_red'])
             self.install_prism_btn.pack(side='right')
             self.play_btn.set_enabled(False)
             self.log("Prism Launcher non detecte - Installation requise")
@@ -5562,24 +6775,24 @@ exit
                     if Path(prism_path).exists():
                         file_size = Path(prism_path).stat().st_size
                         if file_size > 1000000:  # Au moins 1 MB
-                            self.root.after(0, lambda: self.log(f"Prism Launcher valide: {prism_path} ({file_size / 1024 / 1024:.1f} MB)"))
-                            self.root.after(0, lambda: self.prism_status.config(
+                            self.ui.post(lambda: self.log(f"Prism Launcher valide: {prism_path} ({file_size / 1024 / 1024:.1f} MB)"))
+                            self.ui.post(lambda: self.prism_status.config(
                                 text="Prism Launcher installe et valide", fg=COLORS['minecraft_green']))
-                            self.root.after(0, lambda: messagebox.showinfo("Verification",
+                            self.ui.post(lambda: messagebox.showinfo("Verification",
                                 f"Prism Launcher est deja installe et fonctionnel.\n\n"
                                 f"Emplacement: {prism_path}\n\n"
                                 "Aucun telechargement necessaire."))
                             # Mettre à jour le statut
-                            self.root.after(0, self.check_prism_status)
+                            self.ui.post(self.check_prism_status)
                             return
                     
                     # Si l'exécutable est corrompu ou invalide
-                    self.root.after(0, lambda: self.log("Installation Prism detectee mais invalide, telechargement necessaire"))
+                    self.ui.post(lambda: self.log("Installation Prism detectee mais invalide, telechargement necessaire"))
                     self._download_prism_installer()
                     
                 except Exception as e:
-                    self.root.after(0, lambda: self.log(f"Erreur verification: {e}"))
-                    self.root.after(0, lambda: self.prism_status.config(
+                    self.ui.post(lambda: self.log(f"Erreur verification: {e}"))
+                    self.ui.post(lambda: self.prism_status.config(
                         text="Erreur verification", fg=COLORS['accent_red']))
                     # Essayer de télécharger quand même
                     self._download_prism_installer()
@@ -5610,7 +6823,7 @@ exit
                 downloaded = False
                 for url in urls:
                     try:
-                        self.root.after(0, lambda u=url: self.log(f"Tentative: {u}"))
+                        self.ui.post(lambda u=url: self.log(f"Tentative: {u}"))
                         req = urllib.request.Request(url, headers={
                             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
                         })
@@ -5636,12 +6849,12 @@ exit
                                     break
                     except urllib.error.HTTPError as e:
                         if e.code == 404:
-                            self.root.after(0, lambda: self.log(f"URL non trouvee (404): {url}"))
+                            self.ui.post(lambda: self.log(f"URL non trouvee (404): {url}"))
                             continue
                         else:
                             raise
                     except Exception as e:
-                        self.root.after(0, lambda: self.log(f"Erreur avec {url}: {e}"))
+                        self.ui.post(lambda: self.log(f"Erreur avec {url}: {e}"))
                         continue
                 
                 if not downloaded:
@@ -5650,10 +6863,10 @@ exit
                 if sys.platform == 'win32':
                     os.startfile(str(download_path))
                 
-                self.root.after(0, lambda: self.log("Installateur Prism lance"))
-                self.root.after(0, lambda: self.prism_status.config(
+                self.ui.post(lambda: self.log("Installateur Prism lance"))
+                self.ui.post(lambda: self.prism_status.config(
                     text="Installe Prism puis clique Verifier", fg=COLORS['accent_gold']))
-                self.root.after(0, lambda: messagebox.showinfo("Installation",
+                self.ui.post(lambda: messagebox.showinfo("Installation",
                     "L'installateur Prism Launcher a ete lance.\n\n"
                     "1. Suis les instructions d'installation\n"
                     "2. Une fois termine, reviens ici\n"
@@ -5661,10 +6874,10 @@ exit
                 
             except Exception as e:
                 error_msg = str(e)
-                self.root.after(0, lambda: self.log(f"Erreur telechargement: {error_msg}"))
-                self.root.after(0, lambda: self.prism_status.config(
+                self.ui.post(lambda: self.log(f"Erreur telechargement: {error_msg}"))
+                self.ui.post(lambda: self.prism_status.config(
                     text="Erreur telechargement", fg=COLORS['accent_red']))
-                self.root.after(0, lambda: messagebox.showerror("Erreur",
+                self.ui.post(lambda: messagebox.showerror("Erreur",
                     f"Impossible de telecharger Prism Launcher.\n\n"
                     f"Erreur: {error_msg}\n\n"
                     "Tu peux telecharger Prism Launcher manuellement depuis:\n"
@@ -5684,20 +6897,22 @@ exit
         def check_and_sync():
             """Vérifie les fichiers et synchronise"""
             try:
-                launcher = MinecraftLauncher(self.config)
+                # Relire les chemins au clic sur Jouer (instance créée/déplacée entre-temps)
+                launcher = self.get_minecraft_launcher()
+                launcher.invalidate_paths()
                 
                 # Vérifier Java avant de continuer
-                self.root.after(0, lambda: self.log("Verification de Java..."))
-                self.root.after(0, lambda: self.status_label.config(text="Verification Java..."))
+                self.ui.post(lambda: self.log("Verification de Java..."))
+                self.ui.post(lambda: self.status_label.config(text="Verification Java..."))
                 
                 def check_java():
                     java_ok, java_path = JavaManager.ensure_java_installed(
-                        progress_callback=lambda msg, current, total: self.root.after(0, lambda: (
+                        progress_callback=lambda msg, current, total: self.ui.post(lambda: (
                             self.log(msg),
                             self.status_label.config(text=msg),
                             self.progress.set_progress(current) if hasattr(self, 'progress') else None
                         )),
-                        install_callback=lambda installer_path: self.root.after(0, lambda: messagebox.showinfo(
+                        install_callback=lambda installer_path: self.ui.post(lambda: messagebox.showinfo(
                             "Installation Java",
                             f"Java va être installé automatiquement.\n\n"
                             f"Fichier: {installer_path.name}\n\n"
@@ -5707,9 +6922,9 @@ exit
                     )
                     
                     if not java_ok:
-                        self.root.after(0, lambda: self.log("ERREUR: Java non disponible!"))
-                        self.root.after(0, lambda: self.status_label.config(text="Java non disponible"))
-                        self.root.after(0, lambda: messagebox.showerror(
+                        self.ui.post(lambda: self.log("ERREUR: Java non disponible!"))
+                        self.ui.post(lambda: self.status_label.config(text="Java non disponible"))
+                        self.ui.post(lambda: messagebox.showerror(
                             "Java requis",
                             "Java n'a pas pu être installé automatiquement.\n\n"
                             "Veuillez installer Java manuellement:\n"
@@ -5719,16 +6934,15 @@ exit
                             "3. Redémarrez le launcher\n\n"
                             "Ou redémarrez le launcher si Java vient d'être installé."
                         ))
-                        self.is_syncing = False
-                        self.play_btn.set_enabled(True)
-                        self.play_btn.set_text("Jouer")
+                        self.ui.post(self._reset_play_btn)
                         return False
                     
                     # Java est OK, continuer avec le reste
-                    self.root.after(0, lambda: self.log(f"Java OK: {java_path}"))
+                    self.ui.post(lambda: self.log(f"Java OK: {java_path}"))
                     if java_path:
                         self.config['java_path'] = java_path
-                        self.save_config()
+                        # Thread de travail: pas de save_config() (il relit des variables Tk)
+                        self.config_store.save()
                     
                     # Continuer avec la vérification de l'instance
                     continue_setup()
@@ -5742,26 +6956,24 @@ exit
                     if use_existing:
                         # Utiliser une instance existante
                         if not launcher.instance_exists():
-                            self.root.after(0, lambda: self.log(f"ERREUR: Instance '{instance_name}' introuvable!"))
-                            self.root.after(0, lambda: self.status_label.config(text="Instance introuvable"))
-                            self.root.after(0, lambda: messagebox.showerror("Erreur", 
+                            self.ui.post(lambda: self.log(f"ERREUR: Instance '{instance_name}' introuvable!"))
+                            self.ui.post(lambda: self.status_label.config(text="Instance introuvable"))
+                            self.ui.post(lambda: messagebox.showerror("Erreur", 
                                 f"L'instance '{instance_name}' n'existe pas dans Prism Launcher.\n\n"
                                 "Veuillez la créer manuellement dans Prism Launcher\n"
                                 "ou changer l'instance dans les paramètres avancés."))
-                            self.is_syncing = False
-                            self.play_btn.set_enabled(True)
-                            self.play_btn.set_text("Jouer")
+                            self.ui.post(self._reset_play_btn)
                             return
                         else:
-                            self.root.after(0, lambda: self.log(f"Utilisation de l'instance existante: {instance_name}"))
+                            self.ui.post(lambda: self.log(f"Utilisation de l'instance existante: {instance_name}"))
                     else:
                         # Créer une nouvelle instance si elle n'existe pas
                         if not launcher.instance_exists():
-                            self.root.after(0, lambda: self.log(f"Creation de l'instance Prism: {instance_name}..."))
-                            self.root.after(0, lambda: self.status_label.config(text="Creation de l'instance..."))
+                            self.ui.post(lambda: self.log(f"Creation de l'instance Prism: {instance_name}..."))
+                            self.ui.post(lambda: self.status_label.config(text="Creation de l'instance..."))
                             launcher.create_instance()
                         else:
-                            self.root.after(0, lambda: self.log(f"Instance '{instance_name}' existe deja, utilisation..."))
+                            self.ui.post(lambda: self.log(f"Instance '{instance_name}' existe deja, utilisation..."))
                     
                     # Récupérer le dossier mods de l'instance
                     mods_dir = launcher.get_mods_dir()
@@ -5776,18 +6988,18 @@ exit
                         mods_dir = expected_path
                         mods_dir.mkdir(parents=True, exist_ok=True)
                     
-                    self.root.after(0, lambda: self.log(f"Dossier mods: {mods_dir}"))
-                    self.root.after(0, lambda: self.log(f"Instance: {instance_dir}"))
+                    self.ui.post(lambda: self.log(f"Dossier mods: {mods_dir}"))
+                    self.ui.post(lambda: self.log(f"Instance: {instance_dir}"))
                     print(f"[DEBUG] Chemin complet instance: {instance_dir}")
                     print(f"[DEBUG] Chemin complet mods: {mods_dir}")
                     
                     # Sync mods - Utiliser la clé API depuis la config ou le code
                     api_key = self.config.get('api_key', '') or DRIVE_API_KEY
                     if not api_key:
-                        self.root.after(0, lambda: self.log("[ERREUR] Clé API Google Drive non trouvée!"))
-                        self.root.after(0, lambda: self.log("[INFO] Vérifie que DRIVE_API_KEY est configurée dans launcher.py"))
+                        self.ui.post(lambda: self.log("[ERREUR] Clé API Google Drive non trouvée!"))
+                        self.ui.post(lambda: self.log("[INFO] Vérifie que DRIVE_API_KEY est configurée dans launcher.py"))
                     else:
-                        self.root.after(0, lambda: self.log(f"[INFO] Clé API chargée ({len(api_key)} caractères)"))
+                        self.ui.post(lambda: self.log(f"[INFO] Clé API chargée ({len(api_key)} caractères)"))
                     
                     sync = GoogleDriveSync(
                         self.config.get('google_drive_folder_id', DRIVE_FOLDER_ID),
@@ -5795,11 +7007,11 @@ exit
                         api_key
                     )
                     
-                    self.root.after(0, lambda: self.log(f"[DEBUG] Folder ID: {self.config.get('google_drive_folder_id', DRIVE_FOLDER_ID)}"))
+                    self.ui.post(lambda: self.log(f"[DEBUG] Folder ID: {self.config.get('google_drive_folder_id', DRIVE_FOLDER_ID)}"))
                     
                     # Vérifier d'abord les fichiers à remplacer
-                    self.root.after(0, lambda: self.status_label.config(text="Verification des fichiers..."))
-                    self.root.after(0, lambda: self.play_btn.set_text("Verification..."))
+                    self.ui.post(lambda: self.status_label.config(text="Verification des fichiers..."))
+                    self.ui.post(lambda: self.play_btn.set_text("Verification..."))
                     
                     remote_files = sync.get_folder_files()
                     remote_dict = {f['name']: f for f in remote_files}
@@ -5819,7 +7031,7 @@ exit
                     if files_to_replace:
                         # Capturer les variables pour éviter les problèmes de closure
                         files_list = files_to_replace.copy()
-                        self.root.after(0, lambda: self._ask_replace_files(files_list, sync, mods_dir, launcher))
+                        self.ui.post(lambda: self._ask_replace_files(files_list, sync, mods_dir, launcher))
                     else:
                         # Pas de fichiers à remplacer, continuer la synchronisation normale
                         self._do_sync(sync, mods_dir, launcher)
@@ -5830,9 +7042,9 @@ exit
             except Exception as e:
                 import traceback
                 traceback.print_exc()
-                self.root.after(0, lambda: self.log(f"Erreur: {e}"))
-                self.root.after(0, lambda: self.status_label.config(text=f"Erreur: {e}"))
-                self.root.after(0, self._reset_play_btn)
+                self.ui.post(lambda: self.log(f"Erreur: {e}"))
+                self.ui.post(lambda: self.status_label.config(text=f"Erreur: {e}"))
+                self.ui.post(self._reset_play_btn)
         
         threading.Thread(target=check_and_sync, daemon=True).start()
     
@@ -5853,7 +7065,7 @@ exit
                     replace = False
             except Exception as e:
                 # En cas d'erreur avec la boîte de dialogue, continuer sans remplacer
-                self.root.after(0, lambda: self.log(f"Erreur lors de l'affichage de la boîte de dialogue: {e}"))
+                self.ui.post(lambda: self.log(f"Erreur lors de l'affichage de la boîte de dialogue: {e}"))
                 replace = False
             
             # Lancer la synchronisation dans un thread séparé pour ne pas bloquer l'interface
@@ -5861,44 +7073,65 @@ exit
                 try:
                     if replace:
                         # L'utilisateur accepte, on fait la synchronisation avec remplacement forcé
-                        self.root.after(0, lambda: self.log(f"Remplacement de {len(files_to_replace)} fichiers accepte"))
+                        self.ui.post(lambda: self.log(f"Remplacement de {len(files_to_replace)} fichiers accepte"))
                         self._do_sync(sync, mods_dir, launcher, force_replace=True)
                     else:
                         # L'utilisateur refuse ou ferme la fenêtre, on continue sans remplacer
-                        self.root.after(0, lambda: self.log("Remplacement refuse ou annule, synchronisation sans remplacement"))
+                        self.ui.post(lambda: self.log("Remplacement refuse ou annule, synchronisation sans remplacement"))
                         self._do_sync(sync, mods_dir, launcher, force_replace=False)
                 except Exception as e:
                     import traceback
                     traceback.print_exc()
-                    self.root.after(0, lambda: self.log(f"Erreur lors de la synchronisation: {e}"))
-                    self.root.after(0, lambda: self.status_label.config(text=f"Erreur: {e}"))
-                    self.root.after(0, self._reset_play_btn)
+                    self.ui.post(lambda: self.log(f"Erreur lors de la synchronisation: {e}"))
+                    self.ui.post(lambda: self.status_label.config(text=f"Erreur: {e}"))
+                    self.ui.post(self._reset_play_btn)
             
             threading.Thread(target=do_sync_thread, daemon=True).start()
             
         except Exception as e:
             import traceback
             traceback.print_exc()
-            self.root.after(0, lambda: self.log(f"Erreur lors de la demande de remplacement: {e}"))
-            self.root.after(0, lambda: self.status_label.config(text=f"Erreur: {e}"))
+            self.ui.post(lambda: self.log(f"Erreur lors de la demande de remplacement: {e}"))
+            self.ui.post(lambda: self.status_label.config(text=f"Erreur: {e}"))
             # Continuer quand même avec la synchronisation normale et réinitialiser le bouton
             def fallback_sync():
                 try:
                     self._do_sync(sync, mods_dir, launcher, force_replace=False)
                 except:
-                    self.root.after(0, self._reset_play_btn)
+                    self.ui.post(self._reset_play_btn)
             threading.Thread(target=fallback_sync, daemon=True).start()
     
+    def _refresh_sync_report(self):
+        """Affiche le dernier rapport de sync et les médianes par version (onglet Avancé)"""
+        if not hasattr(self, 'sync_report_label'):
+            return
+        sync_report = quick_win('sync_report')
+        history = sync_report.get_sync_history().load()
+        if not history:
+            return
+        
+        lines = sync_report.format_report(history[-1])
+        lines.append("")
+        lines.append(f"{'Version':<10}{'Syncs':>6}{'Total':>10}{'Listing':>10}{'Empreintes':>12}{'Debit':>11}")
+        for version, stats in sync_report.summarize_by_version(history).items():
+            throughput = f"{stats['throughput_mbps']:.2f} MB/s" if stats['throughput_mbps'] is not None else "-"
+            lines.append(f"{version:<10}{stats['runs']:>6}{stats['wall_ms'] / 1000:>9.1f}s"
+                         f"{stats['listing_ms']:>8.0f}ms{stats['hash_scan_ms']:>10.0f}ms{throughput:>11}")
+        self.sync_report_label.config(text="\n".join(lines))
+    
     def _do_sync(self, sync, mods_dir, launcher, force_replace=False):
         """Effectue la synchronisation"""
         try:
-            self.root.after(0, lambda: self.play_btn.set_text("Synchronisation..."))
+            self.ui.post(lambda: self.play_btn.set_text("Synchronisation..."))
             
             def progress_cb(msg, current, total):
                 pct = (current / total * 100) if total > 0 else 0
-                self.root.after(0, lambda m=msg: self.status_label.config(text=m))
-                self.root.after(0, lambda p=pct: self.progress_bar.set_progress(p))
-                self.root.after(0, lambda m=msg: self.log(m))
+                # Statut + barre fusionnés (dernier état seulement), chaque ligne de log est gardée
+                self.ui.post(lambda m=msg, p=pct: (
+                    self.status_label.config(text=m),
+                    self.progress_bar.set_progress(p)
+                ), key='sync_progress')
+                self.ui.post(lambda m=msg: self.log(m))
             
             stats = sync.sync(progress_cb, force_replace=force_replace, config=self.config)
             
@@ -5916,51 +7149,80 @@ exit
             if unchanged > 0:
                 sync_msg += f", {unchanged} inchanges"
             
-            self.root.after(0, lambda: self.log(sync_msg))
+            self.ui.post(lambda: self.log(sync_msg))
             
             if errors > 0:
-                self.root.after(0, lambda: self.log(f"Attention: {errors} erreurs"))
+                self.ui.post(lambda: self.log(f"Attention: {errors} erreurs"))
+            
+            sync_report = sync.last_report
+            if sync_report:
+                perf_msg = (f"Perf sync: {sync_report.wall_ms / 1000:.1f} s, listing {sync_report.listing_ms:.0f} ms, "
+                            f"empreintes {sync_report.hash_scan_ms:.0f} ms")
+                if sync_report.downloads:
+                    perf_msg += f", {sync_report.avg_throughput_mbps:.2f} MB/s par fichier"
+                if sync_report.retries:
+                    perf_msg += f", {sync_report.retries} retries ({sync_report.http_429} x 429)"
+                self.ui.post(lambda: self.log(perf_msg))
+                self.ui.post(self._refresh_sync_report)
+            
+            recommended = find_installed_recommended_mods(mods_dir)
+            if recommended:
+                names = ', '.join(RECOMMENDED_OPTIMIZATION_MODS[p]['name'] for p in recommended)
+                self.ui.post(lambda: self.log(f"Mods d'optimisation detectes: {names}"))
             
             # Sauvegarder last sync
             self.config['last_sync'] = datetime.now().strftime('%Y-%m-%d %H:%M')
-            self.save_config()
+            self.config_store.save()
             
             # FORCER le serveur Illama avant le lancement (sécurité)
-            self.root.after(0, lambda: self.log("Verification du serveur..."))
+            self.ui.post(lambda: self.log("Verification du serveur..."))
             launcher.create_server_dat()
             launcher.create_options_txt()
             launcher._enforce_server_only()
             
             # Vérifier si le jeu est déjà en cours d'exécution
             if launcher.is_game_running():
-                self.root.after(0, lambda: self.log("Erreur: Le jeu est deja en cours d'execution!"))
-                self.root.after(0, lambda: self.status_label.config(text="Jeu deja ouvert"))
-                self.root.after(0, lambda: messagebox.showwarning("Jeu deja ouvert", 
+                self.ui.post(lambda: self.log("Erreur: Le jeu est deja en cours d'execution!"))
+                self.ui.post(lambda: self.status_label.config(text="Jeu deja ouvert"))
+                self.ui.post(lambda: messagebox.showwarning("Jeu deja ouvert", 
                     "Le jeu est deja en cours d'execution.\n\n"
                     "Ferme la fenetre du jeu avant d'en ouvrir une nouvelle."))
                 return
             
+            # Vérification du modpack avant de démarrer Prism/Forge (quelques ms au lieu d'un crash après 30s)
+            self.ui.post(lambda: self.status_label.config(text="Verification des mods..."))
+            report = launcher.preflight_check()
+            if report is not None:
+                for line in report.format().splitlines():
+                    self.ui.post(lambda l=line: self.log(f"[Preflight] {l}"))
+                if not report.ok:
+                    self.ui.post(lambda: self.status_label.config(text="Modpack invalide"))
+                    self.ui.post(lambda: messagebox.showerror("Modpack invalide",
+                        "Le lancement a ete annule, le modpack contient des erreurs:\n\n"
+                        + report.format(max_lines=10)))
+                    return
+            
             # Lancer le jeu
-            self.root.after(0, lambda: self.status_label.config(text="Lancement du jeu..."))
-            self.root.after(0, lambda: self.play_btn.set_text("Lancement..."))
-            self.root.after(0, lambda: self.log("Lancement de l'instance IllamaServer..."))
+            self.ui.post(lambda: self.status_label.config(text="Lancement du jeu..."))
+            self.ui.post(lambda: self.play_btn.set_text("Lancement..."))
+            self.ui.post(lambda: self.log("Lancement de l'instance IllamaServer..."))
             
             launch_success = launcher.launch()
             print(f"[Launch] Resultat du lancement: {launch_success}")
             
             if launch_success:
-                self.root.after(0, lambda: self.log("Jeu lance! Bon jeu sur Illama Server!"))
-                self.root.after(0, lambda: self.status_label.config(text="Jeu lance!"))
-                self.root.after(0, lambda: self.progress_bar.set_progress(100))
+                self.ui.post(lambda: self.log("Jeu lance! Bon jeu sur Illama Server!"))
+                self.ui.post(lambda: self.status_label.config(text="Jeu lance!"))
+                self.ui.post(lambda: self.progress_bar.set_progress(100))
                 
                 # Minimiser le launcher dans la barre des tâches après le lancement du jeu
                 # Attendre 5 secondes pour laisser le temps à Prism ET au jeu de se lancer complètement
                 def minimize_launcher():
                     try:
-                        self.root.after(0, lambda: self.log("[MINIMIZE] Debut minimisation..."))
+                        self.ui.post(lambda: self.log("[MINIMIZE] Debut minimisation..."))
                         # Sauvegarder la config avant de minimiser
                         self.save_config()
-                        self.root.after(0, lambda: self.log("[MINIMIZE] Config sauvegardee"))
+                        self.ui.post(lambda: self.log("[MINIMIZE] Config sauvegardee"))
                         
                         # SOLUTION NATIVE WINDOWS : Utiliser WM_SYSCOMMAND (plus agressif que ShowWindow)
                         if sys.platform == 'win32':
@@ -5969,7 +7231,7 @@ exit
                                 
                                 # Obtenir le handle de la fenêtre Tkinter
                                 hwnd = ctypes.windll.user32.GetParent(self.root.winfo_id())
-                                self.root.after(0, lambda h=hwnd: self.log(f"[MINIMIZE] Handle fenetre: {h}"))
+                                self.ui.post(lambda h=hwnd: self.log(f"[MINIMIZE] Handle fenetre: {h}"))
                                 
                                 # Méthode 1 : WM_SYSCOMMAND avec SC_MINIMIZE
                                 # C'est comme simuler un clic sur le bouton minimiser
@@ -5977,55 +7239,55 @@ exit
                                 SC_MINIMIZE = 0xF020
                                 # IMPORTANT: Utiliser SendMessageW (W = Wide/Unicode) au lieu de SendMessage
                                 ctypes.windll.user32.SendMessageW(hwnd, WM_SYSCOMMAND, SC_MINIMIZE, 0)
-                                self.root.after(0, lambda: self.log("[MINIMIZE] SendMessageW(SC_MINIMIZE) execute"))
+                                self.ui.post(lambda: self.log("[MINIMIZE] SendMessageW(SC_MINIMIZE) execute"))
                                 
                                 # Méthode 2 : Aussi utiliser ShowWindow en backup
                                 ctypes.windll.user32.ShowWindow(hwnd, 6)
-                                self.root.after(0, lambda: self.log("[MINIMIZE] ShowWindow(6) execute"))
+                                self.ui.post(lambda: self.log("[MINIMIZE] ShowWindow(6) execute"))
                                 
                                 # Méthode 3 : CloseWindow (qui minimise malgré son nom)
                                 ctypes.windll.user32.CloseWindow(hwnd)
-                                self.root.after(0, lambda: self.log("[MINIMIZE] CloseWindow execute"))
+                                self.ui.post(lambda: self.log("[MINIMIZE] CloseWindow execute"))
                                 
                             except Exception as e:
-                                self.root.after(0, lambda err=str(e): self.log(f"[MINIMIZE] Erreur API Windows: {err}"))
+                                self.ui.post(lambda err=str(e): self.log(f"[MINIMIZE] Erreur API Windows: {err}"))
                                 # Fallback sur méthode Tkinter si API Windows échoue
                                 self.root.lower()
                                 self.root.state('iconic')
                                 self.root.iconify()
-                                self.root.after(0, lambda: self.log("[MINIMIZE] Fallback Tkinter execute"))
+                                self.ui.post(lambda: self.log("[MINIMIZE] Fallback Tkinter execute"))
                         else:
                             # Linux/Mac : méthode Tkinter standard
                             self.root.iconify()
                         
-                        self.root.after(0, lambda: self.log("[MINIMIZE] Fenetre minimisee"))
+                        self.ui.post(lambda: self.log("[MINIMIZE] Fenetre minimisee"))
                         self.log("Launcher minimise dans la barre des taches")
                         
                         # Démarrer la surveillance du jeu
                         self.start_game_monitoring()
-                        self.root.after(0, lambda: self.log("[MINIMIZE] Surveillance du jeu demarree"))
+                        self.ui.post(lambda: self.log("[MINIMIZE] Surveillance du jeu demarree"))
                         
                     except Exception as e:
                         import traceback
                         error_msg = traceback.format_exc()
-                        self.root.after(0, lambda: self.log(f"[MINIMIZE] ERREUR: {str(e)}"))
-                        self.root.after(0, lambda: self.log(f"[MINIMIZE] Traceback: {error_msg}"))
+                        self.ui.post(lambda: self.log(f"[MINIMIZE] ERREUR: {str(e)}"))
+                        self.ui.post(lambda: self.log(f"[MINIMIZE] Traceback: {error_msg}"))
                 
-                self.root.after(0, lambda: self.log("[MINIMIZE] Planification dans 5 secondes..."))
-                self.root.after(5000, minimize_launcher)
+                self.ui.post(lambda: self.log("[MINIMIZE] Planification dans 5 secondes..."))
+                self.ui.post(lambda: self.root.after(5000, minimize_launcher))
             else:
-                self.root.after(0, lambda: self.log("Erreur: Impossible de lancer Prism"))
-                self.root.after(0, lambda: messagebox.showerror("Erreur", 
+                self.ui.post(lambda: self.log("Erreur: Impossible de lancer Prism"))
+                self.ui.post(lambda: messagebox.showerror("Erreur", 
                     "Impossible de lancer Prism Launcher.\n\n"
                     "Verifie qu'il est bien installe."))
             
         except Exception as e:
             import traceback
             traceback.print_exc()
-            self.root.after(0, lambda: self.log(f"Erreur: {e}"))
-            self.root.after(0, lambda: self.status_label.config(text=f"Erreur: {e}"))
+            self.ui.post(lambda: self.log(f"Erreur: {e}"))
+            self.ui.post(lambda: self.status_label.config(text=f"Erreur: {e}"))
         finally:
-            self.root.after(0, self._reset_play_btn)
+            self.ui.post(self._reset_play_btn)
     
     def _reset_play_btn(self):
         self.is_syncing = False
@@ -6120,13 +7382,15 @@ exit
     
     def apply_auto_optimization(self):
         """Applique automatiquement les optimisations pour le PC détecté"""
+        self.ensure_tab('minecraft', complete=True)
         try:
-            total_ram = get_system_ram_mb()
-            profile = get_optimization_profile(total_ram)
+            system = get_system_profile(refresh=True)
+            total_ram = system.total_ram_mb
+            profile = system.optimization_profile
             profile_names = {"low_end": "Petit PC", "medium": "PC Moyen", "high": "PC Performant"}
             profile_name = profile_names.get(profile, "PC Moyen")
             
-            # Obtenir les paramètres optimisés
+            # Obtenir les paramètres optimisés; la RAM libre n'est prise en compte qu'au lancement (plan_launch_heap)
             ram_min, ram_max = get_optimized_ram_settings(profile, total_ram)
             minecraft_options = get_optimized_minecraft_options(profile)
             
@@ -6255,10 +7519,11 @@ exit
     def apply_ultra_performance_mode(self):
         """Applique le mode ultra performance pour PC très faibles avec beaucoup de mods"""
         try:
-            total_ram = get_system_ram_mb()
-            # Utiliser seulement 30-40% de la RAM, max 1.5GB
+            system = get_system_profile(refresh=True)
+            total_ram = system.total_ram_mb
+            # Utiliser seulement 30-40% de la RAM, max 1.5GB (plafond réduit à la RAM libre au lancement)
             ram_max = min(int(total_ram * 0.4), 1536)
-            ram_min = max(int(ram_max * 0.6), 768)
+            ram_min = min(max(int(ram_max * 0.6), 768), ram_max)
             
             # Paramètres ultra optimisés
             minecraft_options = {
@@ -6342,10 +7607,11 @@ exit
     def apply_performance_max_mode(self):
         """Applique le mode performance max (équilibré pour beaucoup de mods)"""
         try:
-            total_ram = get_system_ram_mb()
-            # Utiliser 40-50% de la RAM, max 2.5GB
+            system = get_system_profile(refresh=True)
+            total_ram = system.total_ram_mb
+            # Utiliser 40-50% de la RAM, max 2.5GB (plafond réduit à la RAM libre au lancement)
             ram_max = min(int(total_ram * 0.5), 2560)
-            ram_min = max(int(ram_max * 0.6), 1024)
+            ram_min = min(max(int(ram_max * 0.6), 1024), ram_max)
             
             # Paramètres optimisés
             minecraft_options = {
@@ -6431,10 +7697,11 @@ exit
     def apply_balanced_mods_mode(self):
         """Applique le mode équilibré pour jouer avec beaucoup de mods"""
         try:
-            total_ram = get_system_ram_mb()
-            # Utiliser 50-60% de la RAM, max 4GB
+            system = get_system_profile(refresh=True)
+            total_ram = system.total_ram_mb
+            # Utiliser 50-60% de la RAM, max 4GB (plafond réduit à la RAM libre au lancement)
             ram_max = min(int(total_ram * 0.6), 4096)
-            ram_min = max(int(ram_max * 0.6), 2048)
+            ram_min = min(max(int(ram_max * 0.6), 2048), ram_max)
             
             # Paramètres équilibrés
             minecraft_options = {
@@ -6519,6 +7786,7 @@ exit
     
     def _update_minecraft_options_ui(self, minecraft_options):
         """Met à jour l'interface avec les options Minecraft"""
+        self.ensure_tab('minecraft', complete=True)
         if hasattr(self, 'graphics_var'):
             self.graphics_var.set(minecraft_options.get('graphics', 'fast'))
         if hasattr(self, 'render_distance_var'):
@@ -6672,33 +7940,30 @@ exit
             self.quit_app()
     
     def log(self, message: str):
-        """Ajoute un message au log"""
+        """Ajoute un message au log (appelable depuis n'importe quel thread)"""
         timestamp = datetime.now().strftime('%H:%M:%S')
-        self.log_text.insert('end', f"[{timestamp}] {message}\n")
-        self.log_text.see('end')
+        line = f"[{timestamp}] {message}"
+        if not self.ui.on_ui_thread():
+            self.ui.post(lambda: self.log_console.write(line))
+            return
+        self.log_console.write(line)
     
     def load_config(self) -> dict:
-        if CONFIG_FILE.exists():
-            try:
-                with open(CONFIG_FILE, 'r', encoding='utf-8') as f:
-                    loaded_config = {**DEFAULT_CONFIG, **json.load(f)}
-                    # S'assurer que la clé API est toujours à jour depuis le code
-                    if not loaded_config.get('api_key') or loaded_config.get('api_key') == '':
-                        loaded_config['api_key'] = DRIVE_API_KEY
-                    return loaded_config
-            except:
-                pass
-        return DEFAULT_CONFIG.copy()
+        loaded_config = self.config_store.load(DEFAULT_CONFIG)
+        # S'assurer que la clé API est toujours à jour depuis le code
+        if not loaded_config.get('api_key'):
+            loaded_config['api_key'] = DRIVE_API_KEY
+        return loaded_config
     
     def _on_window_configure(self, event=None):
         """Sauvegarde la position et taille de la fenêtre"""
         if event and event.widget == self.root:
             # Ne sauvegarder que si c'est la fenêtre principale qui bouge
             geometry = self.root.geometry()
-            if geometry and 'x' in geometry:
+            if geometry and 'x' in geometry and geometry != self.config.get('window_geometry'):
                 self.config['window_geometry'] = geometry
-                # Sauvegarder de manière asynchrone pour ne pas ralentir
-                self.root.after(500, self._save_window_position)
+                # Écriture regroupée: un déplacement complet ne donne qu'un fichier écrit
+                self.config_store.save()
     
     def _save_window_position(self):
         """Sauvegarde la position de la fenêtre dans le fichier de config"""
@@ -6706,7 +7971,7 @@ exit
             geometry = self.root.geometry()
             if geometry:
                 self.config['window_geometry'] = geometry
-                self.save_config()
+                self.config_store.save()
         except:
             pass
     
@@ -6805,8 +8070,13 @@ exit
         if hasattr(self, 'forge_var'):
             self.config['forge_version'] = self.forge_var.get()
         
-        with open(CONFIG_FILE, 'w', encoding='utf-8') as f:
-            json.dump(self.config, f, indent=2)
+        self.config_store.save()
+    
+    @traced('tray_setup')
+    def _start_tray(self):
+        """Crée l'icône du tray (appelé après le premier affichage)"""
+        if self.tray.setup():
+            self.tray.run()
     
     def on_close(self):
         """Gere la fermeture de la fenetre"""
@@ -6831,6 +8101,12 @@ exit
     def quit_app(self):
         """Quitte l'application complètement"""
         try:
+            print(f"[UI] File de messages: {self.ui.stats()}")
+            
+            # Écrire la config en attente avant de fermer
+            self.config_store.flush()
+            print(f"[Config] {self.config_store.writes} écriture(s) pour {self.config_store.save_requests} sauvegarde(s) demandée(s)")
+            
             # Supprimer le fichier de verrouillage
             remove_lock_file()
             
@@ -6885,9 +8161,180 @@ exit
             sys.exit(0)
     
     def run(self):
+        startup_trace.mark_first_idle(self.root)
         self.root.mainloop()
 
 
+# ============================================================
+# MODE HEADLESS (CLI)
+# ============================================================
+
+# Codes de sortie du CLI
+EXIT_OK = 0
+EXIT_FAILURE = 1
+EXIT_USAGE = 2
+EXIT_MISSING_PREREQUISITE = 3
+EXIT_PREFLIGHT_FAILED = 4
+
+def load_launcher_config() -> dict:
+    """
+    Charge une copie de la config (défauts + fichier + auth) sans interface
+    La copie n'est jamais écrite: les commandes en lecture seule ne touchent pas au fichier
+    """
+    config = {**DEFAULT_CONFIG, **get_config_store().read()}
+    if AUTH_FILE.exists():
+        try:
+            with open(AUTH_FILE, 'r') as f:
+                config.update(json.load(f))
+        except:
+            pass
+    return config
+
+class CliReporter:
+    """Écrit les événements du CLI en JSON (une ligne par événement) sur stdout"""
+    
+    def __init__(self, command: str, stream):
+        self.command = command
+        self.stream = stream
+        self.start = time.monotonic()
+    
+    def emit(self, event: str, **fields):
+        payload = {'event': event, 'command': self.command,
+                   'elapsed_ms': int((time.monotonic() - self.start) * 1000), **fields}
+        self.stream.write(json.dumps(payload, ensure_ascii=False) + "\n")
+        self.stream.flush()
+    
+    def progress(self, message, current, total):
+        self.emit('progress', message=message, current=current, total=total)
+    
+    def result(self, ok: bool, exit_code: int, **fields) -> int:
+        self.emit('result', ok=ok, exit_code=exit_code, **fields)
+        return exit_code
+
+def _cli_make_sync(config: dict, launcher: MinecraftLauncher) -> GoogleDriveSync:
+    return GoogleDriveSync(
+        config.get('google_drive_folder_id', DRIVE_FOLDER_ID),
+        launcher.get_mods_dir(),
+        config.get('api_key', '') or DRIVE_API_KEY
+    )
+
+def _cli_record_sync(config):
+    """Enregistre last_sync (seule clé écrite par le CLI)"""
+    config['last_sync'] = datetime.now().strftime('%Y-%m-%d %H:%M')
+    # Relire le fichier juste avant d'écrire: une config enregistrée entre-temps par l'interface est conservée
+    config_store = get_config_store()
+    config_store.load(DEFAULT_CONFIG)['last_sync'] = config['last_sync']
+    config_store.flush()
+
+def _cli_sync(config, launcher, reporter, force_replace=False) -> int:
+    sync = _cli_make_sync(config, launcher)
+    stats = sync.sync(reporter.progress, force_replace=force_replace, config=config)
+    _cli_record_sync(config)
+    counts = {key: len(value) for key, value in stats.items()}
+    ok = not stats['errors']
+    report = asdict(sync.last_report) if sync.last_report else None
+    return reporter.result(ok, EXIT_OK if ok else EXIT_FAILURE, stats=counts, errors=stats['errors'], report=report)
+
+def _cli_verify(config, launcher, reporter) -> int:
+    result = _cli_make_sync(config, launcher).verify(reporter.progress)
+    ok = not (result['missing'] or result['mismatched'] or result['extra'])
+    report = None
+    preflight = launcher.preflight_check()
+    if preflight is not None:
+        report = {'ok': preflight.ok, 'errors': preflight.errors, 'warnings': preflight.warnings,
+                  'duration_ms': round(preflight.duration_ms, 1)}
+        ok = ok and preflight.ok
+    return reporter.result(ok, EXIT_OK if ok else EXIT_FAILURE,
+                           missing=result['missing'], mismatched=result['mismatched'],
+                           extra=result['extra'], unverified=len(result['unverified']),
+                           verified=len(result['ok']), preflight=report)
+
+def _cli_launch(config, launcher, reporter, skip_sync=False, wait=False) -> int:
+    java_path = JavaManager.find_java()
+    version_info = JavaManager.check_java_version(java_path) if java_path else None
+    if not version_info or version_info[0] < JavaManager.REQUIRED_JAVA_VERSION:
+        return reporter.result(False, EXIT_MISSING_PREREQUISITE, reason='java',
+                               java_path=java_path, java_major=version_info[0] if version_info else None)
+    if not launcher.find_prism_launcher():
+        return reporter.result(False, EXIT_MISSING_PREREQUISITE, reason='prism')
+    
+    if not skip_sync:
+        reporter.emit('phase', phase='sync')
+        stats = _cli_make_sync(config, launcher).sync(reporter.progress, config=config)
+        if stats['errors']:
+            return reporter.result(False, EXIT_FAILURE, reason='sync', errors=stats['errors'])
+        _cli_record_sync(config)
+    
+    reporter.emit('phase', phase='preflight')
+    preflight = launcher.preflight_check()
+    if preflight is not None and not preflight.ok:
+        return reporter.result(False, EXIT_PREFLIGHT_FAILED, reason='preflight', errors=preflight.errors)
+    
+    reporter.emit('phase', phase='launch')
+    if not launcher.launch():
+        return reporter.result(False, EXIT_FAILURE, reason='launch')
+    if wait and launcher.monitor_thread is not None:
+        reporter.emit('phase', phase='running')
+        launcher.monitor_thread.join()
+    return reporter.result(True, EXIT_OK)
+
+def _cli_status(config, launcher, reporter) -> int:
+    java_path = JavaManager.find_java()
+    version_info = JavaManager.check_java_version(java_path) if java_path else None
+    # Sans get_minecraft_dir(): status ne crée ni ne migre aucun dossier
+    instance_dir = launcher.get_instance_dir()
+    mc_dir = instance_dir / '.minecraft'
+    if not mc_dir.exists() and (instance_dir / 'minecraft').exists():
+        mc_dir = instance_dir / 'minecraft'
+    mods_dir = mc_dir / 'mods'
+    mods_exist = mods_dir.is_dir()
+    mod_count = len(list(mods_dir.glob('*.jar'))) if mods_exist else 0
+    system = get_system_profile()
+    return reporter.result(
+        True, EXIT_OK,
+        launcher_version=LAUNCHER_VERSION,
+        java={'path': java_path, 'major': version_info[0] if version_info else None},
+        prism=launcher.find_prism_launcher(),
+        instance={'name': launcher.instance_name, 'path': str(launcher.get_instance_dir()),
+                  'exists': launcher.instance_exists()},
+        mods={'path': str(mods_dir), 'exists': mods_exist, 'count': mod_count},
+        last_sync=config.get('last_sync', ''),
+        system={'total_ram_mb': system.total_ram_mb, 'available_ram_mb': system.available_ram_mb,
+                'cpu_cores': system.cpu_cores, 'gpu_vendor': system.gpu_vendor}
+    )
+
+def cli_main(argv) -> int:
+    """Point d'entrée du mode headless: python -m launcher sync|verify|launch|status"""
+    import argparse
+    parser = argparse.ArgumentParser(prog='python -m launcher', description="Illama Launcher (mode headless)")
+    sub = parser.add_subparsers(dest='command', required=True)
+    sync_parser = sub.add_parser('sync', help="Synchronise les mods depuis Google Drive")
+    sync_parser.add_argument('--force', action='store_true', help="Remplace tous les mods existants")
+    sub.add_parser('verify', help="Compare les mods locaux au Drive et verifie le modpack")
+    launch_parser = sub.add_parser('launch', help="Synchronise puis lance le jeu")
+    launch_parser.add_argument('--no-sync', action='store_true', help="Lance sans synchroniser")
+    launch_parser.add_argument('--wait', action='store_true', help="Attend la fermeture du jeu")
+    sub.add_parser('status', help="Etat de Java, Prism, de l'instance et du PC")
+    args = parser.parse_args(argv)
+    
+    reporter = CliReporter(args.command, CLI_STDOUT if HEADLESS else sys.stdout)
+    
+    config = load_launcher_config()
+    launcher = MinecraftLauncher(config)
+    try:
+        if args.command == 'sync':
+            return _cli_sync(config, launcher, reporter, force_replace=args.force)
+        if args.command == 'verify':
+            return _cli_verify(config, launcher, reporter)
+        if args.command == 'launch':
+            return _cli_launch(config, launcher, reporter, skip_sync=args.no_sync, wait=args.wait)
+        return _cli_status(config, launcher, reporter)
+    except Exception as e:
+        import traceback
+        traceback.print_exc()
+        return reporter.result(False, EXIT_FAILURE, reason='exception', error=str(e))
+
+
 # ============================================================
 # MAIN
 # ============================================================
@@ -6923,6 +8370,7 @@ def main():
     atexit.register(remove_lock_file)
     
     # Verifier auth existante
+    startup_trace.begin('config_load')
     auth_data = None
     if AUTH_FILE.exists():
         try:
@@ -6932,25 +8380,22 @@ def main():
             pass
     
     # Charger config
-    config = DEFAULT_CONFIG.copy()
-    if CONFIG_FILE.exists():
-        try:
-            with open(CONFIG_FILE, 'r', encoding='utf-8') as f:
-                config = {**DEFAULT_CONFIG, **json.load(f)}
-        except:
-            pass
+    config_store = get_config_store()
+    config = config_store.load(DEFAULT_CONFIG)
     
     # Mettre a jour config avec auth
     if auth_data:
         config.update(auth_data)
+    startup_trace.end('config_load')
     
     def start_launcher(final_config):
-        # Sauvegarder config
-        with open(CONFIG_FILE, 'w', encoding='utf-8') as f:
-            json.dump(final_config, f, indent=2)
+        # Sauvegarder config (écriture atomique, seulement si quelque chose a changé)
+        config_store.bind(final_config)
+        config_store.flush()
         
         # Lancer GUI principal
-        app = LauncherGUI(final_config)
+        with startup_trace.span('gui_init'):
+            app = LauncherGUI(final_config)
         app.run()
     
     def on_setup_complete(setup_config):
@@ -6980,5 +8425,9 @@ def main():
         login.run()
 
 
+startup_trace.end('imports')
+
 if __name__ == "__main__":
+    if HEADLESS:
+        sys.exit(cli_main(sys.argv[1:]))
     main()
\ No newline at end of file
@@ -1,18 +1,32 @@
 """
 Système de logging professionnel pour Illama Launcher
 Gère les logs console, fichier, et erreurs critiques
+
+Les handlers (fichiers, console) tournent sur un thread dédié: les threads
+qui loggent ne font que déposer l'enregistrement dans une file bornée
+
+Un journal d'événements séparé (events_AAAAMMJJ.jsonl) reçoit une ligne JSON
+par opération (operation, file, bytes, duration_ms, attempt, outcome...)
 """
 
+import atexit
+import json
 import logging
+import queue
 import sys
+import threading
+import time
+from contextlib import contextmanager
 from pathlib import Path
-from logging.handlers import RotatingFileHandler
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
 from datetime import datetime
 from typing import Optional
 
-# Créer le dossier de logs s'il n'existe pas
+# Dossier de logs (créé à la création du premier logger, pas à l'import)
 LOG_DIR = Path.home() / 'AppData' / 'Local' / 'IllamaLauncher' / 'logs'
-LOG_DIR.mkdir(parents=True, exist_ok=True)
+
+# Taille max de la file de logs (au-delà, les nouveaux messages sont comptés puis ignorés)
+LOG_QUEUE_SIZE = 10000
 
 class ColoredFormatter(logging.Formatter):
     """Formatter avec couleurs pour la console"""
@@ -37,6 +51,20 @@ class ColoredFormatter(logging.Formatter):
         return super().format(record)
 
 
+class DroppingQueueHandler(QueueHandler):
+    """QueueHandler qui ne bloque jamais: file pleine -> message ignoré et compté"""
+    
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+    
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
 class LauncherLogger:
     """Gestionnaire de logging centralisé"""
     
@@ -49,11 +77,15 @@ class LauncherLogger:
     ):
         self.logger = logging.getLogger(name)
         self.logger.setLevel(getattr(logging, log_level.upper()))
+        self.queue_handler: Optional[DroppingQueueHandler] = None
+        self.listener: Optional[QueueListener] = None
         
         # Éviter les doublons de handlers
         if self.logger.handlers:
             return
         
+        LOG_DIR.mkdir(parents=True, exist_ok=True)
+        
         # Format détaillé pour fichier
         file_formatter = logging.Formatter(
             '%(asctime)s | %(levelname)-8s | %(name)s | %(funcName)s:%(lineno)d | %(message)s',
@@ -75,7 +107,7 @@ class LauncherLogger:
         )
         file_handler.setLevel(logging.DEBUG)
         file_handler.setFormatter(file_formatter)
-        self.logger.addHandler(file_handler)
+        handlers = [file_handler]
         
         # === HANDLER 2: Fichier séparé pour les erreurs ===
         error_log_file = LOG_DIR / f'errors_{datetime.now().strftime("%Y%m%d")}.log'
@@ -83,18 +115,26 @@ class LauncherLogger:
             error_log_file,
             maxBytes=max_file_size_mb * 1024 * 1024,
             backupCount=backup_count,
-            encoding='utf-8'
+            encoding='utf-8',
+            delay=True  # Fichier d'erreurs ouvert seulement à la première erreur
         )
         error_handler.setLevel(logging.ERROR)
         error_handler.setFormatter(file_formatter)
-        self.logger.addHandler(error_handler)
+        handlers.append(error_handler)
         
         # === HANDLER 3: Console (seulement en mode debug) ===
         if log_level.upper() == 'DEBUG':
             console_handler = logging.StreamHandler(sys.stdout)
             console_handler.setLevel(logging.DEBUG)
             console_handler.setFormatter(console_formatter)
-            self.logger.addHandler(console_handler)
+            handlers.append(console_handler)
+        
+        # === File bornée: les écritures disque se font sur le thread du listener ===
+        self.queue_handler = DroppingQueueHandler(queue.Queue(LOG_QUEUE_SIZE))
+        self.listener = QueueListener(self.queue_handler.queue, *handlers, respect_handler_level=True)
+        self.listener.start()
+        self.logger.addHandler(self.queue_handler)
+        atexit.register(self.stop)
         
         self.logger.info(f"=== Illama Launcher démarré ===")
         self.logger.info(f"Logs sauvegardés dans: {LOG_DIR}")
@@ -103,6 +143,29 @@ class LauncherLogger:
         """Retourne l'instance du logger"""
         return self.logger
     
+    @property
+    def dropped(self) -> int:
+        """Nombre de messages ignorés parce que la file était pleine"""
+        return self.queue_handler.dropped if self.queue_handler else 0
+    
+    def stop(self):
+        """Vide la file, arrête le thread d'écriture et ferme les fichiers"""
+        if self.listener is None:
+            return
+        listener, self.listener = self.listener, None
+        self.logger.removeHandler(self.queue_handler)
+        listener.stop()
+        
+        # Le résumé passe directement par les handlers (la file est arrêtée)
+        if self.dropped:
+            record = self.logger.makeRecord(
+                self.logger.name, logging.WARNING, __file__, 0,
+                f"{self.dropped} message(s) de log ignoré(s) (file pleine)", None, None, func='stop'
+            )
+            listener.handle(record)
+        for handler in listener.handlers:
+            handler.close()
+    
     @staticmethod
     def log_exception(logger: logging.Logger, exception: Exception, context: str = ""):
         """
@@ -135,7 +198,7 @@ class LauncherLogger:
         cutoff_date = datetime.now() - timedelta(days=days_to_keep)
         
         deleted_count = 0
-        for log_file in LOG_DIR.glob('*.log*'):
+        for log_file in [*LOG_DIR.glob('*.log*'), *LOG_DIR.glob('*.jsonl*')]:
             try:
                 file_time = datetime.fromtimestamp(log_file.stat().st_mtime)
                 if file_time < cutoff_date:
@@ -171,6 +234,133 @@ def get_logger(
     return _logger_instance.get_logger()
 
 
+def get_dropped_count() -> int:
+    """Nombre de messages de log ignorés depuis le démarrage (file pleine)"""
+    return _logger_instance.dropped if _logger_instance else 0
+
+
+# === JOURNAL D'ÉVÉNEMENTS STRUCTURÉS ===
+class EventLog:
+    """
+    Journal d'événements: une ligne JSON par événement, pour agréger les
+    durées et les échecs après coup (téléchargements, Java, lancement...)
+    
+    Champs communs: ts, operation, outcome, thread; puis file, bytes,
+    duration_ms, attempt, message... quand ils sont fournis
+    """
+    
+    def __init__(self, max_file_size_mb: int = 10, backup_count: int = 5):
+        self.logger = logging.getLogger('illama_launcher.events')
+        self.logger.setLevel(logging.INFO)
+        self.logger.propagate = False  # Pas de JSON dans les logs texte
+        self.queue_handler: Optional[DroppingQueueHandler] = None
+        self.listener: Optional[QueueListener] = None
+        
+        if self.logger.handlers:
+            return
+        
+        LOG_DIR.mkdir(parents=True, exist_ok=True)
+        events_file = LOG_DIR / f'events_{datetime.now().strftime("%Y%m%d")}.jsonl'
+        file_handler = RotatingFileHandler(
+            events_file,
+            maxBytes=max_file_size_mb * 1024 * 1024,
+            backupCount=backup_count,
+            encoding='utf-8',
+            delay=True
+        )
+        file_handler.setFormatter(logging.Formatter('%(message)s'))
+        
+        # Même principe que les logs texte: écriture disque sur un thread dédié
+        self.queue_handler = DroppingQueueHandler(queue.Queue(LOG_QUEUE_SIZE))
+        self.listener = QueueListener(self.queue_handler.queue, file_handler)
+        self.listener.start()
+        self.logger.addHandler(self.queue_handler)
+        atexit.register(self.stop)
+    
+    def emit(self, operation: str, outcome: str = 'ok', **fields):
+        """
+        Enregistre un événement
+        
+        Args:
+            operation: Nom de l'opération (ex: "sync.download", "java.install")
+            outcome: Résultat (ok, error, retry, info...)
+            **fields: file, bytes, duration_ms, attempt, message... (None = omis)
+        """
+        event = {
+            'ts': datetime.now().isoformat(timespec='milliseconds'),
+            'operation': operation,
+            'outcome': outcome,
+            'thread': threading.current_thread().name,
+        }
+        event.update((key, value) for key, value in fields.items() if value is not None)
+        self.logger.info(json.dumps(event, ensure_ascii=False, default=str))
+    
+    @contextmanager
+    def timed(self, operation: str, **fields):
+        """
+        Mesure un bloc et l'enregistre avec duration_ms
+        
+        Usage:
+            with get_event_log().timed('sync', files=12) as event:
+                ...
+                event['bytes'] = total  # champs ajoutés pendant le bloc
+        """
+        event = dict(fields)
+        event.setdefault('outcome', 'ok')
+        start = time.perf_counter()
+        try:
+            yield event
+        except Exception as e:
+            event['outcome'] = 'error'
+            event.setdefault('error', str(e))
+            raise
+        finally:
+            event['duration_ms'] = round((time.perf_counter() - start) * 1000, 1)
+            self.emit(operation, **event)
+    
+    @property
+    def dropped(self) -> int:
+        """Nombre d'événements ignorés parce que la file était pleine"""
+        return self.queue_handler.dropped if self.queue_handler else 0
+    
+    def stop(self):
+        """Vide la file et ferme le fichier d'événements"""
+        if self.listener is None:
+            return
+        listener, self.listener = self.listener, None
+        self.logger.removeHandler(self.queue_handler)
+        listener.stop()
+        for handler in listener.handlers:
+            handler.close()
+
+
+_event_log_instance: Optional[EventLog] = None
+_event_log_lock = threading.Lock()
+
+
+def get_event_log() -> EventLog:
+    """
+    Récupère le journal d'événements (Singleton)
+    
+    Usage:
+        from logger_config import log_event
+        log_event('sync.download', file='mod.jar', bytes=1024, duration_ms=12.5, attempt=1)
+    """
+    global _event_log_instance
+    
+    # Créé depuis plusieurs threads de téléchargement à la fois
+    with _event_log_lock:
+        if _event_log_instance is None:
+            _event_log_instance = EventLog()
+    
+    return _event_log_instance
+
+
+def log_event(operation: str, outcome: str = 'ok', **fields):
+    """Raccourci pour get_event_log().emit(...)"""
+    get_event_log().emit(operation, outcome, **fields)
+
+
 # === DÉCORATEURS UTILITAIRES ===
 def log_function_call(logger: Optional[logging.Logger] = None):
     """
@@ -223,6 +413,10 @@ if __name__ == "__main__":
     
     test_function(5, 3)
     
+    # Événement structuré
+    with get_event_log().timed('exemple.operation', file='test.jar') as event:
+        event['bytes'] = 1024
+    
     # Nettoyage des vieux logs
     LauncherLogger.cleanup_old_logs(days_to_keep=7)
     
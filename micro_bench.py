@@ -0,0 +1,458 @@
+"""
+Micro-benchmarks des chemins disque d'Illama Launcher
+Empreintes (MD5/SHA-256, file_hash), détection des instances
+Prism, options.txt, servers.dat et lecture/écriture de la config
+
+Tout s'exécute dans un HOME temporaire (APPDATA/USERPROFILE compris): la config
+et les instances de l'utilisateur ne sont jamais lues ni modifiées
+
+Usage:
+    python micro_bench.py                        # tous les benchmarks
+    python micro_bench.py -k hash                # filtre sur le nom
+    python micro_bench.py --save avant           # baseline .benchmarks/avant.json
+    python micro_bench.py --compare avant        # écart par rapport à la baseline
+    python micro_bench.py --compare avant --max-regression 15   # code retour 1 au-delà de +15%
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import shutil
+import argparse
+import platform
+import tempfile
+import statistics
+import contextlib
+from pathlib import Path
+from typing import Callable, List, Optional
+from dataclasses import dataclass, asdict
+
+HERE = Path(__file__).resolve().parent
+BASELINE_DIR = HERE / '.benchmarks'
+
+# Mesure: au moins MIN_ROUNDS appels et au moins MIN_TIME_S secondes
+MIN_ROUNDS = 15
+MIN_TIME_S = 0.5
+WARMUP_ROUNDS = 2
+
+HASH_FILE_MB = 8
+PRISM_INSTANCES = 50
+OPTIONS_LINES = 300
+
+
+@dataclass
+class BenchStats:
+    """Durées d'un benchmark en millisecondes"""
+    name: str
+    rounds: int
+    min_ms: float
+    median_ms: float
+    mean_ms: float
+    stddev_ms: float
+
+
+@dataclass
+class BenchCase:
+    """setup(work_dir) prépare les fichiers et retourne la fonction mesurée"""
+    name: str
+    setup: Callable[[Path], Callable[[], object]]
+
+
+def measure(name: str, func: Callable[[], object]) -> BenchStats:
+    """Appelle func jusqu'à MIN_ROUNDS appels et MIN_TIME_S secondes (après échauffement)"""
+    for _ in range(WARMUP_ROUNDS):
+        func()
+    timings = []
+    started = time.perf_counter()
+    while len(timings) < MIN_ROUNDS or time.perf_counter() - started < MIN_TIME_S:
+        start = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - start) * 1000)
+    return BenchStats(
+        name=name,
+        rounds=len(timings),
+        min_ms=round(min(timings), 4),
+        median_ms=round(statistics.median(timings), 4),
+        mean_ms=round(statistics.mean(timings), 4),
+        stddev_ms=round(statistics.stdev(timings), 4) if len(timings) > 1 else 0.0,
+    )
+
+
+# ============================================================
+# BENCHMARKS (le module launcher est importé après l'isolation du HOME)
+# ============================================================
+
+def _launcher():
+    import launcher
+    return launcher
+
+
+def _write_random_file(path: Path, size_mb: int) -> Path:
+    rng = random.Random(size_mb)
+    path.write_bytes(rng.getrandbits(size_mb * 1024 * 1024 * 8).to_bytes(size_mb * 1024 * 1024, 'little'))
+    return path
+
+
+def _hash_file(work_dir: Path) -> Path:
+    path = work_dir / 'hash' / 'bigmod.jar'
+    if not path.exists():
+        path.parent.mkdir(parents=True, exist_ok=True)
+        _write_random_file(path, HASH_FILE_MB)
+    return path
+
+
+def setup_calculate_md5_4k(work_dir: Path):
+    """GoogleDriveSync._calculate_md5 sans index ni file_hash (boucle de référence, blocs de 4 KB)"""
+    launcher = _launcher()
+    path = _hash_file(work_dir)
+    sync = launcher.GoogleDriveSync('bench', path.parent)
+
+    def run():
+        indexed, launcher.QUICK_WINS_MOD_INDEX = launcher.QUICK_WINS_MOD_INDEX, False
+        hashing, launcher.QUICK_WINS_FILE_HASH = launcher.QUICK_WINS_FILE_HASH, False
+        try:
+            return sync._calculate_md5(path)
+        finally:
+            launcher.QUICK_WINS_MOD_INDEX = indexed
+            launcher.QUICK_WINS_FILE_HASH = hashing
+    return run
+
+
+def setup_calculate_md5_indexed(work_dir: Path):
+    """GoogleDriveSync._calculate_md5 avec l'index des mods (fichier inchangé: un stat())"""
+    launcher = _launcher()
+    path = _hash_file(work_dir)
+    sync = launcher.GoogleDriveSync('bench', path.parent)
+    return lambda: sync._calculate_md5(path)
+
+
+def setup_mod_index_md5(work_dir: Path):
+    """mod_index.md5_file, la lecture utilisée par l'index"""
+    from mod_index import md5_file
+    path = _hash_file(work_dir)
+    return lambda: md5_file(path)
+
+
+def setup_download_manager_md5(work_dir: Path):
+    """DownloadManager._calculate_hash MD5"""
+    from download_manager import DownloadManager
+    path = _hash_file(work_dir)
+    return lambda: DownloadManager._calculate_hash(path, 'md5')
+
+
+def setup_download_manager_sha256(work_dir: Path):
+    """DownloadManager._calculate_hash SHA-256"""
+    from download_manager import DownloadManager
+    path = _hash_file(work_dir)
+    return lambda: DownloadManager._calculate_hash(path, 'sha256')
+
+
+def setup_file_hash_mmap(work_dir: Path):
+    """file_hash.hash_file MD5 sur un fichier au-delà du seuil mmap"""
+    import file_hash
+    path = work_dir / 'hash' / 'hugemod.jar'
+    if not path.exists():
+        path.parent.mkdir(parents=True, exist_ok=True)
+        _write_random_file(path, file_hash.MMAP_THRESHOLD // (1024 * 1024))
+    return lambda: file_hash.hash_file(path)
+
+
+def setup_file_hash_md5_sha256(work_dir: Path):
+    """file_hash.hash_file MD5 + SHA-256 en une seule lecture"""
+    import file_hash
+    path = _hash_file(work_dir)
+    return lambda: file_hash.hash_file(path, ('md5', 'sha256'))
+
+
+def setup_hash_many(work_dir: Path):
+    """file_hash.hash_many sur 64 jars de 256 KB"""
+    import file_hash
+    folder = work_dir / 'hash' / 'many'
+    if not folder.exists():
+        folder.mkdir(parents=True)
+        rng = random.Random(64)
+        for index in range(64):
+            (folder / f"mod{index:02d}.jar").write_bytes(rng.getrandbits(256 * 1024 * 8).to_bytes(256 * 1024, 'little'))
+    paths = sorted(folder.iterdir())
+    return lambda: file_hash.hash_many(paths)
+
+
+def setup_verify_cold(work_dir: Path):
+    """GoogleDriveSync.verify sur 64 jars sans index (hachage parallèle, plus gros en premier)"""
+    import hashlib
+    launcher = _launcher()
+    folder = work_dir / 'verify' / 'mods'
+    folder.mkdir(parents=True, exist_ok=True)
+    rng = random.Random(128)
+    remote_files = []
+    for index in range(64):
+        data = rng.getrandbits(128 * 1024 * (1 + index % 8) * 8).to_bytes(128 * 1024 * (1 + index % 8), 'little')
+        (folder / f"mod{index:02d}.jar").write_bytes(data)
+        remote_files.append({'name': f"mod{index:02d}.jar", 'id': str(index), 'md5': hashlib.md5(data).hexdigest()})
+    sync = launcher.GoogleDriveSync('bench', folder)
+    sync.get_folder_files = lambda: remote_files
+
+    def run():
+        indexed, launcher.QUICK_WINS_MOD_INDEX = launcher.QUICK_WINS_MOD_INDEX, False
+        try:
+            return sync.verify()
+        finally:
+            launcher.QUICK_WINS_MOD_INDEX = indexed
+    return run
+
+
+def _make_prism_instances(count: int) -> Path:
+    instances_dir = Path.home() / 'AppData' / 'Roaming' / 'PrismLauncher' / 'instances'
+    if instances_dir.exists():
+        return instances_dir
+    for index in range(count):
+        instance_dir = instances_dir / f"Instance{index:03d}"
+        (instance_dir / '.minecraft').mkdir(parents=True)
+        (instance_dir / 'instance.cfg').write_text(
+            f"InstanceType=OneSix\nname=Instance {index}\nIntendedVersion=1.20.1\n"
+            + "".join(f"Setting{n}=value{n}\n" for n in range(40)),
+            encoding='utf-8'
+        )
+        (instance_dir / 'mmc-pack.json').write_text(json.dumps({'components': [
+            {'uid': 'net.minecraft', 'version': '1.20.1'},
+            {'uid': 'net.minecraftforge', 'version': '47.4.13'},
+        ], 'formatVersion': 1}), encoding='utf-8')
+    return instances_dir
+
+
+def setup_detect_instances_catalog(work_dir: Path):
+    """detect_existing_prism_instances sur 50 instances (catalogue en cache)"""
+    launcher = _launcher()
+    _make_prism_instances(PRISM_INSTANCES)
+    return launcher.detect_existing_prism_instances
+
+
+def setup_detect_instances_scan(work_dir: Path):
+    """detect_existing_prism_instances sur 50 instances (scan complet, sans catalogue)"""
+    launcher = _launcher()
+    _make_prism_instances(PRISM_INSTANCES)
+
+    def run():
+        catalog, launcher.QUICK_WINS_PRISM_CATALOG = launcher.QUICK_WINS_PRISM_CATALOG, False
+        try:
+            return launcher.detect_existing_prism_instances()
+        finally:
+            launcher.QUICK_WINS_PRISM_CATALOG = catalog
+    return run
+
+
+def _bench_instance():
+    launcher = _launcher()
+    mc_launcher = launcher.MinecraftLauncher({'prism_instance_name': 'BenchInstance', 'auto_connect': True})
+    mc_launcher.get_minecraft_dir().mkdir(parents=True, exist_ok=True)
+    return mc_launcher
+
+
+def setup_create_options_txt(work_dir: Path):
+    """create_options_txt sur un options.txt de 300 lignes"""
+    mc_launcher = _bench_instance()
+    options_file = mc_launcher.get_minecraft_dir() / 'options.txt'
+    options_file.write_text(
+        "".join(f"key_option_{n}:value_{n}\n" for n in range(OPTIONS_LINES)), encoding='utf-8'
+    )
+    return mc_launcher.create_options_txt
+
+
+def setup_create_server_dat(work_dir: Path):
+    """create_server_dat (écriture NBT + lecture seule)"""
+    mc_launcher = _bench_instance()
+    return mc_launcher.create_server_dat
+
+
+def setup_enforce_server_only(work_dir: Path):
+    """_enforce_server_only sur un servers.dat déjà conforme (chemin du lancement)"""
+    mc_launcher = _bench_instance()
+    mc_launcher.create_server_dat()
+    return mc_launcher._enforce_server_only
+
+
+def setup_config_load(work_dir: Path):
+    """ConfigStore.load de la config par défaut"""
+    launcher = _launcher()
+    store = launcher.ConfigStore(work_dir / 'config' / 'config.json')
+    store.load(launcher.DEFAULT_CONFIG)
+    store.flush()
+    return lambda: store.load(launcher.DEFAULT_CONFIG)
+
+
+def setup_config_save(work_dir: Path):
+    """ConfigStore.flush avec une clé modifiée (écriture atomique)"""
+    launcher = _launcher()
+    store = launcher.ConfigStore(work_dir / 'config' / 'config.json')
+    config = store.load(launcher.DEFAULT_CONFIG)
+    counter = [0]
+
+    def run():
+        counter[0] += 1
+        config['window_geometry'] = f"{900 + counter[0] % 2}x700+10+10"
+        return store.flush()
+    return run
+
+
+def setup_config_save_unchanged(work_dir: Path):
+    """ConfigStore.flush sans modification (aucune écriture)"""
+    launcher = _launcher()
+    store = launcher.ConfigStore(work_dir / 'config' / 'config.json')
+    store.load(launcher.DEFAULT_CONFIG)
+    store.flush()
+    return store.flush
+
+
+BENCHMARKS = [
+    BenchCase('hash.calculate_md5_4k', setup_calculate_md5_4k),
+    BenchCase('hash.calculate_md5_indexed', setup_calculate_md5_indexed),
+    BenchCase('hash.mod_index_md5', setup_mod_index_md5),
+    BenchCase('hash.download_manager_md5', setup_download_manager_md5),
+    BenchCase('hash.download_manager_sha256', setup_download_manager_sha256),
+    BenchCase('hash.file_hash_mmap_32m', setup_file_hash_mmap),
+    BenchCase('hash.file_hash_md5_sha256', setup_file_hash_md5_sha256),
+    BenchCase('hash.hash_many_64', setup_hash_many),
+    BenchCase('sync.verify_cold_64', setup_verify_cold),
+    BenchCase('prism.detect_instances_catalog', setup_detect_instances_catalog),
+    BenchCase('prism.detect_instances_scan', setup_detect_instances_scan),
+    BenchCase('instance.create_options_txt', setup_create_options_txt),
+    BenchCase('instance.create_server_dat', setup_create_server_dat),
+    BenchCase('instance.enforce_server_only', setup_enforce_server_only),
+    BenchCase('config.load', setup_config_load),
+    BenchCase('config.save', setup_config_save),
+    BenchCase('config.save_unchanged', setup_config_save_unchanged),
+]
+
+
+# ============================================================
+# EXÉCUTION, BASELINES ET COMPARAISON
+# ============================================================
+
+def isolate_home(work_dir: Path):
+    """Redirige HOME/USERPROFILE/APPDATA vers work_dir (avant tout import du launcher)"""
+    os.environ['HOME'] = str(work_dir)
+    os.environ['USERPROFILE'] = str(work_dir)
+    os.environ['APPDATA'] = str(work_dir / 'AppData' / 'Roaming')
+
+
+def run_benchmarks(keyword: str = '') -> List[BenchStats]:
+    """
+    Exécute les benchmarks dont le nom contient keyword
+
+    Returns:
+        Liste de BenchStats
+    """
+    results = []
+    work_dir = Path(tempfile.mkdtemp(prefix='illama_microbench_'))
+    try:
+        isolate_home(work_dir)
+        sys.path.insert(0, str(HERE))
+        # Les lignes "[Tag] ..." du launcher ne comptent pas dans les mesures
+        with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+            for case in BENCHMARKS:
+                if keyword and keyword not in case.name:
+                    continue
+                func = case.setup(work_dir)
+                results.append(measure(case.name, func))
+                print(f"[Bench] {case.name}: {results[-1].median_ms:.3f} ms", file=sys.stderr)
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+    return results
+
+
+def _baseline_path(name: str) -> Path:
+    path = Path(name)
+    if path.suffix == '.json' or path.parent != Path('.'):
+        return path
+    return BASELINE_DIR / f"{name}.json"
+
+
+def save_baseline(results: List[BenchStats], name: str) -> Path:
+    """Écrit les résultats et la machine de mesure dans une baseline JSON"""
+    path = _baseline_path(name)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    sys.path.insert(0, str(HERE))
+    from launcher import LAUNCHER_VERSION
+    data = {
+        'saved_at': time.strftime('%Y-%m-%d %H:%M:%S'),
+        'launcher_version': LAUNCHER_VERSION,
+        'machine': {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'processor': platform.processor() or platform.machine(),
+        },
+        'benchmarks': [asdict(r) for r in results],
+    }
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2)
+    return path
+
+
+def compare(results: List[BenchStats], name: str, max_regression: Optional[float] = None) -> int:
+    """
+    Affiche l'écart des médianes par rapport à une baseline
+
+    Args:
+        results: Mesures courantes
+        name: Nom ou chemin de la baseline
+        max_regression: Écart maximal toléré en % (code retour 1 au-delà)
+
+    Returns:
+        Code retour (0 = pas de régression au-delà du seuil)
+    """
+    path = _baseline_path(name)
+    with open(path, 'r', encoding='utf-8') as f:
+        baseline = json.load(f)
+    previous = {b['name']: b for b in baseline.get('benchmarks', [])}
+
+    print(f"Baseline: {path} (v{baseline.get('launcher_version', '?')}, {baseline.get('saved_at', '?')})")
+    print(f"{'Benchmark':<36}{'Baseline':>12}{'Actuel':>12}{'Ecart':>10}")
+    regressions = []
+    for result in results:
+        before = previous.get(result.name)
+        if not before:
+            print(f"{result.name:<36}{'-':>12}{result.median_ms:>10.3f}ms{'nouveau':>10}")
+            continue
+        delta = (result.median_ms - before['median_ms']) / before['median_ms'] * 100 if before['median_ms'] else 0.0
+        flag = ''
+        if max_regression is not None and delta > max_regression:
+            regressions.append(result.name)
+            flag = '  <-- regression'
+        print(f"{result.name:<36}{before['median_ms']:>10.3f}ms{result.median_ms:>10.3f}ms{delta:>+9.1f}%{flag}")
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) au-delà de {max_regression}%: {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+def format_results(results: List[BenchStats]) -> str:
+    lines = [f"{'Benchmark':<36}{'Min':>11}{'Mediane':>11}{'Moyenne':>11}{'Ecart-type':>12}{'Tours':>7}"]
+    for r in results:
+        lines.append(f"{r.name:<36}{r.min_ms:>9.3f}ms{r.median_ms:>9.3f}ms{r.mean_ms:>9.3f}ms"
+                     f"{r.stddev_ms:>10.3f}ms{r.rounds:>7}")
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Micro-benchmarks des chemins disque du launcher")
+    parser.add_argument('-k', '--keyword', default='', help="ne lance que les benchmarks dont le nom contient ce texte")
+    parser.add_argument('--save', metavar='NOM', help="enregistre une baseline (.benchmarks/NOM.json ou chemin .json)")
+    parser.add_argument('--compare', metavar='NOM', help="compare à une baseline enregistrée")
+    parser.add_argument('--max-regression', type=float, metavar='PCT',
+                        help="avec --compare: code retour 1 si une médiane augmente de plus de PCT %%")
+    parser.add_argument('--json', action='store_true', help="sortie JSON")
+    args = parser.parse_args()
+
+    bench_results = run_benchmarks(args.keyword)
+    exit_code = 0
+    if args.json:
+        print(json.dumps([asdict(r) for r in bench_results], indent=2))
+    elif not args.compare:
+        print(format_results(bench_results))
+    if args.compare:
+        exit_code = compare(bench_results, args.compare, args.max_regression)
+    if args.save:
+        print(f"\nBaseline enregistrée: {save_baseline(bench_results, args.save)}")
+    sys.exit(exit_code)
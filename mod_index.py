@@ -0,0 +1,445 @@
+"""
+Index des mods (empreintes + métadonnées) pour Illama Launcher
+Chaque jar est identifié par chemin, taille et mtime; son MD5 et le contenu de
+META-INF/mods.toml / MANIFEST.MF ne sont recalculés que si le fichier a changé
+"""
+
+import io
+import os
+import re
+import json
+import zipfile
+import threading
+from pathlib import Path
+from typing import Optional, List, Dict
+from dataclasses import dataclass, field, asdict
+
+from java_registry import DATA_DIR
+from file_hash import file_digest
+
+INDEX_FILE = DATA_DIR / 'mod_index.json'
+INDEX_FORMAT = 2
+
+# Jars embarqués par Forge (jar-in-jar)
+JARJAR_METADATA = 'META-INF/jarjar/metadata.json'
+JARJAR_MAX_DEPTH = 2
+
+
+@dataclass
+class ModDependency:
+    """Dépendance déclarée dans [[dependencies.<modId>]]"""
+    of: str
+    mod_id: str
+    mandatory: bool = True
+    version_range: str = ""
+    side: str = "BOTH"
+
+
+@dataclass
+class ModInfo:
+    """Entrée [[mods]] d'un mods.toml"""
+    mod_id: str
+    version: str = ""
+    display_name: str = ""
+
+
+@dataclass
+class JarMetadata:
+    """Métadonnées d'un jar de mod"""
+    file_name: str
+    md5: str
+    mod_loader: str = ""
+    loader_version: str = ""
+    mods: List[ModInfo] = field(default_factory=list)
+    dependencies: List[ModDependency] = field(default_factory=list)
+    manifest: Dict[str, str] = field(default_factory=dict)
+    # Mods fournis par les jars embarqués (META-INF/jarjar)
+    nested_mods: List[ModInfo] = field(default_factory=list)
+    nested_unreadable: int = 0
+    error: Optional[str] = None
+
+    @property
+    def mod_ids(self) -> List[str]:
+        return [mod.mod_id for mod in self.mods]
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'JarMetadata':
+        data = dict(data)
+        data['mods'] = [ModInfo(**m) for m in data.get('mods', [])]
+        data['nested_mods'] = [ModInfo(**m) for m in data.get('nested_mods', [])]
+        data['dependencies'] = [ModDependency(**d) for d in data.get('dependencies', [])]
+        return cls(**data)
+
+
+# ============================================================
+# LECTURE DES MÉTADONNÉES
+# ============================================================
+
+_TOML_TABLE_RE = re.compile(r'^\[\[\s*([A-Za-z0-9_.\-"]+)\s*\]\]')
+_TOML_KV_RE = re.compile(r'^([A-Za-z0-9_\-]+)\s*=\s*(.+)$')
+
+
+def _toml_value(raw: str):
+    """Convertit une valeur TOML simple (chaîne, booléen, nombre)"""
+    raw = raw.strip()
+    if raw[:1] in ('"', "'"):
+        quote = raw[0]
+        end = raw.find(quote, 1)
+        return raw[1:end] if end > 0 else raw[1:]
+    # Retirer un commentaire en fin de ligne
+    raw = raw.split('#', 1)[0].strip()
+    if raw in ('true', 'false'):
+        return raw == 'true'
+    return raw
+
+
+def parse_mods_toml(text: str) -> dict:
+    """
+    Lecteur tolérant de mods.toml (beaucoup de mods publient un TOML approximatif)
+
+    Returns:
+        {'root': {...}, 'mods': [{...}], 'dependencies': [(modId, {...})]}
+    """
+    result = {'root': {}, 'mods': [], 'dependencies': []}
+    current = result['root']
+    in_multiline = None
+    for line in text.splitlines():
+        stripped = line.strip()
+        if in_multiline:
+            if in_multiline in stripped:
+                in_multiline = None
+            continue
+        if not stripped or stripped.startswith('#'):
+            continue
+
+        table = _TOML_TABLE_RE.match(stripped)
+        if table:
+            name = table.group(1).replace('"', '')
+            current = {}
+            if name == 'mods':
+                result['mods'].append(current)
+            elif name.startswith('dependencies.'):
+                result['dependencies'].append((name.split('.', 1)[1], current))
+            continue
+        if stripped.startswith('['):
+            # Table simple ([modproperties.x]...): ignorée
+            current = {}
+            continue
+
+        kv = _TOML_KV_RE.match(stripped)
+        if kv:
+            key, raw = kv.groups()
+            for quote in ('"""', "'''"):
+                if raw.strip().startswith(quote) and raw.strip().count(quote) == 1:
+                    in_multiline = quote
+            if in_multiline:
+                continue
+            current[key] = _toml_value(raw)
+    return result
+
+
+def parse_manifest(text: str) -> Dict[str, str]:
+    """Lit un MANIFEST.MF (avec lignes de continuation)"""
+    manifest = {}
+    last_key = None
+    for line in text.splitlines():
+        if line.startswith(' ') and last_key:
+            manifest[last_key] += line[1:]
+        elif ':' in line:
+            key, value = line.split(':', 1)
+            last_key = key.strip()
+            manifest[last_key] = value.strip()
+        elif not line.strip():
+            # Seule la section principale nous intéresse
+            if manifest:
+                break
+    return manifest
+
+
+def _toml_mods(toml: dict, jar_version: str) -> List[ModInfo]:
+    """Entrées [[mods]] (avec ${file.jarVersion} remplacé par la version du jar)"""
+    mods = []
+    for mod in toml['mods']:
+        mod_id = str(mod.get('modId', '')).strip()
+        if not mod_id:
+            continue
+        version = str(mod.get('version', ''))
+        if '${file.jarVersion}' in version:
+            version = version.replace('${file.jarVersion}', jar_version)
+        mods.append(ModInfo(mod_id=mod_id, version=version,
+                            display_name=str(mod.get('displayName', ''))))
+    return mods
+
+
+def read_nested_mods(jar: zipfile.ZipFile, depth: int = 1):
+    """
+    Mods des jars embarqués listés dans META-INF/jarjar/metadata.json
+
+    Args:
+        jar: Jar parent ouvert
+        depth: Niveau d'imbrication (limité à JARJAR_MAX_DEPTH)
+
+    Returns:
+        (liste de ModInfo, nombre de jars embarqués illisibles)
+    """
+    try:
+        entries = json.loads(jar.read(JARJAR_METADATA).decode('utf-8', errors='replace')).get('jars', [])
+    except (KeyError, ValueError, AttributeError):
+        return [], 1
+    mods, unreadable = [], 0
+    for entry in entries:
+        artifact_version = str((entry.get('version') or {}).get('artifactVersion', ''))
+        try:
+            with zipfile.ZipFile(io.BytesIO(jar.read(entry['path']))) as nested:
+                names = set(nested.namelist())
+                manifest = {}
+                if 'META-INF/MANIFEST.MF' in names:
+                    manifest = parse_manifest(nested.read('META-INF/MANIFEST.MF').decode('utf-8', errors='replace'))
+                if 'META-INF/mods.toml' in names:
+                    toml = parse_mods_toml(nested.read('META-INF/mods.toml').decode('utf-8', errors='replace'))
+                    jar_version = manifest.get('Implementation-Version', '') or artifact_version
+                    mods.extend(_toml_mods(toml, jar_version))
+                if depth < JARJAR_MAX_DEPTH and JARJAR_METADATA in names:
+                    deeper, deeper_unreadable = read_nested_mods(nested, depth + 1)
+                    mods.extend(deeper)
+                    unreadable += deeper_unreadable
+        except (KeyError, TypeError, OSError, zipfile.BadZipFile):
+            unreadable += 1
+    return mods, unreadable
+
+
+def read_jar_metadata(path: Path, md5: str) -> JarMetadata:
+    """
+    Lit mods.toml et MANIFEST.MF depuis le répertoire central du jar, sans extraction
+    (ainsi que les mods.toml des jars embarqués, seuls ceux-ci sont décompressés en mémoire)
+
+    Args:
+        path: Chemin du jar
+        md5: Empreinte déjà calculée du jar
+
+    Returns:
+        JarMetadata (error renseigné si le jar est illisible)
+    """
+    meta = JarMetadata(file_name=path.name, md5=md5)
+    try:
+        with zipfile.ZipFile(path) as jar:
+            names = set(jar.namelist())
+            if 'META-INF/MANIFEST.MF' in names:
+                meta.manifest = parse_manifest(
+                    jar.read('META-INF/MANIFEST.MF').decode('utf-8', errors='replace'))
+            if 'META-INF/mods.toml' in names:
+                toml = parse_mods_toml(jar.read('META-INF/mods.toml').decode('utf-8', errors='replace'))
+            else:
+                toml = None
+            if JARJAR_METADATA in names:
+                meta.nested_mods, meta.nested_unreadable = read_nested_mods(jar)
+    except (OSError, zipfile.BadZipFile) as e:
+        meta.error = str(e)
+        return meta
+
+    if not toml:
+        return meta
+
+    jar_version = meta.manifest.get('Implementation-Version', '')
+    meta.mod_loader = str(toml['root'].get('modLoader', ''))
+    meta.loader_version = str(toml['root'].get('loaderVersion', ''))
+    meta.mods = _toml_mods(toml, jar_version)
+    for owner, dep in toml['dependencies']:
+        dep_id = str(dep.get('modId', '')).strip()
+        if not dep_id:
+            continue
+        # Forge 1.20.1: mandatory=true/false; versions récentes: type="required"/"optional"
+        if 'type' in dep:
+            mandatory = str(dep['type']).lower() == 'required'
+        else:
+            mandatory = dep.get('mandatory', True) is True
+        meta.dependencies.append(ModDependency(
+            of=owner,
+            mod_id=dep_id,
+            mandatory=mandatory,
+            version_range=str(dep.get('versionRange', '')),
+            side=str(dep.get('side', 'BOTH')).upper()
+        ))
+    return meta
+
+
+def md5_file(path: Path) -> str:
+    """MD5 d'un fichier (file_hash: tampon réutilisé ou mmap)"""
+    return file_digest(path, 'md5')
+
+
+# ============================================================
+# INDEX
+# ============================================================
+
+class ModIndex:
+    """
+    Index persistant: chemin -> (taille, mtime, md5, métadonnées)
+
+    Un fichier n'est relu que si sa taille ou son mtime change, et ses
+    métadonnées ne sont relues que si son MD5 change.
+    """
+
+    def __init__(self, index_file: Path = INDEX_FILE):
+        self.index_file = index_file
+        self._lock = threading.RLock()
+        self._entries: Dict[str, dict] = {}
+        self._loaded = False
+        self._dirty = False
+        self.hits = 0
+        self.misses = 0
+
+    def _load(self):
+        if self._loaded:
+            return
+        self._loaded = True
+        try:
+            with open(self.index_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('format') == INDEX_FORMAT:
+                self._entries = data.get('entries', {})
+        except (OSError, ValueError):
+            pass
+
+    def save(self):
+        """Écrit l'index sur disque (atomique) s'il a changé"""
+        with self._lock:
+            if not self._dirty:
+                return
+            payload = json.dumps({'format': INDEX_FORMAT, 'entries': self._entries})
+            self._dirty = False
+        try:
+            self.index_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = self.index_file.with_suffix('.tmp')
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                f.write(payload)
+            os.replace(tmp_file, self.index_file)
+        except OSError as e:
+            print(f"[ModIndex] Impossible d'enregistrer l'index: {e}")
+
+    def _entry(self, path: Path) -> Optional[dict]:
+        """Entrée valide pour le fichier (stat identique) ou None"""
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        key = str(path)
+        with self._lock:
+            self._load()
+            entry = self._entries.get(key)
+            if entry and entry['size'] == st.st_size and entry['mtime_ns'] == st.st_mtime_ns:
+                self.hits += 1
+                return entry
+            self.misses += 1
+            entry = {'size': st.st_size, 'mtime_ns': st.st_mtime_ns, 'md5': None,
+                     'metadata': entry.get('metadata') if entry else None}
+            self._entries[key] = entry
+            self._dirty = True
+            return entry
+
+    def get_md5(self, path: Path) -> str:
+        """
+        MD5 du fichier, depuis l'index si le fichier n'a pas changé
+
+        Returns:
+            MD5 hexadécimal ('' si le fichier est illisible)
+        """
+        path = Path(path)
+        entry = self._entry(path)
+        if entry is None:
+            return ''
+        if entry['md5']:
+            return entry['md5']
+        try:
+            md5 = md5_file(path)
+        except OSError as e:
+            print(f"[MD5] Erreur pour {path}: {e}")
+            return ''
+        with self._lock:
+            entry['md5'] = md5
+            self._dirty = True
+        return md5
+
+    def get_metadata(self, path: Path) -> Optional[JarMetadata]:
+        """
+        Métadonnées du jar; relues seulement si son MD5 a changé
+
+        Returns:
+            JarMetadata ou None si le fichier n'existe pas
+        """
+        path = Path(path)
+        md5 = self.get_md5(path)
+        if not md5:
+            return None
+        with self._lock:
+            entry = self._entries.get(str(path))
+            cached = entry.get('metadata') if entry else None
+        if cached and cached.get('md5') == md5:
+            return JarMetadata.from_dict(cached)
+
+        meta = read_jar_metadata(path, md5)
+        with self._lock:
+            entry = self._entries.get(str(path))
+            if entry is not None:
+                entry['metadata'] = asdict(meta)
+                self._dirty = True
+        return meta
+
+    def scan(self, mods_dir: Path) -> List[JarMetadata]:
+        """
+        Indexe tous les jars d'un dossier et oublie ceux qui ont disparu
+
+        Returns:
+            Métadonnées de chaque jar, triées par nom de fichier
+        """
+        mods_dir = Path(mods_dir)
+        try:
+            jars = sorted(p for p in mods_dir.iterdir() if p.is_file() and p.suffix.lower() == '.jar')
+        except OSError:
+            jars = []
+        result = [meta for meta in (self.get_metadata(jar) for jar in jars) if meta]
+
+        present = {str(jar) for jar in jars}
+        prefix = str(mods_dir) + os.sep
+        with self._lock:
+            stale = [k for k in self._entries if k.startswith(prefix) and k not in present]
+            for key in stale:
+                del self._entries[key]
+            if stale:
+                self._dirty = True
+        self.save()
+        return result
+
+    def find_by_mod_id(self, mods_dir: Path, mod_id: str) -> List[JarMetadata]:
+        """Jars du dossier qui déclarent ce modId"""
+        return [meta for meta in self.scan(mods_dir) if mod_id in meta.mod_ids]
+
+
+# Instance globale
+_index_instance: Optional[ModIndex] = None
+_index_lock = threading.Lock()
+
+
+def get_mod_index() -> ModIndex:
+    """
+    Retourne l'index des mods global (singleton)
+
+    Returns:
+        Instance de ModIndex
+    """
+    global _index_instance
+    with _index_lock:
+        if _index_instance is None:
+            _index_instance = ModIndex()
+        return _index_instance
+
+
+# Exemple d'utilisation
+if __name__ == "__main__":
+    import sys
+    folder = Path(sys.argv[1]) if len(sys.argv) > 1 else Path('.')
+    for meta in get_mod_index().scan(folder):
+        mods = ', '.join(f"{m.mod_id} {m.version}" for m in meta.mods) or '(pas de mods.toml)'
+        print(f"{meta.file_name}: {mods}")
+        for dep in meta.dependencies:
+            print(f"    -> {dep.mod_id} {dep.version_range} {'(requis)' if dep.mandatory else ''}")
@@ -0,0 +1,226 @@
+"""
+Vérification pré-lancement du modpack pour Illama Launcher
+Résout dépendances, plages de versions, modId dupliqués et incompatibilités
+Forge/Minecraft à partir de l'index des mods, avant de démarrer la JVM
+"""
+
+import re
+import time
+from pathlib import Path
+from typing import List, Dict
+from dataclasses import dataclass, field
+
+from mod_index import get_mod_index, JarMetadata
+
+# modId fournis par le loader lui-même
+BUILTIN_MOD_IDS = ('minecraft', 'forge', 'javafml', 'lowcodefml', 'mcp')
+
+
+# ============================================================
+# VERSIONS ET PLAGES (format Maven utilisé par Forge)
+# ============================================================
+
+def version_key(version: str) -> tuple:
+    """
+    Clé de comparaison d'une version ("1.20.1", "47.4.13", "1.0-beta.2"...)
+
+    Les nombres se comparent numériquement; un qualificatif (alpha, beta, rc...)
+    passe avant la version finale correspondante.
+    """
+    tokens = [t for t in re.split(r'[.\-_+]', version.strip().lower()) if t]
+    parts = []
+    for token in tokens:
+        # "1a" -> 1, "a"
+        for sub in re.findall(r'\d+|[a-z]+', token):
+            if sub.isdigit():
+                parts.append((2, int(sub), ''))
+                continue
+            # "1.0-beta" == "1-beta"
+            while parts and parts[-1] == (2, 0, ''):
+                parts.pop()
+            parts.append((0, 0, sub))
+    # "1.0" == "1.0.0"
+    while parts and parts[-1] == (2, 0, ''):
+        parts.pop()
+    parts.append((1, 0, ''))
+    return tuple(parts)
+
+
+@dataclass
+class VersionRange:
+    """Union d'intervalles Maven, ex: "[47,)", "[1.20.1]", "[1.0,2.0),[3.0,)" """
+    raw: str
+    intervals: list = field(default_factory=list)
+
+    @classmethod
+    def parse(cls, raw: str) -> 'VersionRange':
+        text = (raw or '').strip()
+        rng = cls(raw=text)
+        if not text or text == '*':
+            return rng
+        if text[0] not in '[(':
+            # Version nue: minimum recommandé en Maven, traité comme ">="
+            rng.intervals.append((version_key(text), True, None, False))
+            return rng
+        for match in re.finditer(r'([\[(])([^\[\]()]*)([\])])', text):
+            lower_inc = match.group(1) == '['
+            upper_inc = match.group(3) == ']'
+            bounds = match.group(2).split(',')
+            if len(bounds) == 1:
+                exact = version_key(bounds[0])
+                rng.intervals.append((exact, True, exact, True))
+                continue
+            low, high = bounds[0].strip(), bounds[1].strip()
+            rng.intervals.append((
+                version_key(low) if low else None, lower_inc,
+                version_key(high) if high else None, upper_inc
+            ))
+        return rng
+
+    def contains(self, version: str) -> bool:
+        if not self.intervals:
+            return True
+        key = version_key(version)
+        for low, low_inc, high, high_inc in self.intervals:
+            if low is not None and (key < low or (key == low and not low_inc)):
+                continue
+            if high is not None and (key > high or (key == high and not high_inc)):
+                continue
+            return True
+        return False
+
+
+# ============================================================
+# SOLVEUR
+# ============================================================
+
+@dataclass
+class PreflightReport:
+    """Résultat de la vérification pré-lancement"""
+    errors: List[str] = field(default_factory=list)
+    warnings: List[str] = field(default_factory=list)
+    mod_count: int = 0
+    jar_count: int = 0
+    duration_ms: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return not self.errors
+
+    def format(self, max_lines: int = 20) -> str:
+        """Rapport lisible (limité à max_lines lignes de problèmes)"""
+        lines = [f"{self.jar_count} jars, {self.mod_count} mods verifies en {self.duration_ms:.0f}ms"]
+        problems = [f"ERREUR: {e}" for e in self.errors] + [f"Attention: {w}" for w in self.warnings]
+        lines += problems[:max_lines]
+        if len(problems) > max_lines:
+            lines.append(f"... et {len(problems) - max_lines} autre(s)")
+        return "\n".join(lines)
+
+
+def check_modpack(
+    jars: List[JarMetadata],
+    minecraft_version: str,
+    forge_version: str,
+    side: str = 'CLIENT'
+) -> PreflightReport:
+    """
+    Vérifie un ensemble de jars déjà indexés
+
+    Args:
+        jars: Métadonnées des jars du dossier mods
+        minecraft_version: Version de Minecraft configurée
+        forge_version: Version de Forge configurée
+        side: Côté lancé (les dépendances SERVER sont ignorées côté CLIENT)
+
+    Returns:
+        PreflightReport
+    """
+    start = time.perf_counter()
+    report = PreflightReport(jar_count=len(jars))
+
+    # Table modId -> (version, jar)
+    provided: Dict[str, tuple] = {
+        'minecraft': (minecraft_version, 'Minecraft'),
+        'forge': (forge_version, 'Forge'),
+    }
+    forge_major = forge_version.split('.', 1)[0]
+    owners: Dict[str, List[str]] = {}
+
+    for jar in jars:
+        if jar.error:
+            report.errors.append(f"{jar.file_name}: jar illisible ou corrompu ({jar.error})")
+            continue
+        for mod in jar.mods:
+            owners.setdefault(mod.mod_id, []).append(jar.file_name)
+            provided.setdefault(mod.mod_id, (mod.version, jar.file_name))
+            report.mod_count += 1
+        if jar.mod_loader in ('javafml', 'lowcodefml') and jar.loader_version:
+            if not VersionRange.parse(jar.loader_version).contains(forge_major):
+                report.errors.append(
+                    f"{jar.file_name}: requiert le loader {jar.mod_loader} {jar.loader_version}, "
+                    f"Forge {forge_version} fournit {forge_major}")
+
+    # Jars embarqués (jar-in-jar): Forge charge la version la plus récente,
+    # un modId déjà fourni par un jar du dossier n'est donc pas un doublon
+    nested_unreadable = False
+    for jar in jars:
+        for mod in jar.nested_mods:
+            provided.setdefault(mod.mod_id, (mod.version, f"{jar.file_name} (embarque)"))
+        nested_unreadable = nested_unreadable or jar.nested_unreadable > 0
+
+    for mod_id, files in owners.items():
+        if len(files) > 1:
+            report.errors.append(f"modId '{mod_id}' present dans plusieurs jars: {', '.join(files)}")
+
+    for jar in jars:
+        for dep in jar.dependencies:
+            if side == 'CLIENT' and dep.side == 'SERVER':
+                continue
+            target = provided.get(dep.mod_id)
+            if target is None:
+                if dep.mandatory and dep.mod_id not in BUILTIN_MOD_IDS:
+                    message = f"{jar.file_name}: dependance manquante '{dep.mod_id}' {dep.version_range}".rstrip()
+                    if nested_unreadable:
+                        # Peut être fournie par un jar embarqué qu'on n'a pas pu lire
+                        report.warnings.append(f"{message} (jar embarque illisible)")
+                    else:
+                        report.errors.append(message)
+                continue
+            version, source = target
+            if not dep.version_range or not version or '${' in version:
+                continue
+            if not VersionRange.parse(dep.version_range).contains(version):
+                message = (f"{jar.file_name}: '{dep.mod_id}' {dep.version_range} requis, "
+                           f"{version} trouve ({source})")
+                if dep.mandatory:
+                    report.errors.append(message)
+                else:
+                    report.warnings.append(message)
+
+    report.duration_ms = (time.perf_counter() - start) * 1000
+    return report
+
+
+def run_preflight(mods_dir: Path, minecraft_version: str, forge_version: str) -> PreflightReport:
+    """
+    Indexe le dossier mods (cache par empreinte) puis vérifie le modpack
+
+    Returns:
+        PreflightReport (la durée inclut l'indexation)
+    """
+    start = time.perf_counter()
+    jars = get_mod_index().scan(mods_dir)
+    report = check_modpack(jars, minecraft_version, forge_version)
+    report.duration_ms = (time.perf_counter() - start) * 1000
+    status = "OK" if report.ok else f"{len(report.errors)} erreur(s)"
+    print(f"[Preflight] {status} - {report.jar_count} jars en {report.duration_ms:.0f}ms")
+    return report
+
+
+# Exemple d'utilisation
+if __name__ == "__main__":
+    import sys
+    folder = Path(sys.argv[1]) if len(sys.argv) > 1 else Path('.')
+    result = run_preflight(folder, '1.20.1', '47.4.13')
+    print(result.format(max_lines=100))
+    sys.exit(0 if result.ok else 1)
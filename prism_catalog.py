@@ -0,0 +1,255 @@
+"""
+Catalogue des instances Prism Launcher pour Illama Launcher
+Cache persistant par mtime: seules les instances modifiées sont relues,
+en parallèle, et le dossier de données Prism n'est résolu qu'une fois
+"""
+
+import os
+import sys
+import json
+import threading
+from pathlib import Path
+from typing import Optional, Callable, List, Dict
+
+from java_registry import DATA_DIR
+
+CATALOG_FILE = DATA_DIR / 'prism_instances.json'
+CATALOG_FORMAT = 1
+
+
+# ============================================================
+# DOSSIER DE DONNÉES PRISM
+# ============================================================
+
+_data_dir_cache: Optional[Path] = None
+_data_dir_lock = threading.Lock()
+
+
+def resolve_prism_data_dir(find_exe: Optional[Callable[[], Optional[str]]] = None) -> Path:
+    """
+    Trouve le dossier data de Prism Launcher (mémorisé pour le processus)
+
+    Args:
+        find_exe: Recherche de l'exécutable Prism, utilisée une seule fois pour
+                  détecter une installation portable
+
+    Returns:
+        Dossier de données Prism
+    """
+    global _data_dir_cache
+    with _data_dir_lock:
+        if _data_dir_cache is not None:
+            return _data_dir_cache
+
+        default = Path(os.environ.get('APPDATA', '')) / 'PrismLauncher'
+        if sys.platform == 'win32' and not default.exists():
+            if find_exe is None:
+                # Impossible de vérifier le mode portable: ne pas figer le résultat
+                return default
+            prism_exe = find_exe()
+            if prism_exe and (Path(prism_exe).parent / 'instances').exists():
+                _data_dir_cache = Path(prism_exe).parent
+                return _data_dir_cache
+
+        _data_dir_cache = default
+        return _data_dir_cache
+
+
+def invalidate_prism_data_dir():
+    """Oublie le dossier mémorisé (après installation/déplacement de Prism)"""
+    global _data_dir_cache
+    with _data_dir_lock:
+        _data_dir_cache = None
+
+
+# ============================================================
+# LECTURE D'UNE INSTANCE
+# ============================================================
+
+def read_instance(instance_dir: Path) -> Optional[dict]:
+    """
+    Lit instance.cfg (et mmc-pack.json si besoin) d'une instance
+
+    Returns:
+        {'name', 'display_name', 'path', 'mc_version', 'forge_version'} ou None
+    """
+    instance_cfg = instance_dir / "instance.cfg"
+    instance_name = None
+    mc_version = None
+    forge_version = None
+
+    try:
+        with open(instance_cfg, 'r', encoding='utf-8') as f:
+            for line in f:
+                if line.startswith('name='):
+                    instance_name = line.split('=', 1)[1].strip()
+                elif line.startswith('IntendedVersion='):
+                    mc_version = line.split('=', 1)[1].strip()
+                elif 'ForgeVersion=' in line or 'ComponentVersion_net.minecraftforge=' in line:
+                    forge_version = line.split('=', 1)[1].strip()
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        print(f"[Detection] Erreur lecture instance {instance_dir.name}: {e}")
+        return None
+
+    # Si pas de nom dans le config, utiliser le nom du dossier
+    if not instance_name:
+        instance_name = instance_dir.name
+
+    # Essayer de lire les versions depuis mmc-pack.json si pas trouvées dans instance.cfg
+    if not mc_version or not forge_version:
+        mmc_pack = instance_dir / 'mmc-pack.json'
+        if mmc_pack.exists():
+            try:
+                with open(mmc_pack, 'r', encoding='utf-8') as f:
+                    pack_data = json.load(f)
+                for component in pack_data.get('components', []):
+                    if component.get('uid') == 'net.minecraft' and not mc_version:
+                        mc_version = component.get('version')
+                    elif component.get('uid') == 'net.minecraftforge' and not forge_version:
+                        forge_version = component.get('version')
+            except Exception as e:
+                print(f"[Detection] Erreur lecture mmc-pack.json pour {instance_dir.name}: {e}")
+
+    return {
+        'name': instance_dir.name,  # Nom du dossier (utilisé par Prism)
+        'display_name': instance_name,  # Nom d'affichage depuis le config
+        'path': str(instance_dir),
+        'mc_version': mc_version,
+        'forge_version': forge_version
+    }
+
+
+def _signature(instance_dir: Path) -> Optional[list]:
+    """Signature de validité d'une instance: mtimes/tailles d'instance.cfg et mmc-pack.json"""
+    try:
+        cfg = os.stat(instance_dir / 'instance.cfg')
+    except OSError:
+        return None
+    try:
+        pack = os.stat(instance_dir / 'mmc-pack.json')
+        pack_sig = [pack.st_mtime_ns, pack.st_size]
+    except OSError:
+        pack_sig = [0, 0]
+    return [cfg.st_mtime_ns, cfg.st_size] + pack_sig
+
+
+# ============================================================
+# CATALOGUE
+# ============================================================
+
+class PrismInstanceCatalog:
+    """
+    Catalogue incrémental des instances Prism
+
+    La liste des dossiers n'est relue que si le mtime du dossier instances change;
+    chaque instance n'est reparsée que si sa signature change.
+    """
+
+    def __init__(self, catalog_file: Path = CATALOG_FILE, max_workers: int = 8):
+        self.catalog_file = catalog_file
+        self.max_workers = max_workers
+        self._lock = threading.Lock()
+        self._state: Optional[dict] = None
+
+    def _load(self, instances_dir: Path) -> dict:
+        if self._state is not None and self._state.get('instances_dir') == str(instances_dir):
+            return self._state
+        state = {'instances_dir': str(instances_dir), 'dir_mtime_ns': None, 'names': [], 'entries': {}}
+        try:
+            with open(self.catalog_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('format') == CATALOG_FORMAT and data.get('instances_dir') == str(instances_dir):
+                state.update({k: data[k] for k in ('dir_mtime_ns', 'names', 'entries') if k in data})
+        except (OSError, ValueError):
+            pass
+        self._state = state
+        return state
+
+    def _save(self, state: dict):
+        try:
+            self.catalog_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = self.catalog_file.with_suffix('.tmp')
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump({'format': CATALOG_FORMAT, **state}, f)
+            os.replace(tmp_file, self.catalog_file)
+        except OSError as e:
+            print(f"[Detection] Impossible d'enregistrer le catalogue: {e}")
+
+    def list_instances(self, instances_dir: Path) -> List[dict]:
+        """
+        Liste les instances Prism, triées par nom d'affichage
+
+        Args:
+            instances_dir: Dossier instances de Prism
+
+        Returns:
+            Liste de dicts {'name', 'display_name', 'path', 'mc_version', 'forge_version'}
+        """
+        try:
+            dir_mtime_ns = os.stat(instances_dir).st_mtime_ns
+        except OSError:
+            return []
+
+        with self._lock:
+            state = self._load(instances_dir)
+            changed = False
+
+            if state['dir_mtime_ns'] != dir_mtime_ns:
+                try:
+                    state['names'] = sorted(e.name for e in os.scandir(instances_dir) if e.is_dir())
+                except OSError:
+                    return []
+                state['dir_mtime_ns'] = dir_mtime_ns
+                changed = True
+
+            entries: Dict[str, dict] = state['entries']
+            signatures = {name: _signature(instances_dir / name) for name in state['names']}
+            to_parse = [name for name, sig in signatures.items()
+                        if sig is not None and (name not in entries or entries[name]['sig'] != sig)]
+
+            if to_parse:
+                workers = max(1, min(self.max_workers, len(to_parse)))
+                from concurrent.futures import ThreadPoolExecutor
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    parsed = executor.map(lambda n: read_instance(instances_dir / n), to_parse)
+                    for name, info in zip(to_parse, parsed):
+                        entries[name] = {'sig': signatures[name], 'info': info}
+                changed = True
+
+            for name in [n for n in entries if signatures.get(n) is None]:
+                del entries[name]
+                changed = True
+
+            if changed:
+                self._save(state)
+            instances = [entries[name]['info'] for name in state['names']
+                         if name in entries and entries[name]['info']]
+
+        instances.sort(key=lambda x: x['display_name'] or x['name'])
+        return instances
+
+
+# Instance globale
+_catalog_instance: Optional[PrismInstanceCatalog] = None
+
+
+def get_prism_catalog() -> PrismInstanceCatalog:
+    """
+    Retourne le catalogue global (singleton)
+
+    Returns:
+        Instance de PrismInstanceCatalog
+    """
+    global _catalog_instance
+    if _catalog_instance is None:
+        _catalog_instance = PrismInstanceCatalog()
+    return _catalog_instance
+
+
+# Exemple d'utilisation
+if __name__ == "__main__":
+    folder = Path(sys.argv[1]) if len(sys.argv) > 1 else resolve_prism_data_dir() / 'instances'
+    for inst in get_prism_catalog().list_instances(folder):
+        print(f"{inst['display_name']} (MC {inst['mc_version'] or '?'}, Forge {inst['forge_version'] or '?'})")
@@ -0,0 +1,174 @@
+"""
+Trace de démarrage d'Illama Launcher (format chrome://tracing)
+Activée par la variable d'environnement ILLAMA_STARTUP_TRACE; sans elle,
+toutes les fonctions sont des no-op et @traced ne modifie pas les méthodes
+"""
+
+import os
+import sys
+import json
+import time
+import threading
+from pathlib import Path
+from contextlib import contextmanager, nullcontext
+from typing import Optional, List
+
+TRACE_ENV_VAR = 'ILLAMA_STARTUP_TRACE'
+
+# Durée d'enregistrement après le premier idle (checks de démarrage, tray...)
+TRACE_TAIL_MS = 3000
+
+_NULL_SPAN = nullcontext()
+
+
+def _trace_output_path(value: str) -> Path:
+    """"1"/"true" -> dossier de données, sinon chemin (fichier .json ou dossier) donné"""
+    if value.lower() in ('1', 'true', 'yes', 'on'):
+        from java_registry import DATA_DIR
+        folder = DATA_DIR / 'traces'
+    elif value.lower().endswith('.json'):
+        return Path(value)
+    else:
+        folder = Path(value)
+    return folder / f"startup_{time.strftime('%Y%m%d_%H%M%S')}.json"
+
+
+class StartupTrace:
+    """
+    Enregistre des phases (begin/end ou span) en temps monotone
+    et les écrit au format Trace Event de Chrome
+    """
+
+    def __init__(self, output: Optional[str] = None):
+        self.enabled = bool(output)
+        self.output = output
+        self.origin = time.perf_counter()
+        self.events: List[dict] = []
+        self._open = {}
+        self._lock = threading.Lock()
+        self._dumped = False
+
+    def _now_us(self) -> float:
+        return (time.perf_counter() - self.origin) * 1_000_000
+
+    def _add(self, event: dict):
+        event.setdefault('pid', os.getpid())
+        event.setdefault('tid', threading.get_ident())
+        event.setdefault('cat', 'startup')
+        with self._lock:
+            self.events.append(event)
+
+    def begin(self, name: str):
+        """Début d'une phase terminée par end(name)"""
+        if self.enabled:
+            self._open[name] = self._now_us()
+
+    def end(self, name: str):
+        """Fin d'une phase ouverte par begin(name)"""
+        if not self.enabled or name not in self._open:
+            return
+        start = self._open.pop(name)
+        self._add({'name': name, 'ph': 'X', 'ts': start, 'dur': self._now_us() - start})
+
+    def span(self, name: str):
+        """Context manager: with trace.span('phase'): ..."""
+        if not self.enabled:
+            return _NULL_SPAN
+        return self._span(name)
+
+    @contextmanager
+    def _span(self, name: str):
+        start = self._now_us()
+        try:
+            yield
+        finally:
+            self._add({'name': name, 'ph': 'X', 'ts': start, 'dur': self._now_us() - start})
+
+    def instant(self, name: str):
+        """Événement ponctuel (ex: premier idle)"""
+        if self.enabled:
+            self._add({'name': name, 'ph': 'i', 's': 'p', 'ts': self._now_us()})
+
+    def mark_first_idle(self, root):
+        """
+        Programme le marqueur "first_idle" sur la boucle Tk, puis l'écriture de la trace
+
+        Args:
+            root: Fenêtre Tk principale
+        """
+        if not self.enabled:
+            return
+
+        def on_idle():
+            self.instant('first_idle')
+            root.after(TRACE_TAIL_MS, self.dump)
+
+        # after(0) puis after_idle: passe après les redessins déjà en attente
+        root.after(0, lambda: root.after_idle(on_idle))
+
+    def dump(self) -> Optional[Path]:
+        """Écrit la trace (une seule fois); retourne le chemin du fichier"""
+        if not self.enabled or self._dumped:
+            return None
+        self._dumped = True
+        path = _trace_output_path(self.output)
+        with self._lock:
+            payload = {
+                'traceEvents': [
+                    {'name': 'process_name', 'ph': 'M', 'pid': os.getpid(),
+                     'args': {'name': 'Illama Launcher'}}
+                ] + sorted(self.events, key=lambda e: e['ts']),
+                'displayTimeUnit': 'ms',
+                'otherData': {'python': sys.version.split()[0], 'frozen': bool(getattr(sys, 'frozen', False))},
+            }
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(payload, f)
+            print(f"[Trace] Trace de démarrage écrite: {path}")
+        except OSError as e:
+            print(f"[Trace] Impossible d'écrire la trace: {e}")
+            return None
+        return path
+
+
+# Instance globale, créée à l'import: son origine sert de t=0 pour toute la trace
+_trace_instance = StartupTrace(os.environ.get(TRACE_ENV_VAR, ''))
+
+
+def get_startup_trace() -> StartupTrace:
+    """
+    Retourne la trace de démarrage globale (singleton)
+
+    Returns:
+        Instance de StartupTrace
+    """
+    return _trace_instance
+
+
+def traced(name: Optional[str] = None):
+    """
+    Décorateur: trace chaque appel de la fonction comme une phase
+    Sans ILLAMA_STARTUP_TRACE, retourne la fonction telle quelle (coût nul)
+    """
+    def decorator(func):
+        if not _trace_instance.enabled:
+            return func
+        import functools
+        phase = name or func.__name__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with _trace_instance.span(phase):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+# Exemple d'utilisation
+if __name__ == "__main__":
+    trace = StartupTrace('startup_example.json')
+    with trace.span('exemple'):
+        time.sleep(0.05)
+    trace.instant('fin')
+    print(trace.dump())
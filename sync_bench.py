@@ -0,0 +1,517 @@
+"""
+Banc de test hors ligne des synchronisations d'Illama Launcher
+Un serveur HTTP local imite l'API Drive (files.list) et les URLs de
+téléchargement (uc?export=download); GoogleDriveSync.sync() et DownloadManager
+tournent contre lui sur des modpacks synthétiques (50/300/1000 jars)
+
+Chaque scénario s'exécute dans un processus neuf (HOME temporaire: ni la
+config, ni les index, ni l'historique de l'utilisateur ne sont touchés) qui
+mesure son temps réel, son temps CPU et son pic de mémoire (RSS)
+
+Usage:
+    python sync_bench.py                                   # 50/300/1000 jars, sans perturbation
+    python sync_bench.py --jars 300 --latency-ms 40 --bandwidth-kb-s 2048
+    python sync_bench.py --rate-429 0.05 --html-rate 0.02 --truncate-rate 0.02 --json
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import hashlib
+import zipfile
+import argparse
+import tempfile
+import threading
+import subprocess
+from io import BytesIO
+from pathlib import Path
+from typing import Optional, List, Dict
+from dataclasses import dataclass, asdict, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+HERE = Path(__file__).resolve().parent
+
+DEFAULT_PACK_SIZES = (50, 300, 1000)
+SCENARIOS = ('sync_cold', 'sync_noop', 'download_manager')
+
+# Taille des écritures du serveur (granularité de la limitation de bande passante)
+SERVE_CHUNK_SIZE = 16 * 1024
+
+FOLDER_ID = 'bench-folder'
+
+
+@dataclass
+class FaultProfile:
+    """Conditions réseau simulées (taux entre 0 et 1, tirés à chaque téléchargement)"""
+    latency_ms: float = 0.0       # Avant chaque réponse
+    bandwidth_kb_s: float = 0.0   # Par connexion, 0 = illimité
+    rate_429: float = 0.0         # Too Many Requests
+    html_rate: float = 0.0        # Page HTML intermédiaire ("fichier trop gros pour l'analyse antivirus")
+    truncate_rate: float = 0.0    # Corps coupé à la moitié (Content-Length complet annoncé)
+    seed: int = 42
+
+
+# ============================================================
+# MODPACK SYNTHÉTIQUE
+# ============================================================
+
+@dataclass
+class SyntheticJar:
+    file_id: str
+    name: str
+    data: bytes
+    md5: str
+
+
+def build_pack(jars: int, min_kb: int = 8, max_kb: int = 192, seed: int = 0) -> List[SyntheticJar]:
+    """
+    Génère des jars valides (zip avec MANIFEST.MF) de tailles déterministes
+
+    Args:
+        jars: Nombre de fichiers
+        min_kb: Taille minimale d'un jar
+        max_kb: Taille maximale d'un jar
+        seed: Graine (même graine = même modpack)
+
+    Returns:
+        Liste de SyntheticJar
+    """
+    rng = random.Random(seed)
+    pack = []
+    for index in range(jars):
+        # Distribution asymétrique: beaucoup de petits mods, quelques gros
+        size = int((min_kb + (max_kb - min_kb) * rng.random() ** 3) * 1024)
+        buffer = BytesIO()
+        with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_STORED) as jar:
+            jar.writestr('META-INF/MANIFEST.MF', f"Manifest-Version: 1.0\nImplementation-Title: benchmod{index}\n")
+            jar.writestr('data.bin', rng.getrandbits(size * 8).to_bytes(size, 'little'))
+        data = buffer.getvalue()
+        pack.append(SyntheticJar(
+            file_id=f"1bench{index:06d}{'x' * 20}",
+            name=f"benchmod-{index:04d}-1.0.jar",
+            data=data,
+            md5=hashlib.md5(data).hexdigest()
+        ))
+    return pack
+
+
+# ============================================================
+# SERVEUR DRIVE LOCAL
+# ============================================================
+
+class _DriveHandler(BaseHTTPRequestHandler):
+    """
+    Routes: /drive/v3/files (listing JSON), /uc et /download (contenu des jars),
+    /seed (contenu sans perturbation, pour préparer un dossier mods)
+    """
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        emulator = self.server.emulator
+        parsed = urlparse(self.path)
+        query = parse_qs(parsed.query)
+        if parsed.path == '/seed':
+            emulator.count('seed_requests')
+            jar = emulator.files.get(query.get('id', [''])[0])
+            if jar is None:
+                self._send_body(404, 'text/plain', b'not found')
+            else:
+                self._send_body(200, 'application/java-archive', jar.data)
+            return
+
+        if emulator.faults.latency_ms:
+            time.sleep(emulator.faults.latency_ms / 1000)
+
+        if parsed.path == '/drive/v3/files':
+            emulator.count('list_requests')
+            self._send_body(200, 'application/json; charset=UTF-8', emulator.listing)
+        elif parsed.path in ('/uc', '/download'):
+            emulator.count('download_requests')
+            jar = emulator.files.get(query.get('id', [''])[0])
+            if jar is None:
+                emulator.count('not_found')
+                self._send_body(404, 'text/plain', b'not found')
+                return
+            self._serve_jar(emulator, jar)
+        else:
+            emulator.count('not_found')
+            self._send_body(404, 'text/plain', b'not found')
+
+    def _send_body(self, status: int, content_type: str, body: bytes):
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _serve_jar(self, emulator: 'DriveEmulator', jar: SyntheticJar):
+        fault = emulator.draw_fault()
+        if fault == '429':
+            emulator.count('responses_429')
+            self.send_response(429)
+            self.send_header('Retry-After', '1')
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+        if fault == 'html':
+            emulator.count('responses_html')
+            self._send_body(200, 'text/html; charset=utf-8',
+                            b'<html><body>Google Drive can\'t scan this file for viruses.</body></html>')
+            return
+
+        # Reprise (DownloadManager envoie Range: bytes=N-)
+        data, status = jar.data, 200
+        range_header = self.headers.get('Range', '')
+        if range_header.startswith('bytes=') and range_header.endswith('-'):
+            start = int(range_header[6:-1] or 0)
+            if 0 < start < len(jar.data):
+                data, status = jar.data[start:], 206
+
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/java-archive')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+
+        if fault == 'truncated':
+            emulator.count('responses_truncated')
+            data = data[:len(data) // 2]
+        else:
+            emulator.count('responses_ok')
+
+        bandwidth = emulator.faults.bandwidth_kb_s * 1024
+        try:
+            for offset in range(0, len(data), SERVE_CHUNK_SIZE):
+                chunk = data[offset:offset + SERVE_CHUNK_SIZE]
+                self.wfile.write(chunk)
+                emulator.count('bytes_sent', len(chunk))
+                if bandwidth:
+                    time.sleep(len(chunk) / bandwidth)
+        except (BrokenPipeError, ConnectionResetError):
+            emulator.count('client_aborts')
+        if fault == 'truncated':
+            self.close_connection = True
+
+
+class DriveEmulator:
+    """Serveur HTTP local (127.0.0.1, port libre) qui sert un modpack synthétique"""
+
+    def __init__(self, pack: List[SyntheticJar], faults: Optional[FaultProfile] = None):
+        self.faults = faults or FaultProfile()
+        self.files = {jar.file_id: jar for jar in pack}
+        self.listing = json.dumps({'files': [
+            {'id': jar.file_id, 'name': jar.name, 'size': str(len(jar.data)), 'md5Checksum': jar.md5}
+            for jar in pack
+        ]}).encode('utf-8')
+        self._lock = threading.Lock()
+        self._rng = random.Random(self.faults.seed)
+        self.counters: Dict[str, int] = {}
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), _DriveHandler)
+        self._server.daemon_threads = True
+        self._server.emulator = self
+        self._thread = threading.Thread(target=self._server.serve_forever, name='DriveEmulator', daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def urls(self) -> dict:
+        """Points d'accès à injecter dans GoogleDriveSync"""
+        return {
+            'API_FILES_URL': f"{self.base_url}/drive/v3/files",
+            'FOLDER_URL': f"{self.base_url}/drive/folders/{{folder_id}}",
+            'DOWNLOAD_URLS': [
+                f"{self.base_url}/download?id={{file_id}}&export=download&confirm=t&uuid=",
+                f"{self.base_url}/uc?export=download&id={{file_id}}&confirm=t",
+                f"{self.base_url}/uc?export=download&id={{file_id}}",
+            ],
+        }
+
+    def count(self, key: str, amount: int = 1):
+        with self._lock:
+            self.counters[key] = self.counters.get(key, 0) + amount
+
+    def draw_fault(self) -> str:
+        """Tire la réponse d'un téléchargement: ok, 429, html ou truncated"""
+        with self._lock:
+            roll = self._rng.random()
+        for fault, rate in (('429', self.faults.rate_429), ('html', self.faults.html_rate),
+                            ('truncated', self.faults.truncate_rate)):
+            if roll < rate:
+                return fault
+            roll -= rate
+        return 'ok'
+
+    def reset_counters(self) -> Dict[str, int]:
+        """Retourne les compteurs depuis le dernier appel et les remet à zéro"""
+        with self._lock:
+            counters, self.counters = self.counters, {}
+        return counters
+
+    def start(self) -> 'DriveEmulator':
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+
+# ============================================================
+# SCÉNARIOS (exécutés dans le processus enfant)
+# ============================================================
+
+def _peak_rss_mb() -> Optional[float]:
+    """Pic de mémoire résidente du processus courant"""
+    if sys.platform == 'win32':
+        import ctypes
+        from ctypes import wintypes
+
+        class PROCESS_MEMORY_COUNTERS(ctypes.Structure):
+            _fields_ = [
+                ('cb', wintypes.DWORD),
+                ('PageFaultCount', wintypes.DWORD),
+                ('PeakWorkingSetSize', ctypes.c_size_t),
+                ('WorkingSetSize', ctypes.c_size_t),
+                ('QuotaPeakPagedPoolUsage', ctypes.c_size_t),
+                ('QuotaPagedPoolUsage', ctypes.c_size_t),
+                ('QuotaPeakNonPagedPoolUsage', ctypes.c_size_t),
+                ('QuotaNonPagedPoolUsage', ctypes.c_size_t),
+                ('PagefileUsage', ctypes.c_size_t),
+                ('PeakPagefileUsage', ctypes.c_size_t),
+            ]
+
+        counters = PROCESS_MEMORY_COUNTERS()
+        counters.cb = ctypes.sizeof(counters)
+        handle = ctypes.windll.kernel32.GetCurrentProcess()
+        if not ctypes.windll.psapi.GetProcessMemoryInfo(handle, ctypes.byref(counters), counters.cb):
+            return None
+        return round(counters.PeakWorkingSetSize / 1024 / 1024, 1)
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux: Ko, macOS: octets
+    return round(peak / 1024 / 1024 if sys.platform == 'darwin' else peak / 1024, 1)
+
+
+def _seed_mods_dir(mods_dir: Path, listing: List[dict], base_url: str):
+    """Pré-remplit le dossier mods avec les fichiers du serveur (scénario sans téléchargement)"""
+    import urllib.request
+    for entry in listing:
+        with urllib.request.urlopen(f"{base_url}/seed?id={entry['id']}", timeout=30) as response:
+            (mods_dir / entry['name']).write_bytes(response.read())
+
+
+def run_scenario(spec: dict) -> dict:
+    """
+    Exécute un scénario et mesure temps réel, temps CPU et pic RSS
+
+    Args:
+        spec: {'scenario', 'urls', 'base_url', 'listing', 'workers', 'work_dir'}
+
+    Returns:
+        Résultat (durées en secondes)
+    """
+    sys.path.insert(0, str(HERE))
+    import launcher
+
+    mods_dir = Path(spec['work_dir']) / 'mods'
+    mods_dir.mkdir(parents=True, exist_ok=True)
+    workers = spec['workers']
+    result = {'peak_rss_before_mb': _peak_rss_mb()}
+
+    if spec['scenario'] in ('sync_cold', 'sync_noop'):
+        sync = launcher.GoogleDriveSync(FOLDER_ID, mods_dir, api_key='bench')
+        for name, value in spec['urls'].items():
+            setattr(sync, name, tuple(value) if isinstance(value, list) else value)
+        config = {'download_workers': workers, 'download_retries': 3, 'download_timeout': 30}
+        if spec['scenario'] == 'sync_noop':
+            # Fichiers déjà à jour: listing + empreintes seulement (index des mods froid puis chaud)
+            _seed_mods_dir(mods_dir, spec['listing'], spec['base_url'])
+            first_start = time.perf_counter()
+            sync.sync(config=config)
+            result['first_pass_s'] = round(time.perf_counter() - first_start, 3)
+
+        wall_start, cpu_start = time.perf_counter(), time.process_time()
+        stats = sync.sync(config=config)
+        result.update({
+            'wall_s': round(time.perf_counter() - wall_start, 3),
+            'cpu_s': round(time.process_time() - cpu_start, 3),
+            'files_ok': len(stats['added']) + len(stats['updated']) + len(stats['unchanged']),
+            'files_failed': len(stats['errors']),
+        })
+    elif spec['scenario'] == 'download_manager':
+        from concurrent.futures import ThreadPoolExecutor
+        from download_manager import DownloadManager, RetryPolicy
+
+        manager = DownloadManager(RetryPolicy(max_retries=3, initial_delay=0.05), timeout=30)
+        listing = spec['listing']
+
+        def fetch(entry):
+            return manager.download_file(
+                f"{spec['base_url']}/uc?export=download&id={entry['id']}",
+                mods_dir / entry['name'],
+                expected_hash=entry['md5Checksum'],
+                hash_algorithm='md5'
+            )
+
+        wall_start, cpu_start = time.perf_counter(), time.process_time()
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(fetch, listing))
+        result.update({
+            'wall_s': round(time.perf_counter() - wall_start, 3),
+            'cpu_s': round(time.process_time() - cpu_start, 3),
+            'files_ok': sum(1 for r in results if r.success),
+            'files_failed': sum(1 for r in results if not r.success),
+        })
+    else:
+        raise ValueError(f"Scénario inconnu: {spec['scenario']}")
+
+    result['peak_rss_mb'] = _peak_rss_mb()
+    return result
+
+
+# ============================================================
+# ORCHESTRATION (processus parent)
+# ============================================================
+
+@dataclass
+class BenchResult:
+    scenario: str
+    jars: int
+    workers: int
+    pack_mb: float
+    wall_s: float = 0.0
+    cpu_s: float = 0.0
+    peak_rss_mb: Optional[float] = None
+    peak_rss_before_mb: Optional[float] = None
+    first_pass_s: Optional[float] = None
+    files_ok: int = 0
+    files_failed: int = 0
+    requests: Dict[str, int] = field(default_factory=dict)
+    error: Optional[str] = None
+
+
+def run_bench(pack_sizes=DEFAULT_PACK_SIZES, scenarios=SCENARIOS, faults: Optional[FaultProfile] = None,
+              workers: int = 5, max_kb: int = 192) -> List[BenchResult]:
+    """
+    Lance tous les scénarios sur chaque taille de modpack
+
+    Args:
+        pack_sizes: Nombres de jars
+        scenarios: Scénarios à exécuter (voir SCENARIOS)
+        faults: Conditions réseau simulées
+        workers: Téléchargements simultanés
+        max_kb: Taille maximale d'un jar synthétique
+
+    Returns:
+        Liste de BenchResult
+    """
+    faults = faults or FaultProfile()
+    results = []
+    for jars in pack_sizes:
+        pack = build_pack(jars, max_kb=max_kb)
+        pack_mb = round(sum(len(jar.data) for jar in pack) / 1024 / 1024, 1)
+        emulator = DriveEmulator(pack, faults).start()
+        try:
+            for scenario in scenarios:
+                print(f"[Bench] {scenario} - {jars} jars ({pack_mb} MB)...", file=sys.stderr)
+                results.append(_run_child(scenario, jars, pack_mb, workers, emulator))
+        finally:
+            emulator.stop()
+    return results
+
+
+def _run_child(scenario: str, jars: int, pack_mb: float, workers: int, emulator: DriveEmulator) -> BenchResult:
+    result = BenchResult(scenario=scenario, jars=jars, workers=workers, pack_mb=pack_mb)
+    with tempfile.TemporaryDirectory(prefix='illama_bench_') as work_dir:
+        spec_file = Path(work_dir) / 'spec.json'
+        result_file = Path(work_dir) / 'result.json'
+        spec_file.write_text(json.dumps({
+            'scenario': scenario,
+            'workers': workers,
+            'work_dir': work_dir,
+            'base_url': emulator.base_url,
+            'urls': emulator.urls(),
+            'listing': json.loads(emulator.listing)['files'],
+        }), encoding='utf-8')
+
+        # HOME isolé: config, index des mods, logs et historique de sync restent dans work_dir
+        env = dict(os.environ, HOME=work_dir, USERPROFILE=work_dir)
+        emulator.reset_counters()
+        child = subprocess.run(
+            [sys.executable, str(Path(__file__).resolve()), '--child', str(spec_file), str(result_file)],
+            cwd=str(HERE), env=env, capture_output=True, text=True, encoding='utf-8', errors='replace'
+        )
+        result.requests = emulator.reset_counters()
+        if child.returncode != 0 or not result_file.exists():
+            result.error = (child.stderr or child.stdout).strip().splitlines()[-1:] or [f"code {child.returncode}"]
+            result.error = result.error[0]
+            return result
+        for key, value in json.loads(result_file.read_text(encoding='utf-8')).items():
+            setattr(result, key, value)
+    return result
+
+
+def format_results(results: List[BenchResult]) -> str:
+    """Tableau lisible des résultats"""
+    lines = [f"{'Scenario':<18}{'Jars':>6}{'MB':>8}{'Reel':>9}{'CPU':>8}{'RSS':>9}"
+             f"{'Requetes':>10}{'429':>6}{'HTML':>6}{'Coupes':>8}{'OK':>7}{'Echecs':>8}"]
+    for r in results:
+        if r.error:
+            lines.append(f"{r.scenario:<18}{r.jars:>6}{r.pack_mb:>8.1f}  ERREUR: {r.error}")
+            continue
+        requests = r.requests.get('list_requests', 0) + r.requests.get('download_requests', 0)
+        rss = f"{r.peak_rss_mb:.0f} MB" if r.peak_rss_mb is not None else "-"
+        lines.append(
+            f"{r.scenario:<18}{r.jars:>6}{r.pack_mb:>8.1f}{r.wall_s:>8.2f}s{r.cpu_s:>7.2f}s{rss:>9}"
+            f"{requests:>10}{r.requests.get('responses_429', 0):>6}{r.requests.get('responses_html', 0):>6}"
+            f"{r.requests.get('responses_truncated', 0):>8}{r.files_ok:>7}{r.files_failed:>8}"
+        )
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) == 4 and sys.argv[1] == '--child':
+        child_spec = json.loads(Path(sys.argv[2]).read_text(encoding='utf-8'))
+        child_result = run_scenario(child_spec)
+        Path(sys.argv[3]).write_text(json.dumps(child_result), encoding='utf-8')
+        sys.exit(0)
+
+    parser = argparse.ArgumentParser(description="Banc de test hors ligne des synchronisations")
+    parser.add_argument('--jars', default=','.join(str(n) for n in DEFAULT_PACK_SIZES),
+                        help="tailles de modpack, séparées par des virgules")
+    parser.add_argument('--scenarios', default=','.join(SCENARIOS))
+    parser.add_argument('--workers', type=int, default=5)
+    parser.add_argument('--max-kb', type=int, default=192, help="taille max d'un jar synthétique")
+    parser.add_argument('--latency-ms', type=float, default=0.0)
+    parser.add_argument('--bandwidth-kb-s', type=float, default=0.0, help="par connexion, 0 = illimité")
+    parser.add_argument('--rate-429', type=float, default=0.0)
+    parser.add_argument('--html-rate', type=float, default=0.0)
+    parser.add_argument('--truncate-rate', type=float, default=0.0)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--json', action='store_true', help="sortie JSON (comparaison entre versions)")
+    args = parser.parse_args()
+
+    fault_profile = FaultProfile(
+        latency_ms=args.latency_ms, bandwidth_kb_s=args.bandwidth_kb_s, rate_429=args.rate_429,
+        html_rate=args.html_rate, truncate_rate=args.truncate_rate, seed=args.seed
+    )
+    bench_results = run_bench(
+        pack_sizes=[int(n) for n in args.jars.split(',') if n],
+        scenarios=[s for s in args.scenarios.split(',') if s],
+        faults=fault_profile,
+        workers=args.workers,
+        max_kb=args.max_kb
+    )
+    if args.json:
+        print(json.dumps({'faults': asdict(fault_profile), 'results': [asdict(r) for r in bench_results]}, indent=2))
+    else:
+        print(format_results(bench_results))
@@ -0,0 +1,255 @@
+"""
+Rapport de performance des synchronisations d'Illama Launcher
+Chaque sync produit un rapport (listing, scan des empreintes, débit, retries...)
+conservé dans un historique glissant pour repérer les régressions entre versions
+"""
+
+import os
+import json
+import threading
+from pathlib import Path
+from statistics import median
+from typing import Optional, List, Dict
+from datetime import datetime
+from dataclasses import dataclass, asdict, fields
+
+from java_registry import DATA_DIR
+
+HISTORY_FILE = DATA_DIR / 'sync_history.json'
+HISTORY_FORMAT = 1
+
+# Nombre de rapports conservés
+HISTORY_SIZE = 50
+
+
+@dataclass
+class SyncReport:
+    """Mesures d'une synchronisation (durées en ms, débits en MB/s)"""
+    started_at: str
+    launcher_version: str
+    wall_ms: float = 0.0
+    listing_ms: float = 0.0
+    listing_method: str = ""
+    remote_files: int = 0
+    local_files: int = 0
+    hash_scan_ms: float = 0.0
+    hashed_files: int = 0
+    hash_workers: int = 0
+    cache_hits: int = 0
+    cache_hit_rate: Optional[float] = None
+    concurrency: int = 0
+    downloads: int = 0
+    bytes_total: int = 0
+    avg_bytes_per_file: float = 0.0
+    avg_throughput_mbps: float = 0.0
+    min_throughput_mbps: float = 0.0
+    retries: int = 0
+    # Page HTML Drive: passage normal à l'URL suivante, pas un échec
+    html_fallbacks: int = 0
+    http_429: int = 0
+    added: int = 0
+    updated: int = 0
+    removed: int = 0
+    unchanged: int = 0
+    errors: int = 0
+    force_replace: bool = False
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'SyncReport':
+        known = {f.name for f in fields(cls)}
+        return cls(**{key: value for key, value in data.items() if key in known})
+
+
+# ============================================================
+# COLLECTE PENDANT LA SYNC
+# ============================================================
+
+class SyncRecorder:
+    """
+    Construit un SyncReport à partir des événements émis pendant la sync
+    (mêmes noms et champs que le journal d'événements JSON)
+
+    Appelé depuis les threads de téléchargement: record() est protégé par un verrou
+    """
+
+    def __init__(self, launcher_version: str):
+        self.report = SyncReport(
+            started_at=datetime.now().isoformat(timespec='seconds'),
+            launcher_version=launcher_version
+        )
+        self._lock = threading.Lock()
+        self._throughputs: List[float] = []
+
+    def record(self, operation: str, outcome: str, event: dict):
+        """
+        Intègre un événement
+
+        Args:
+            operation: drive.list, sync.list, sync.plan, sync.download ou sync
+            outcome: ok, retry, error...
+            event: Champs de l'événement (bytes, duration_ms, status...)
+        """
+        report = self.report
+        with self._lock:
+            if operation == 'drive.list':
+                # Le fallback scraping s'ajoute au temps de l'API en échec
+                report.listing_ms += event.get('duration_ms', 0.0)
+                if outcome == 'ok':
+                    report.listing_method = event.get('method', '')
+            elif operation == 'sync.list':
+                report.remote_files = event.get('remote', 0)
+                report.local_files = event.get('local', 0)
+            elif operation == 'sync.plan':
+                report.hash_scan_ms = event.get('duration_ms', 0.0)
+                report.hashed_files = event.get('hashed', 0)
+                report.hash_workers = event.get('hash_workers', 0)
+                report.cache_hits = event.get('cache_hits', 0)
+                report.force_replace = bool(event.get('force_replace'))
+            elif operation == 'sync.download':
+                if outcome == 'ok':
+                    size = event.get('bytes', 0)
+                    report.downloads += 1
+                    report.bytes_total += size
+                    duration_s = event.get('duration_ms', 0.0) / 1000
+                    if duration_s > 0:
+                        self._throughputs.append(size / 1024 / 1024 / duration_s)
+                elif outcome == 'html':
+                    report.html_fallbacks += 1
+                elif outcome in ('retry', 'invalid'):
+                    report.retries += 1
+                    if event.get('status') == 429:
+                        report.http_429 += 1
+            elif operation == 'sync':
+                report.wall_ms = event.get('duration_ms', 0.0)
+                report.concurrency = event.get('workers', 0)
+                for key in ('added', 'updated', 'removed', 'unchanged', 'errors'):
+                    setattr(report, key, event.get(key, 0))
+
+    def build(self) -> SyncReport:
+        """Calcule les moyennes et retourne le rapport"""
+        report = self.report
+        with self._lock:
+            if report.hashed_files:
+                report.cache_hit_rate = round(report.cache_hits / report.hashed_files, 3)
+            if report.downloads:
+                report.avg_bytes_per_file = round(report.bytes_total / report.downloads, 1)
+            if self._throughputs:
+                report.avg_throughput_mbps = round(sum(self._throughputs) / len(self._throughputs), 2)
+                report.min_throughput_mbps = round(min(self._throughputs), 2)
+        return report
+
+
+# ============================================================
+# HISTORIQUE
+# ============================================================
+
+class SyncHistory:
+    """Historique glissant des rapports (les plus récents en dernier)"""
+
+    def __init__(self, history_file: Path = HISTORY_FILE, max_entries: int = HISTORY_SIZE):
+        self.history_file = history_file
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+
+    def load(self) -> List[SyncReport]:
+        """Lit l'historique (liste vide si absent ou illisible)"""
+        try:
+            with open(self.history_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('format') != HISTORY_FORMAT:
+                return []
+            return [SyncReport.from_dict(raw) for raw in data.get('reports', [])]
+        except (OSError, ValueError, TypeError):
+            return []
+
+    def append(self, report: SyncReport):
+        """Ajoute un rapport et écrit l'historique (fichier temporaire puis os.replace)"""
+        with self._lock:
+            reports = (self.load() + [report])[-self.max_entries:]
+            data = {'format': HISTORY_FORMAT, 'reports': [asdict(r) for r in reports]}
+            try:
+                self.history_file.parent.mkdir(parents=True, exist_ok=True)
+                tmp_file = self.history_file.with_suffix('.tmp')
+                with open(tmp_file, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, indent=2)
+                os.replace(tmp_file, self.history_file)
+            except OSError as e:
+                print(f"[Sync] Impossible d'enregistrer le rapport: {e}")
+
+
+def summarize_by_version(reports: List[SyncReport]) -> Dict[str, dict]:
+    """
+    Médianes par version du launcher (pour comparer les versions entre elles)
+
+    Args:
+        reports: Rapports de l'historique
+
+    Returns:
+        {version: {'runs', 'wall_ms', 'listing_ms', 'hash_scan_ms', 'throughput_mbps'}}
+    """
+    by_version: Dict[str, List[SyncReport]] = {}
+    for report in reports:
+        by_version.setdefault(report.launcher_version, []).append(report)
+
+    summary = {}
+    for version, runs in by_version.items():
+        throughputs = [r.avg_throughput_mbps for r in runs if r.downloads]
+        summary[version] = {
+            'runs': len(runs),
+            'wall_ms': round(median(r.wall_ms for r in runs), 1),
+            'listing_ms': round(median(r.listing_ms for r in runs), 1),
+            'hash_scan_ms': round(median(r.hash_scan_ms for r in runs), 1),
+            'throughput_mbps': round(median(throughputs), 2) if throughputs else None,
+        }
+    return summary
+
+
+def format_report(report: SyncReport) -> List[str]:
+    """Lignes lisibles d'un rapport (log et onglet Avancé)"""
+    hit_rate = f"{report.cache_hit_rate * 100:.0f}%" if report.cache_hit_rate is not None else "-"
+    lines = [
+        f"Sync du {report.started_at.replace('T', ' ')} (v{report.launcher_version}): "
+        f"{report.wall_ms / 1000:.1f} s, {report.concurrency} téléchargement(s) simultané(s)",
+        f"Listing: {report.listing_ms:.0f} ms ({report.listing_method or 'échec'}), "
+        f"{report.remote_files} distants / {report.local_files} locaux",
+        f"Empreintes: {report.hashed_files} fichiers en {report.hash_scan_ms:.0f} ms "
+        f"({report.hash_workers or 1} thread(s)), cache {hit_rate}",
+    ]
+    if report.downloads:
+        lines.append(
+            f"Téléchargements: {report.downloads} ({report.bytes_total / 1024 / 1024:.1f} MB, "
+            f"{report.avg_bytes_per_file / 1024:.0f} KB/fichier), débit moyen {report.avg_throughput_mbps:.2f} MB/s "
+            f"(min {report.min_throughput_mbps:.2f})"
+        )
+    lines.append(f"Retries: {report.retries} (dont {report.http_429} HTTP 429), "
+                 f"pages HTML contournées: {report.html_fallbacks}, erreurs: {report.errors}")
+    return lines
+
+
+# Instance globale
+_history_instance: Optional[SyncHistory] = None
+
+
+def get_sync_history() -> SyncHistory:
+    """
+    Retourne l'historique des synchronisations (singleton)
+
+    Returns:
+        Instance de SyncHistory
+    """
+    global _history_instance
+    if _history_instance is None:
+        _history_instance = SyncHistory()
+    return _history_instance
+
+
+# Exemple d'utilisation
+if __name__ == "__main__":
+    history = get_sync_history().load()
+    if not history:
+        print("Aucune synchronisation enregistrée")
+    else:
+        print("\n".join(format_report(history[-1])))
+        print()
+        for version, stats in summarize_by_version(history).items():
+            print(f"v{version}: {stats}")